@@ -0,0 +1,238 @@
+"""
+오프라인 추출 벤치마크
+
+fixtures/ 아래에 저장된 대표 목록/상세 페이지로 extract_minwon_list,
+get_last_page_number, extract_detail_info를 네트워크 없이 반복 실행하고 페이지/초,
+함수별 CPU 시간, 최대 메모리를 측정한다. 결과는 JSON으로 저장하여 커밋 간
+성능 변화를 비교할 수 있다.
+
+상세 페이지는 파싱한 문서를 extract_detail_info에 바로 넘기므로 실제 수집과 같은
+추출 코드를 타면서도 요청은 발생하지 않는다.
+
+실행:
+    python -m hanolcare_crawler.bench --repeat 5
+    python -m hanolcare_crawler.bench --output bench_results/latest.json
+"""
+import argparse
+import datetime
+import json
+import logging
+import math
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+DETAIL_URL_PREFIX = "https://www.gov.kr/portal/service/serviceInfo/"
+DEFAULT_OUTPUT_DIR = "bench_results"
+
+
+def detail_url(service_id):
+    """픽스처 상세 페이지가 대신하는 정부24 URL"""
+    return DETAIL_URL_PREFIX + service_id
+
+
+def load_fixtures(fixtures_dir=FIXTURES_DIR):
+    """manifest.json과 각 픽스처 HTML을 읽어 반환"""
+    with open(os.path.join(fixtures_dir, "manifest.json"), encoding="utf-8") as f:
+        manifest = json.load(f)
+    for group in manifest.values():
+        for entry in group:
+            with open(os.path.join(fixtures_dir, entry["file"]), encoding="utf-8") as f:
+                entry["html"] = f.read()
+    return manifest
+
+
+def percentile(values, q):
+    """값 목록의 q 백분위수 (nearest-rank, 값이 없으면 0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class FunctionTimer:
+    """함수별 호출 수, 경과 시간, CPU 시간 누적"""
+
+    def __init__(self):
+        self.stats = {}
+        self.durations = {}
+
+    def measure(self, name, fn, *args):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            return fn(*args)
+        finally:
+            cpu = time.process_time() - cpu_start
+            wall = time.perf_counter() - wall_start
+            entry = self.stats.setdefault(name, {"calls": 0, "wall_sec": 0.0, "cpu_sec": 0.0})
+            entry["calls"] += 1
+            entry["wall_sec"] += wall
+            entry["cpu_sec"] += cpu
+            self.durations.setdefault(name, []).append(wall)
+
+    def summary(self):
+        result = {}
+        for name, entry in self.stats.items():
+            durations = self.durations.get(name, [])
+            result[name] = dict(entry)
+            result[name]["pages_per_sec"] = entry["calls"] / entry["wall_sec"] if entry["wall_sec"] else 0.0
+            result[name]["cpu_ms_per_page"] = entry["cpu_sec"] * 1000 / entry["calls"] if entry["calls"] else 0.0
+            result[name]["p50_ms"] = percentile(durations, 50) * 1000
+            result[name]["p95_ms"] = percentile(durations, 95) * 1000
+        return result
+
+
+def _run_round(manifest, timer, check=None):
+    """픽스처 전체를 한 번 처리 (check가 주어지면 기대값 불일치를 기록)"""
+    from . import crawler
+
+    for entry in manifest["list"]:
+        items = timer.measure("extract_minwon_list", crawler.extract_minwon_list, entry["html"])
+        last_page = timer.measure("get_last_page_number", crawler.get_last_page_number, entry["html"])
+        if check is not None:
+            if len(items) != entry["items"]:
+                check.append(f"{entry['file']}: 항목 수 {len(items)} (기대값 {entry['items']})")
+            if last_page != entry["last_page"]:
+                check.append(f"{entry['file']}: 마지막 페이지 {last_page} (기대값 {entry['last_page']})")
+
+    for entry in manifest["detail"]:
+        url = detail_url(entry["service_id"])
+        doc = timer.measure("parse_detail_html", crawler.parse_document, entry["html"])
+        info = timer.measure("extract_detail_info", crawler.extract_detail_info, url, doc)
+        if check is not None:
+            for field, expected in entry.get("expect", {}).items():
+                if info.get(field) != expected:
+                    check.append(f"{entry['file']}: {field}={info.get(field)!r} (기대값 {expected!r})")
+
+
+def git_revision():
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run_benchmark(repeat=3, fixtures_dir=FIXTURES_DIR):
+    """픽스처로 추출 함수 벤치마크를 실행하고 결과 딕셔너리 반환"""
+    from . import crawler
+
+    manifest = load_fixtures(fixtures_dir)
+    list_pages = len(manifest["list"])
+    detail_pages = len(manifest["detail"])
+
+    # 페이지마다 남는 INFO/WARNING 로그가 측정값을 지배하지 않도록 벤치마크 동안만 줄임
+    crawler_logger = logging.getLogger(crawler.__name__)
+    previous_level = crawler_logger.level
+    crawler_logger.setLevel(logging.ERROR)
+    fetches_before = crawler.page_fetch_flight.executed
+    try:
+        # 첫 회: 기대값 확인 + 워밍업 (측정에서 제외)
+        mismatches = []
+        _run_round(manifest, FunctionTimer(), check=mismatches)
+
+        timer = FunctionTimer()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            _run_round(manifest, timer)
+        elapsed = time.perf_counter() - start
+
+        # 메모리 추적은 실행 속도를 떨어뜨리므로 별도 1회로 측정
+        tracemalloc.start()
+        try:
+            _run_round(manifest, FunctionTimer())
+            _, peak_traced = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        crawler_logger.setLevel(previous_level)
+
+    network_fetches = crawler.page_fetch_flight.executed - fetches_before
+    pages = (list_pages + detail_pages) * repeat
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "fixtures": {"list": list_pages, "detail": detail_pages},
+        "total": {
+            "pages": pages,
+            "wall_sec": elapsed,
+            "pages_per_sec": pages / elapsed if elapsed else 0.0,
+        },
+        "functions": timer.summary(),
+        "memory": {
+            "peak_traced_bytes": peak_traced,
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if RESOURCE_AVAILABLE else None,
+        },
+        "network_fetches": network_fetches,
+        "mismatches": mismatches,
+    }
+
+
+def print_report(result):
+    """벤치마크 결과 요약 출력"""
+    total = result["total"]
+    print(f"픽스처: 목록 {result['fixtures']['list']}개, 상세 {result['fixtures']['detail']}개, 반복 {result['repeat']}회 "
+          f"(커밋 {result['revision'] or '알 수 없음'})")
+    print(f"전체: {total['pages']}페이지, {total['wall_sec']:.3f}초, {total['pages_per_sec']:.1f} 페이지/초")
+    print(f"{'함수':24s} {'호출':>6s} {'페이지/초':>10s} {'CPU ms/페이지':>14s} {'p50 ms':>8s} {'p95 ms':>8s}")
+    for name, stats in result["functions"].items():
+        print(f"{name:24s} {stats['calls']:6d} {stats['pages_per_sec']:10.1f} "
+              f"{stats['cpu_ms_per_page']:14.2f} {stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f}")
+    memory = result["memory"]
+    rss = f", 최대 RSS {memory['max_rss_kb'] / 1024:.1f}MB" if memory["max_rss_kb"] else ""
+    print(f"메모리: 추적된 최대 할당 {memory['peak_traced_bytes'] / 1024 / 1024:.2f}MB{rss}")
+    if result["network_fetches"]:
+        print(f"경고: 벤치마크 중 네트워크 요청 {result['network_fetches']}건 발생")
+    for message in result["mismatches"]:
+        print(f"기대값 불일치: {message}")
+
+
+def save_result(result, output=None):
+    """결과 JSON 저장 (output이 없으면 bench_results/bench_<커밋>_<시각>.json)"""
+    if output is None:
+        stamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        output = os.path.join(DEFAULT_OUTPUT_DIR, f"bench_{result['revision'] or 'local'}_{stamp}.json")
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    return output
+
+
+def main(argv=None):
+    """오프라인 추출 벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="저장된 정부24 페이지로 추출 함수 벤치마크 (네트워크 사용 안 함)")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="픽스처 디렉토리 (manifest.json 포함)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본값: bench_results/bench_<커밋>_<시각>.json)")
+    parser.add_argument("--no-save", action="store_true", help="결과를 파일로 저장하지 않음")
+    args = parser.parse_args(argv)
+
+    result = run_benchmark(args.repeat, args.fixtures)
+    print_report(result)
+    if not args.no_save:
+        print(f"결과 저장: {save_result(result, args.output)}")
+    return 1 if result["mismatches"] or result["network_fetches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+회로 차단기 (호스트 x 가져오기 방식)
+
+사이트가 장애 상태이면 민원마다 requests 재시도, Playwright 대체, 재처리 재시도가 모두 실패할
+때까지 요청을 보내 서버 부하를 키우고 실행이 시간 초과로 길어진다. 호스트와 가져오기 방식
+(requests, playwright)별 회로 차단기를 두어 실패가 이어지면 회로를 열고, 열린 동안에는 요청을
+보내지 않고 바로 CircuitOpenError로 실패시킨다.
+
+- 닫힘: 최근 WINDOW개 요청 중 실패 비율이 failure_rate 이상(최소 MIN_CALLS개)이거나
+  연속 CONSECUTIVE_FAILURES번 실패하면 열림으로.
+- 열림: open_seconds 동안 요청 거부. CircuitOpenError.retry_after에 남은 시간이 들어 있어
+  retry 모듈이 작업을 그 시각 뒤로 재예약하고(재시도 예산은 쓰지 않음), 재시도 횟수가 떨어지면
+  작업을 포기한다.
+- 반열림: 시험 요청 하나만 보낸다. 성공하면 닫힘, 실패하면 대기 시간을 두 배로 늘려 다시 열림.
+
+서버 상태와 관계없는 4xx 응답(404 등)은 실패로 세지 않는다.
+"""
+import collections
+import contextlib
+import logging
+import threading
+import time
+import urllib.parse
+
+from . import metrics
+from .transport import HTTPStatusError, TransportError
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# 실패 비율을 계산하는 최근 요청 수와 최소 요청 수
+WINDOW = 20
+MIN_CALLS = 10
+# 연속 실패 횟수 (요청이 적어도 빨리 열리도록)
+CONSECUTIVE_FAILURES = 5
+DEFAULT_FAILURE_RATE = 0.5
+# 열림 유지 시간 (초) - 반열림 시험이 실패할 때마다 두 배, 최대 MAX_OPEN_SECONDS
+DEFAULT_OPEN_SECONDS = 30.0
+MAX_OPEN_SECONDS = 300.0
+# 반열림 시험 요청이 진행 중일 때 다른 요청에 알려 주는 대기 시간 (초)
+PROBE_WAIT = 1.0
+
+
+class CircuitOpenError(TransportError):
+    """회로가 열려 요청을 보내지 않음 (retry_after초 뒤 다시 시도 가능)"""
+
+    request_sent = False
+
+    def __init__(self, name, retry_after):
+        super().__init__(f"회로 차단 중: {name} ({retry_after:.1f}초 후 재시도)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+def is_failure(error):
+    """서버 상태 문제로 볼 실패인지 (5xx, 429, 연결/시간 초과)"""
+    if isinstance(error, CircuitOpenError):
+        return False
+    if isinstance(error, HTTPStatusError):
+        status = error.response.status_code
+        return status >= 500 or status == 429
+    return True
+
+
+class CircuitBreaker:
+    """회로 차단기 하나 (스레드 안전)"""
+
+    def __init__(self, name, failure_rate=DEFAULT_FAILURE_RATE, open_seconds=DEFAULT_OPEN_SECONDS):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.base_open_seconds = open_seconds
+        self.open_seconds = open_seconds
+        self.state = CLOSED
+        self.opened = 0    # 열린 횟수
+        self.rejected = 0  # 거부한 요청 수
+        self._outcomes = collections.deque(maxlen=WINDOW)
+        self._consecutive = 0
+        self._open_until = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def check(self):
+        """요청을 보내도 되는지 확인 (안 되면 CircuitOpenError)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return
+            now = time.monotonic()
+            if self.state == OPEN and now >= self._open_until:
+                self._transition(HALF_OPEN)
+            if self.state == HALF_OPEN and not self._probing:
+                self._probing = True
+                logger.info(f"회로 반열림, 시험 요청: {self.name}")
+                return
+            retry_after = max(self._open_until - now, PROBE_WAIT)
+            self.rejected += 1
+        metrics.inc("hanolcare_circuit_rejected_total", circuit=self.name)
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self):
+        with self._lock:
+            self._outcomes.append(True)
+            self._consecutive = 0
+            if self.state == HALF_OPEN:
+                self._probing = False
+                self.open_seconds = self.base_open_seconds
+                self._outcomes.clear()
+                self._transition(CLOSED)
+                logger.info(f"회로 닫힘 (서버 회복): {self.name}")
+
+    def record_failure(self):
+        with self._lock:
+            self._outcomes.append(False)
+            self._consecutive += 1
+            if self.state == HALF_OPEN:
+                self._probing = False
+                self.open_seconds = min(self.open_seconds * 2, MAX_OPEN_SECONDS)
+                self._open()
+            elif self.state == CLOSED and self._should_open():
+                self._open()
+
+    def release(self):
+        """결과를 판단할 수 없이 끝난 요청 (반열림 시험 자리만 돌려줌)"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probing = False
+
+    def _should_open(self):
+        if self._consecutive >= CONSECUTIVE_FAILURES:
+            return True
+        if len(self._outcomes) < MIN_CALLS:
+            return False
+        failures = sum(1 for ok in self._outcomes if not ok)
+        return failures / len(self._outcomes) >= self.failure_rate
+
+    def _open(self):
+        self._open_until = time.monotonic() + self.open_seconds
+        self.opened += 1
+        self._transition(OPEN)
+        logger.warning(f"회로 열림: {self.name} ({self.open_seconds:.0f}초 동안 요청 차단)")
+
+    def _transition(self, state):
+        self.state = state
+        metrics.inc("hanolcare_circuit_transitions_total", circuit=self.name, state=state)
+
+    @contextlib.contextmanager
+    def call(self):
+        """with 블록을 요청 하나로 기록 (예외 종류로 성공/실패 판단)"""
+        self.check()
+        try:
+            yield
+        except TransportError as e:
+            if is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            self.release()
+            raise
+        self.record_success()
+
+
+ENABLED = True
+FAILURE_RATE = DEFAULT_FAILURE_RATE
+OPEN_SECONDS = DEFAULT_OPEN_SECONDS
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+
+
+def configure(open_seconds=DEFAULT_OPEN_SECONDS, failure_rate=DEFAULT_FAILURE_RATE):
+    """실행 시작 시 회로 차단기 설정 및 초기화 (open_seconds가 0이면 사용 안 함)"""
+    global ENABLED, FAILURE_RATE, OPEN_SECONDS
+    ENABLED = open_seconds > 0
+    FAILURE_RATE = failure_rate
+    OPEN_SECONDS = open_seconds
+    with _breakers_lock:
+        _breakers.clear()
+
+
+def for_url(url, method="requests"):
+    """URL의 호스트와 가져오기 방식에 해당하는 회로 차단기 (사용 안 하면 None)"""
+    if not ENABLED:
+        return None
+    name = f"{method}:{urllib.parse.urlsplit(url).netloc}"
+    with _breakers_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = _breakers[name] = CircuitBreaker(name, FAILURE_RATE, OPEN_SECONDS)
+        return breaker
+
+
+def guard(url, method="requests"):
+    """회로 차단기를 거쳐 요청하는 with 블록 (사용 안 하면 아무 일도 하지 않음)"""
+    breaker = for_url(url, method)
+    return breaker.call() if breaker is not None else contextlib.nullcontext()
+
+
+def breakers():
+    with _breakers_lock:
+        return list(_breakers.values())
@@ -0,0 +1,290 @@
+"""
+압축 출력 파일 (zstd / gzip)
+
+결과 CSV, 오류 CSV, 체크포인트 저널, HTML 보관 파일을 압축해 쓴다. 민원 설명처럼 긴 한국어
+텍스트가 많아 압축률이 높고, GitHub Actions 아티팩트 크기와 업로드 시간이 줄어든다.
+
+데이터는 일정 크기(또는 flush 호출)마다 완결된 프레임으로 나눠 쓴다. gzip은 여러 멤버를,
+zstd는 여러 프레임을 이어 붙인 파일을 그대로 읽을 수 있으므로 수집 도중 프로세스가 죽어도
+마지막으로 완결된 프레임까지는 `gzip -dc` / `zstd -dc` 또는 open_text()로 읽을 수 있다.
+
+zstandard 패키지가 없으면 gzip을 사용한다.
+"""
+import codecs
+import csv
+import datetime
+import gzip
+import io
+import json
+import logging
+import os
+import threading
+import zlib
+
+logger = logging.getLogger(__name__)
+
+# zstd 압축 (선택)
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+    _DECOMPRESS_ERRORS = (zlib.error, zstandard.ZstdError)
+except ImportError:
+    ZSTD_AVAILABLE = False
+    _DECOMPRESS_ERRORS = (zlib.error,)
+
+COMPRESSIONS = ("none", "auto", "gzip", "zstd")
+SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+# 압축 수준 (zstd 3은 gzip 6보다 빠르면서 압축률이 비슷하거나 높음)
+DEFAULT_LEVELS = {"gzip": 6, "zstd": 3}
+# 프레임 하나에 모으는 원본 크기 (바이트)
+DEFAULT_FRAME_SIZE = 1 << 20
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def resolve_compression(compression):
+    """압축 방식 이름 정리 (auto는 zstd, 없으면 gzip)"""
+    compression = (compression or "none").lower()
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"지원하지 않는 압축 방식: {compression} (가능: {', '.join(COMPRESSIONS)})")
+    if compression == "auto":
+        return "zstd" if ZSTD_AVAILABLE else "gzip"
+    if compression == "zstd" and not ZSTD_AVAILABLE:
+        logger.warning("zstandard 패키지가 없어 gzip으로 압축합니다. (pip install zstandard)")
+        return "gzip"
+    return compression
+
+
+def compression_of(path):
+    """파일 확장자로 압축 방식 판단 (압축 파일이 아니면 None)"""
+    for compression, suffix in SUFFIXES.items():
+        if suffix and path.endswith(suffix):
+            return compression
+    return None
+
+
+def compressed_path(path, compression):
+    """압축 방식에 맞는 확장자를 붙인 경로 (이미 붙어 있으면 그대로)"""
+    if compression_of(path):
+        return path
+    return path + SUFFIXES[resolve_compression(compression)]
+
+
+def _compress_frame(data, compression, level):
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+class FramedWriter:
+    """텍스트를 인코딩해 프레임 단위로 압축하여 덧붙이는 파일 쓰기 객체
+
+    csv.writer 등에 파일 대신 넘길 수 있다. flush()를 호출하면 모아 둔 내용을 완결된
+    프레임으로 써서 디스크에 내보낸다.
+    """
+
+    def __init__(self, path, compression="none", encoding="utf-8", frame_size=DEFAULT_FRAME_SIZE, level=None):
+        self.path = path
+        self.compression = resolve_compression(compression)
+        self.level = level or DEFAULT_LEVELS.get(self.compression)
+        self.frame_size = frame_size
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.frames = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "wb")
+        # 증분 인코더는 utf-8-sig의 BOM을 파일 맨 앞에 한 번만 씀
+        self._encoder = codecs.getincrementalencoder(encoding)()
+        self._buffer = []
+        self._buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def write(self, text):
+        data = self._encoder.encode(text)
+        if data:
+            self.bytes_in += len(data)
+            if self.compression == "none":
+                self._file.write(data)
+                self.bytes_out += len(data)
+            else:
+                self._buffer.append(data)
+                self._buffered += len(data)
+                if self._buffered >= self.frame_size:
+                    self._write_frame()
+        return len(text)
+
+    def _write_frame(self):
+        if not self._buffered:
+            return
+        frame = _compress_frame(b"".join(self._buffer), self.compression, self.level)
+        self._file.write(frame)
+        self.bytes_out += len(frame)
+        self.frames += 1
+        self._buffer = []
+        self._buffered = 0
+
+    def flush(self):
+        """모아 둔 내용을 완결된 프레임으로 써서 디스크에 내보냄"""
+        self._write_frame()
+        self._file.flush()
+
+    def close(self):
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def ratio(self):
+        """압축 후 크기 / 원본 크기"""
+        return self.bytes_out / self.bytes_in if self.bytes_in else 1.0
+
+
+def _iter_frames(path, chunk_size=1 << 16):
+    """압축 파일을 프레임 단위로 풀어 내용을 차례로 반환 (잘린 마지막 프레임은 버림)"""
+    with open(path, "rb") as f:
+        is_zstd = f.read(4).startswith(_ZSTD_MAGIC)
+        if is_zstd and not ZSTD_AVAILABLE:
+            raise RuntimeError(f"zstd 파일을 읽으려면 zstandard 패키지가 필요합니다: {path}")
+        f.seek(0)
+        decompressor = None
+        output = []
+        pending = b""
+        while True:
+            if not pending:
+                pending = f.read(chunk_size)
+                if not pending:
+                    break
+            if decompressor is None:
+                decompressor = zstandard.ZstdDecompressor().decompressobj() if is_zstd else zlib.decompressobj(wbits=31)
+            try:
+                output.append(decompressor.decompress(pending))
+            except _DECOMPRESS_ERRORS as e:
+                logger.warning(f"손상된 압축 프레임 이후를 읽지 않습니다: {path} ({e})")
+                return
+            if decompressor.eof:
+                # 프레임이 완결된 뒤에만 내용을 내보냄
+                yield b"".join(output)
+                output = []
+                pending = decompressor.unused_data
+                decompressor = None
+            else:
+                pending = b""
+        if decompressor is not None:
+            logger.warning(f"마지막 압축 프레임이 완결되지 않아 읽지 않습니다 (수집 중단 등): {path}")
+
+
+class _FrameStream(io.RawIOBase):
+    """_iter_frames 결과를 읽기 스트림으로 (TextIOWrapper용)"""
+
+    def __init__(self, frames):
+        self._frames = frames
+        self._pending = memoryview(b"")
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            frame = next(self._frames, None)
+            if frame is None:
+                return 0
+            self._pending = memoryview(frame)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def open_text(path, encoding="utf-8-sig", newline=""):
+    """압축 여부(파일 앞부분 매직 넘버)를 판단해 텍스트 읽기용으로 열기"""
+    with open(path, "rb") as f:
+        magic = f.read(4)
+    if magic.startswith(_GZIP_MAGIC) or magic.startswith(_ZSTD_MAGIC):
+        stream = io.BufferedReader(_FrameStream(_iter_frames(path)))
+        return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+    return open(path, encoding=encoding, newline=newline)
+
+
+class CsvJournal:
+    """배치 결과를 덧붙여 쓰는 CSV 체크포인트 저널
+
+    전체 목록을 매번 다시 쓰는 대신 배치마다 새 행만 덧붙이고 프레임 하나로 내보낸다.
+    """
+
+    def __init__(self, path, fieldnames, compression="none", encoding="utf-8-sig"):
+        self.path = compressed_path(path, compression)
+        self.fieldnames = list(fieldnames)
+        self.rows = 0
+        self._lock = threading.Lock()
+        self._writer = FramedWriter(self.path, compression, encoding)
+        self._csv = csv.writer(self._writer)
+        self._csv.writerow(self.fieldnames)
+        self._writer.flush()
+
+    def append(self, records):
+        """레코드 목록을 덧붙이고 디스크에 내보냄"""
+        with self._lock:
+            for record in records:
+                self._csv.writerow([record.get(name, "") for name in self.fieldnames])
+                self.rows += 1
+            self._writer.flush()
+
+    def close(self):
+        with self._lock:
+            self._writer.close()
+
+
+class HtmlArchive:
+    """가져온 페이지 HTML을 JSON Lines로 압축 보관 (url, method, fetched, html)
+
+    여러 워커 스레드가 함께 쓰며, frame_pages개마다 프레임 하나로 내보낸다.
+    """
+
+    def __init__(self, path, compression="auto", frame_pages=50):
+        self.path = compressed_path(path, compression)
+        self.frame_pages = max(1, frame_pages)
+        self.pages = 0
+        self._lock = threading.Lock()
+        self._writer = FramedWriter(self.path, compression, "utf-8")
+
+    def add(self, url, html, method=None):
+        line = json.dumps({
+            "url": url,
+            "method": method,
+            "fetched": datetime.datetime.now().isoformat(timespec="seconds"),
+            "html": html,
+        }, ensure_ascii=False)
+        with self._lock:
+            if self._writer.closed:
+                return
+            self._writer.write(line + "\n")
+            self.pages += 1
+            if self.pages % self.frame_pages == 0:
+                self._writer.flush()
+
+    def close(self):
+        with self._lock:
+            self._writer.close()
+        logger.info(
+            f"HTML 보관: {self.pages}개 페이지, {self._writer.bytes_in / 1048576:.1f}MB -> "
+            f"{self._writer.bytes_out / 1048576:.1f}MB: {self.path}"
+        )
+
+
+def iter_archive(path):
+    """HTML 보관 파일의 페이지를 차례로 반환"""
+    with open_text(path, encoding="utf-8", newline=None) as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
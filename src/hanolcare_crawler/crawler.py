@@ -1,6 +1,5 @@
 import csv
 from bs4 import BeautifulSoup
-import requests
 import os
 import re
 import time
@@ -14,15 +13,32 @@ import sys  # sys 모듈 추가
 import traceback
 from html import unescape
 
+from . import breaker, hedge, metrics, retry, tracing, transport
+from .document import PageDocument, SiblingGroup
+from .patterns import (
+    APPLY_SET_PAGE_RE, PAGE_INDEX_RE, PHONE_RE, SERVICE_ID_FORMAT_RE, SERVICE_ID_PARTS_RE,
+    WHITESPACE_RE, WORD_RE, duration_scanner, onclick_scanner, service_id_scanner,
+)
+from .record import RECORD_FIELDS, MinwonRecord, to_record
+from .singleflight import SingleFlight
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 수집 대상 사이트 주소 (로컬 모의 서버 등으로 바꿀 수 있음)
+BASE_URL = "https://www.gov.kr"
+# 민원 목록 첫 페이지 경로
+LIST_PATH = "/search/applyMw?Mcode=11166"
+
 # 텍스트 분석 및 NLP 관련 변수 초기화
 NLTK_AVAILABLE = False
 OKT_AVAILABLE = False
 okt = None
 NLP_ENABLED = False
+# 한국어 분석 백엔드: auto(Okt 우선, 없으면 내장 분석기), okt, builtin
+NLP_BACKEND = "auto"
+NLP_BACKENDS = ("auto", "okt", "builtin")
 
 
 # 텍스트 분석을 위한 패키지 추가
@@ -59,6 +75,61 @@ def set_nlp_enabled(enabled=False):
     logger.info(f"텍스트 분석 기능: {'활성화' if NLP_ENABLED else '비활성화'}")
     return NLP_ENABLED
 
+def set_nlp_backend(backend="auto"):
+    """한국어 분석 백엔드 설정 (auto, okt, builtin)"""
+    global NLP_BACKEND
+    if backend not in NLP_BACKENDS:
+        raise ValueError(f"지원하지 않는 분석 백엔드: {backend}")
+    NLP_BACKEND = backend
+    logger.info(f"한국어 분석 백엔드: {NLP_BACKEND}")
+    return NLP_BACKEND
+
+# 결과/체크포인트 CSV 압축 방식 (none, gzip, zstd)
+OUTPUT_COMPRESSION = "none"
+# 가져온 페이지 HTML 보관 (compress.HtmlArchive, None이면 보관하지 않음)
+html_archive = None
+
+def set_output_compression(compression="none"):
+    """결과 파일 압축 방식 설정 (auto=zstd, 없으면 gzip)"""
+    global OUTPUT_COMPRESSION
+    from .compress import resolve_compression
+    OUTPUT_COMPRESSION = resolve_compression(compression)
+    if OUTPUT_COMPRESSION != "none":
+        logger.info(f"결과 파일 압축: {OUTPUT_COMPRESSION}")
+    return OUTPUT_COMPRESSION
+
+def set_html_archive(archive):
+    """페이지 HTML 보관 객체 설정 (None이면 보관 중지)"""
+    global html_archive
+    html_archive = archive
+
+def archive_page(url, html, method):
+    """가져온 페이지 HTML 보관 (보관 중이 아니면 아무 일도 하지 않음)"""
+    archive = html_archive
+    if archive is not None:
+        try:
+            archive.add(url, html, method)
+        except Exception as e:
+            logger.warning(f"HTML 보관 실패: {url}, 오류: {str(e)}")
+
+def set_base_url(base_url):
+    """수집 대상 사이트 주소 설정 (예: 로컬 모의 서버 http://127.0.0.1:8024)"""
+    global BASE_URL
+    base_url = (base_url or "").strip().rstrip('/')
+    if not base_url.startswith(('http://', 'https://')):
+        raise ValueError(f"올바르지 않은 사이트 주소: {base_url}")
+    BASE_URL = base_url
+    logger.info(f"수집 대상 사이트: {BASE_URL}")
+    return BASE_URL
+
+def korean_backend():
+    """현재 사용할 한국어 분석 백엔드 이름 반환 (사용 불가 시 None)"""
+    if NLP_BACKEND in ("auto", "okt") and init_okt():
+        return "okt"
+    if NLP_BACKEND in ("auto", "builtin"):
+        return "builtin"
+    return None
+
 # Java 환경 변수 설정 함수 추가
 def setup_java_env():
     """Java 환경 변수를 설정하고 JVM을 초기화하는 함수"""
@@ -120,63 +191,82 @@ def setup_java_env():
     
     return False
 
-if importlib.util.find_spec("konlpy") is not None:
-    try:
-        # JVM 환경 설정
-        java_available = setup_java_env()
+# KoNLPy(Okt)는 JVM을 띄우므로 실제로 필요할 때 한 번만 초기화한다.
+_okt_init_done = False
+_okt_init_lock = threading.Lock()
+
+def init_okt():
+    """KoNLPy Okt 분석기를 지연 초기화하고 사용 가능 여부를 반환"""
+    global _okt_init_done
+    if _okt_init_done:
+        return OKT_AVAILABLE
+    with _okt_init_lock:
+        if _okt_init_done:
+            return OKT_AVAILABLE
+        _okt_init_done = True
+        _load_okt()
+    return OKT_AVAILABLE
+
+def _load_okt():
+    """JVM 환경을 설정하고 Okt 인스턴스를 생성"""
+    global okt, OKT_AVAILABLE
+    if importlib.util.find_spec("konlpy") is not None:
+        try:
+            # JVM 환경 설정
+            java_available = setup_java_env()
         
-        if java_available:
-            # JPype1 직접 초기화 시도
-            try:
-                import jpype1
+            if java_available:
+                # JPype1 직접 초기화 시도
+                try:
+                    import jpype1
                 
-                # JVM이 이미 시작되었는지 확인
-                if not jpype1.isJVMStarted():
-                    try:
-                        jvm_path = jpype1.getDefaultJVMPath()
-                        logger.info(f"기본 JVM 경로: {jvm_path}")
-                        jpype1.startJVM(jvm_path, "-Dfile.encoding=UTF-8", convertStrings=True)
-                        logger.info("JPype JVM 초기화 성공")
-                    except Exception as jvm_e:
-                        logger.error(f"JVM 시작 오류: {str(jvm_e)}")
-                        
-                        # 마지막 수단: 직접 경로 지정 시도
+                    # JVM이 이미 시작되었는지 확인
+                    if not jpype1.isJVMStarted():
                         try:
-                            if os.environ.get('JAVA_HOME'):
-                                alt_jvm_path = os.path.join(os.environ['JAVA_HOME'], 'lib', 'server', 'libjvm.so')
-                                if os.path.exists(alt_jvm_path):
-                                    jpype1.startJVM(alt_jvm_path, "-Dfile.encoding=UTF-8", convertStrings=True)
-                                    logger.info(f"대체 경로로 JVM 초기화 성공: {alt_jvm_path}")
-                        except Exception as alt_jvm_e:
-                            logger.error(f"대체 경로 JVM 시작 오류: {str(alt_jvm_e)}")
-                    else:
-                        logger.info("JVM이 이미 실행 중입니다.")
-            except ImportError:
-                logger.warning("JPype1 패키지가 설치되지 않았습니다. KoNLPy 기능이 제한됩니다.")
-                logger.warning("설치 방법: pip install jpype1")
-                raise
-            except Exception as jpy_e:
-                logger.warning(f"JPype 초기화 오류: {str(jpy_e)}")
-            
-            # KoNLPy 로드 시도
-            try:
-                konlpy_import = importlib.import_module("konlpy.tag")
-                Okt = getattr(konlpy_import, "Okt")
-                okt = Okt()
-                OKT_AVAILABLE = True
-                logger.info("KoNLPy Okt 한국어 분석기가 로드되었습니다.")
-            except Exception as konlpy_e:
-                logger.warning(f"KoNLPy 초기화 오류: {str(konlpy_e)}")
-                logger.warning("KoNLPy는 설치되었지만 초기화에 실패했습니다.")
-        else:
-            logger.warning("Java(JDK)를 찾을 수 없습니다. KoNLPy 기능이 비활성화됩니다.")
-    except Exception as e:
-        logger.warning(f"KoNLPy 로드 중 오류 발생: {str(e)}. 한국어 분석 기능이 제한됩니다.")
-        logger.info("해결 방법: Java(JDK 8 이상)를 설치하고 JAVA_HOME 환경변수를 설정하세요.")
-        logger.info("예시: export JAVA_HOME=/usr/lib/jvm/java-11-openjdk-amd64")
-        logger.info("자세한 내용은 'run.sh' 스크립트나 'java_setup.sh' 파일을 참조하세요.")
-else:
-    logger.warning("KoNLPy가 설치되지 않았습니다. 한국어 분석 기능이 제한됩니다. (pip install konlpy)")
+                            jvm_path = jpype1.getDefaultJVMPath()
+                            logger.info(f"기본 JVM 경로: {jvm_path}")
+                            jpype1.startJVM(jvm_path, "-Dfile.encoding=UTF-8", convertStrings=True)
+                            logger.info("JPype JVM 초기화 성공")
+                        except Exception as jvm_e:
+                            logger.error(f"JVM 시작 오류: {str(jvm_e)}")
+                        
+                            # 마지막 수단: 직접 경로 지정 시도
+                            try:
+                                if os.environ.get('JAVA_HOME'):
+                                    alt_jvm_path = os.path.join(os.environ['JAVA_HOME'], 'lib', 'server', 'libjvm.so')
+                                    if os.path.exists(alt_jvm_path):
+                                        jpype1.startJVM(alt_jvm_path, "-Dfile.encoding=UTF-8", convertStrings=True)
+                                        logger.info(f"대체 경로로 JVM 초기화 성공: {alt_jvm_path}")
+                            except Exception as alt_jvm_e:
+                                logger.error(f"대체 경로 JVM 시작 오류: {str(alt_jvm_e)}")
+                        else:
+                            logger.info("JVM이 이미 실행 중입니다.")
+                except ImportError:
+                    logger.warning("JPype1 패키지가 설치되지 않았습니다. KoNLPy 기능이 제한됩니다.")
+                    logger.warning("설치 방법: pip install jpype1")
+                    raise
+                except Exception as jpy_e:
+                    logger.warning(f"JPype 초기화 오류: {str(jpy_e)}")
+            
+                # KoNLPy 로드 시도
+                try:
+                    konlpy_import = importlib.import_module("konlpy.tag")
+                    Okt = getattr(konlpy_import, "Okt")
+                    okt = Okt()
+                    OKT_AVAILABLE = True
+                    logger.info("KoNLPy Okt 한국어 분석기가 로드되었습니다.")
+                except Exception as konlpy_e:
+                    logger.warning(f"KoNLPy 초기화 오류: {str(konlpy_e)}")
+                    logger.warning("KoNLPy는 설치되었지만 초기화에 실패했습니다.")
+            else:
+                logger.warning("Java(JDK)를 찾을 수 없습니다. KoNLPy 기능이 비활성화됩니다.")
+        except Exception as e:
+            logger.warning(f"KoNLPy 로드 중 오류 발생: {str(e)}. 한국어 분석 기능이 제한됩니다.")
+            logger.info("해결 방법: Java(JDK 8 이상)를 설치하고 JAVA_HOME 환경변수를 설정하세요.")
+            logger.info("예시: export JAVA_HOME=/usr/lib/jvm/java-11-openjdk-amd64")
+            logger.info("자세한 내용은 'run.sh' 스크립트나 'java_setup.sh' 파일을 참조하세요.")
+    else:
+        logger.warning("KoNLPy가 설치되지 않았습니다. 한국어 분석 기능이 제한됩니다. (pip install konlpy)")
 
 try:
     from tqdm import tqdm
@@ -187,9 +277,6 @@ except ImportError:
 
 # 로깅 설정은 파일 상단에서 한 번만 수행한다.
 
-# 스레드별 세션 관리
-thread_local = threading.local()
-
 
 subheading_to_field = {
     "지원형태": "기타정보",
@@ -242,7 +329,7 @@ subheading_to_field = {
 
 # 실패한 URL 저장 (재시도용)
 failed_urls = set()
-# 성공적으로 처리된 URL 캐시
+# 성공적으로 처리된 URL 캐시 (URL -> HTML, 사용할 때마다 새로 파싱)
 successful_urls_cache = {}
 
 def check_playwright_installed():
@@ -269,79 +356,173 @@ def clean_text(text):
     if not text:
         return ""
     text = unescape(text.strip())
-    text = re.sub(r'\s+', ' ', text)  # 연속된 공백 제거
+    text = WHITESPACE_RE.sub(' ', text)  # 연속된 공백 제거
     return text
 
-def get_session():
-    """각 스레드마다 개별 세션을 생성하여 반환"""
-    if not hasattr(thread_local, "session"):
-        thread_local.session = requests.Session()
-        thread_local.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
-        })
-    return thread_local.session
+def parse_document(html):
+    """HTML을 파싱하여 PageDocument로 반환 (파싱 시간을 지표로 기록)"""
+    with metrics.timer("parse"):
+        return PageDocument(BeautifulSoup(html, 'html.parser'), html)
 
 # URL 처리 방식 캐싱 (속도 최적화)
 url_processing_cache = {}
 
+# 공유 캐시 보호용 락 (여러 워커 스레드가 동시에 접근)
+cache_lock = threading.RLock()
+# 같은 URL에 대한 동시 요청 병합
+page_fetch_flight = SingleFlight()
+
+def cache_page(url, doc):
+    """성공한 페이지 결과를 캐시에 저장
+
+    추출 과정에서 트리가 바뀔 수 있으므로 파싱된 문서가 아니라 원본 HTML을 저장한다.
+    """
+    with cache_lock:
+        successful_urls_cache[canonical_url(url)] = doc.html
+
+def get_cached_page(url):
+    """캐시된 페이지를 새로 파싱한 PageDocument로 반환 (없으면 None)"""
+    with cache_lock:
+        html = successful_urls_cache.get(canonical_url(url))
+    return parse_document(html) if html is not None else None
+
+def set_url_method(url, method):
+    """URL 처리 방식(requests/playwright) 기록 (method=None이면 삭제)"""
+    with cache_lock:
+        if method is None:
+            url_processing_cache.pop(canonical_url(url), None)
+        else:
+            url_processing_cache[canonical_url(url)] = method
+
+def get_url_method(url):
+    """기록된 URL 처리 방식 반환 (없으면 None)"""
+    with cache_lock:
+        return url_processing_cache.get(canonical_url(url))
+
+def record_failed_url(url):
+    """재시도에 실패한 URL 기록"""
+    with cache_lock:
+        failed_urls.add(canonical_url(url))
+
+def invalidate_url_cache(url):
+    """URL의 처리 방식과 결과 캐시를 모두 무효화"""
+    with cache_lock:
+        key = canonical_url(url)
+        url_processing_cache.pop(key, None)
+        successful_urls_cache.pop(key, None)
+
+def http_get(url, timeout=15, lane="detail_fetch"):
+    """호스트별 회로 차단기를 거쳐 HTTP 요청 (4xx/5xx는 HTTPStatusError, 회로가 열려 있으면 CircuitOpenError)
+
+    헤징을 켜면 경로(lane)의 p95보다 오래 걸리는 요청을 한 번 더 보내 먼저 온 응답을 쓴다.
+    회로 차단기는 헤징으로 보낸 요청까지 요청마다 결과를 기록한다 (진 요청의 실패도 서버 상태이므로).
+    """
+    def fetch():
+        with breaker.guard(url, "requests"):
+            response = transport.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response
+    
+    return hedge.call(lane, fetch)
+
 def get_page_content(url, max_retries=3):
     """URL의 페이지 콘텐츠를 BeautifulSoup 객체로 반환 (개선된 재시도 로직)"""
-    global url_processing_cache, failed_urls, successful_urls_cache
-    
+    doc = get_page_document(url, max_retries)
+    return doc.soup if doc is not None else None
+
+def get_page_document(url, max_retries=3):
+    """URL의 페이지를 텍스트 뷰가 메모이즈된 PageDocument로 반환
+
+    같은 URL에 대한 동시 요청은 하나의 요청으로 병합된다. 호출한 쪽마다 원본 HTML을
+    따로 파싱한 문서를 받으므로, 한 쪽이 트리를 수정해도 다른 쪽과 캐시에는 영향이 없다.
+    """
     # 이미 성공적으로 처리된 URL이라면 캐시에서 반환
-    if url in successful_urls_cache:
+    cached = get_cached_page(url)
+    if cached is not None:
         logger.info(f"캐시된 결과 사용: {url}")
-        return successful_urls_cache[url]
+        metrics.inc("hanolcare_cache_requests_total", cache="page", result="hit")
+        return cached
+    
+    while True:
+        with tracing.span("get_page_document", url=url):
+            doc, shared = page_fetch_flight.do(canonical_url(url), lambda: _fetch_or_defer(url, max_retries))
+        if not isinstance(doc, retry.RetryLater):
+            break
+        if not shared:
+            raise doc
+        # 진행 중인 요청이 재시도를 예약함 - 그만큼 뒤에 다시 요청 (그 사이 성공했으면 캐시,
+        # 진행 중이면 다시 합류). 배치 작업이면 워커를 붙잡지 않고 이 작업도 재예약한다.
+        # 합류한 쪽은 상세 요청을 시도한 것이 아니므로 detail_fetch 시도 번호를 이어받지 않음
+        logger.info(f"진행 중인 동일 요청이 재시도 대기 중, {doc.delay:.1f}초 후 다시 요청: {url}")
+        if retry.deferrable():
+            retry.defer("shared_fetch", doc.name[1], doc.attempt, doc.delay)
+        time.sleep(doc.delay)
+    if shared:
+        logger.info(f"진행 중인 동일 요청의 결과 사용: {url}")
+        metrics.inc("hanolcare_cache_requests_total", cache="page", result="shared")
+        return parse_document(doc.html) if doc is not None else None
+    metrics.inc("hanolcare_cache_requests_total", cache="page", result="miss")
+    return doc
+
+def _fetch_or_defer(url, max_retries=3):
+    """_fetch_page_document 실행 - 재예약(RetryLater)은 합류한 요청에 예외로 퍼지지 않도록 결과로 반환"""
+    try:
+        return _fetch_page_document(url, max_retries)
+    except retry.RetryLater as e:
+        return e
+
+def _fetch_page_document(url, max_retries=3):
+    """네트워크/Playwright로 페이지를 가져오는 함수 (get_page_document 내부용)"""
+    # 병합 대기 중 다른 요청이 결과를 캐시했을 수 있으므로 다시 확인
+    cached = get_cached_page(url)
+    if cached is not None:
+        return cached
     
     # 캐싱된 URL 처리 방식 확인 (속도 최적화)
-    if url in url_processing_cache:
-        method = url_processing_cache[url]
+    method = get_url_method(url)
+    metrics.inc("hanolcare_cache_requests_total", cache="method", result="hit" if method else "miss")
+    if method:
         if method == "requests":
             try:
-                session = get_session()
-                response = session.get(url, timeout=15)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
+                with metrics.timer("detail_fetch", method="requests"):
+                    response = http_get(url)
+                doc = parse_document(response.text)
                 
                 # 유효한 페이지인지 확인 (최소한의 내용 검증)
-                if "민원" in soup.text or "서비스" in soup.text:
+                if doc.has_any("민원", "서비스"):
                     logger.info(f"캐시된 방식(requests)으로 URL 처리: {url}")
-                    successful_urls_cache[url] = soup  # 성공 결과 캐싱
-                    return soup
+                    metrics.inc("hanolcare_fetch_total", method="requests", outcome="ok")
+                    cache_page(url, doc)  # 성공 결과 캐싱
+                    archive_page(url, response.text, "requests")
+                    return doc
                 
                 logger.warning(f"캐시된 방식(requests)의 응답이 유효하지 않음: {url}")
-                url_processing_cache.pop(url, None)  # 캐시 무효화
+                metrics.inc("hanolcare_fetch_total", method="requests", outcome="invalid")
+                set_url_method(url, None)  # 캐시 무효화
             except:
                 logger.warning(f"캐시된 방식(requests)이 실패, 재확인: {url}")
-                url_processing_cache.pop(url, None)
+                metrics.inc("hanolcare_fetch_total", method="requests", outcome="error")
+                set_url_method(url, None)
         elif method == "playwright":
             try:
-                soup = get_content_with_playwright(url)
-                if soup and ("민원" in soup.text or "서비스" in soup.text):
+                doc = _playwright_document(url)
+                if doc and doc.has_any("민원", "서비스"):
                     logger.info(f"캐시된 방식(playwright)으로 URL 처리: {url}")
-                    successful_urls_cache[url] = soup  # 성공 결과 캐싱
-                    return soup
+                    cache_page(url, doc)  # 성공 결과 캐싱
+                    return doc
                 logger.warning(f"캐시된 방식(playwright)의 응답이 유효하지 않음: {url}")
-                url_processing_cache.pop(url, None)  # 캐시 무효화
+                set_url_method(url, None)  # 캐시 무효화
             except:
                 logger.warning(f"캐시된 방식(playwright)이 실패, 재확인: {url}")
-                url_processing_cache.pop(url, None)
+                set_url_method(url, None)
     
-    # 재시도 로직 강화
-    for attempt in range(max_retries):
-        # 요청 간 지수 백오프 (서버 부하 방지)
-        if attempt > 0:
-            sleep_time = min(2 ** attempt, 10)  # 최대 10초까지 대기
-            logger.info(f"재시도 {attempt+1}/{max_retries}, {sleep_time}초 대기 후 다시 시도: {url}")
-            time.sleep(sleep_time)
-        
+    # 재시도 (지터 백오프, Retry-After, 재시도 예산 - 배치 작업이면 대기 동안 워커를 놓아줌)
+    attempts = retry.Attempts("detail_fetch", canonical_url(url), max_retries)
+    for attempt in attempts:
         try:
             start_time = time.time()
-            session = get_session()
-            response = session.get(url, timeout=15)
-            response.raise_for_status()
+            with metrics.timer("detail_fetch", method="requests"):
+                response = http_get(url)
             
             # JS 페이지 감지 개선
             js_indicators = [
@@ -352,10 +533,10 @@ def get_page_content(url, max_retries=3):
                 "javascript:"
             ]
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            doc = parse_document(response.text)
             
             # 유효한 콘텐츠 확인 (최소 내용 검증)
-            content_valid = "민원" in soup.text or "서비스" in soup.text
+            content_valid = doc.has_any("민원", "서비스")
             
             needs_js = False
             for indicator in js_indicators:
@@ -365,30 +546,60 @@ def get_page_content(url, max_retries=3):
                     
             if needs_js or not content_valid:
                 logger.info(f"JS 기반 페이지 또는 유효하지 않은 내용 감지, Playwright 사용: {url}")
-                url_processing_cache[url] = "playwright"
-                soup = get_content_with_playwright(url)
-                if soup:
-                    successful_urls_cache[url] = soup  # 성공 결과 캐싱
-                    return soup
+                metrics.inc("hanolcare_fetch_total", method="requests", outcome="invalid")
+                set_url_method(url, "playwright")
+                doc = _playwright_document(url)
+                if doc:
+                    return doc
             else:
                 processing_time = time.time() - start_time
                 logger.info(f"일반 요청으로 처리 완료: {url} (처리시간: {processing_time:.2f}초)")
-                url_processing_cache[url] = "requests"
-                successful_urls_cache[url] = soup  # 성공 결과 캐싱
-                return soup
+                metrics.inc("hanolcare_fetch_total", method="requests", outcome="ok")
+                set_url_method(url, "requests")
+                cache_page(url, doc)  # 성공 결과 캐싱
+                archive_page(url, response.text, "requests")
+                return doc
         except Exception as e:
+            attempts.fail(e)
             logger.warning(f"시도 {attempt+1}/{max_retries} 실패: {url}, 오류: {str(e)}")
-            if attempt == max_retries - 1:
-                failed_urls.add(url)  # 재시도 실패한 URL 기록
-                logger.error(f"최대 재시도 횟수 초과, Playwright로 최종 시도: {url}")
-                return get_content_with_playwright(url)
-    
-    # 모든 재시도 실패
-    failed_urls.add(url)
+            metrics.inc("hanolcare_fetch_total", method="requests", outcome="error")
+    
+    # 모든 재시도 실패 (재시도 횟수 또는 예산 소진)
+    record_failed_url(url)  # 재시도 실패한 URL 기록
+    # 회로가 열려 있으면 같은 호스트에 브라우저로 다시 요청하지 않음
+    if attempts.error is not None and not isinstance(attempts.error, breaker.CircuitOpenError):
+        logger.error(f"재시도 종료, Playwright로 최종 시도: {url}")
+        return _playwright_document(url)
     return None
 
 def get_content_with_playwright(url, timeout=30000):
     """Playwright를 사용하여 페이지 콘텐츠를 BeautifulSoup 객체로 반환 (개선됨)"""
+    doc = _playwright_document(url, timeout)
+    return doc.soup if doc is not None else None
+
+def _playwright_document(url, timeout=30000):
+    """Playwright로 렌더링한 페이지를 PageDocument로 반환 (성공 시 캐시에 저장)"""
+    # 브라우저 렌더링이 계속 실패하면 회로를 열어 민원마다 브라우저를 띄우지 않음
+    circuit = breaker.for_url(url, "playwright")
+    if circuit is not None:
+        try:
+            circuit.check()
+        except breaker.CircuitOpenError as e:
+            logger.warning(f"{e}, Playwright 건너뜀: {url}")
+            metrics.inc("hanolcare_fetch_total", method="playwright", outcome="shed")
+            return None
+    with metrics.timer("detail_fetch", method="playwright"):
+        doc = _render_with_playwright(url, timeout)
+    metrics.inc("hanolcare_fetch_total", method="playwright", outcome="ok" if doc is not None else "error")
+    if circuit is not None:
+        if doc is not None:
+            circuit.record_success()
+        else:
+            circuit.record_failure()
+    return doc
+
+def _render_with_playwright(url, timeout=30000):
+    """브라우저로 페이지를 렌더링하는 함수 (_playwright_document 내부용)"""
     try:
         # Playwright 임포트 실패 시 대체 처리
         try:
@@ -423,10 +634,11 @@ def get_content_with_playwright(url, timeout=30000):
                 html = page.content()
                 browser.close()
                 
-                soup = BeautifulSoup(html, 'html.parser')
-                if soup and len(soup.text) > 100:  # 최소한의 콘텐츠 확인
-                    successful_urls_cache[url] = soup  # 성공 결과 캐싱
-                    return soup
+                doc = parse_document(html)
+                if len(doc.text) > 100:  # 최소한의 콘텐츠 확인
+                    cache_page(url, doc)  # 성공 결과 캐싱
+                    archive_page(url, html, "playwright")
+                    return doc
                 else:
                     logger.error(f"Playwright로 가져온 HTML이 너무 짧거나 비어 있습니다: {url}")
                     return None
@@ -492,7 +704,7 @@ def extract_minwon_list(html_content):
                 title = clean_text(title_element.text)
                 link = title_element.get('href', '')
                 if link and not link.startswith('http'):
-                    link = urllib.parse.urljoin("https://www.gov.kr", link)
+                    link = urllib.parse.urljoin(BASE_URL, link)
             else:
                 # 제목이 없으면 다른 방식으로 시도
                 title_tags = item.find_all(['strong', 'h3', 'h4', 'p'])
@@ -502,7 +714,7 @@ def extract_minwon_list(html_content):
                         link_tag = tag.find('a') or item.find('a')
                         link = link_tag.get('href', '') if link_tag else ""
                         if link and not link.startswith('http'):
-                            link = urllib.parse.urljoin("https://www.gov.kr", link)
+                            link = urllib.parse.urljoin(BASE_URL, link)
                         break
                 else:
                     title = "제목 없음"
@@ -562,18 +774,10 @@ def extract_minwon_list(html_content):
             
             capp_biz_cd, high_ctg_cd, tp_seq = "", "", ""
             if button_onclick:
-                # 여러 패턴에 대응
-                patterns = [
-                    r"goUrlNewChk\('([^']+)',\s*'([^']+)',\s*'([^']+)'",
-                    r"goServiceDetail\('([^']+)',\s*'([^']+)',\s*'([^']+)'",
-                    r"fn_goServiceDetail\('([^']+)',\s*'([^']+)',\s*'([^']+)'",
-                ]
-                
-                for pattern in patterns:
-                    match = re.search(pattern, button_onclick)
-                    if match:
-                        capp_biz_cd, high_ctg_cd, tp_seq = match.groups()
-                        break
+                # 여러 패턴에 대응 (goUrlNewChk, goServiceDetail, fn_goServiceDetail 순으로 우선)
+                match = onclick_scanner.search(button_onclick)
+                if match:
+                    capp_biz_cd, high_ctg_cd, tp_seq = match.groups()
             
             # 카테고리 정보 추출 개선 (HTML 파일 분석 기반)
             category_selectors = [
@@ -623,17 +827,13 @@ def extract_minwon_list(html_content):
             # 디테일 페이지 URL에서 민원 ID 추출 (개선됨)
             minwon_id = ""
             if link:
-                id_match = re.search(r'serviceInfo/([A-Za-z0-9_]+)', link)
+                # serviceInfo/ID 형태 우선, 없으면 id= 파라미터
+                id_match = service_id_scanner.search(link)
                 if id_match:
                     minwon_id = id_match.group(1)
-                else:
-                    # 다른 형태의 ID 패턴 시도
-                    alternate_match = re.search(r'[?&]id=([A-Za-z0-9_]+)', link)
-                    if alternate_match:
-                        minwon_id = alternate_match.group(1)
             
             # 기본 정보 및 확장 정보 병합
-            minwon_data = {
+            minwon_data = MinwonRecord({
                 "민원명": title, 
                 "설명": description, 
                 "담당부서": department,
@@ -646,7 +846,7 @@ def extract_minwon_list(html_content):
                 "일련번호": tp_seq, 
                 "민원분류": badge,  # 민원/정부서비스 등 유형 정보
                 "오류여부": "정상"
-            }
+            })
             
             # 메타데이터 병합
             minwon_data.update(meta_info)
@@ -666,7 +866,7 @@ def get_last_page_number(html_content):
         if pagination:
             last_page_link = pagination.select_one('li.page_last a')
             if last_page_link and 'onclick' in last_page_link.attrs:
-                match = re.search(r"applySetPage\('(\d+\.?\d*)'\)", last_page_link['onclick'])
+                match = APPLY_SET_PAGE_RE.search(last_page_link['onclick'])
                 if match:
                     return int(float(match.group(1)))
         return 1
@@ -678,33 +878,42 @@ def get_page_url(base_url, page_number):
     """페이지 번호에 해당하는 URL을 생성하는 함수"""
     if '?' in base_url:
         if 'pageIndex=' in base_url:
-            return re.sub(r'pageIndex=\d+', f'pageIndex={page_number}', base_url)
+            return PAGE_INDEX_RE.sub(f'pageIndex={page_number}', base_url)
         return f"{base_url}&pageIndex={page_number}"
     return f"{base_url}?pageIndex={page_number}"
 
-def save_to_csv(minwon_list, filename="정부24_민원목록.csv", output_dir=None):
-    """민원 목록을 CSV 파일로 저장하는 함수 (개선된 필드 포함)"""
+def canonical_url(url, base_url=None):
+    """같은 페이지를 가리키는 URL을 하나의 표기로 정규화하는 함수"""
+    if not url:
+        return ""
+    parts = urllib.parse.urlsplit(urllib.parse.urljoin(base_url or BASE_URL, url.strip()))
+    query = urllib.parse.urlencode(sorted(
+        (k, v) for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=False)
+    ))
+    path = parts.path.rstrip('/') or '/'
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+# CSV 필드 목록 (HTML 분석 기반)
+# CSV 열 순서 (민원 레코드 스키마와 동일)
+CSV_FIELDNAMES = list(RECORD_FIELDS)
+
+def save_to_csv(minwon_list, filename="정부24_민원목록.csv", output_dir=None, compression=None):
+    """민원 목록을 CSV 파일로 저장하는 함수 (개선된 필드 포함)
+
+    압축 방식은 파일명 확장자(.gz/.zst), compression, OUTPUT_COMPRESSION 순으로 정하며
+    압축하면 파일명에 확장자를 붙인다. 실제로 저장한 경로를 반환한다.
+    """
+    from .compress import FramedWriter, compressed_path, compression_of
+    
     if output_dir is None:
         output_dir = os.path.expanduser("~/Desktop/data")
     os.makedirs(output_dir, exist_ok=True)
-    file_path = os.path.join(output_dir, filename)
-    
-    # 필드 목록 확장 (HTML 분석 기반)
-    fieldnames = [
-        # 기본 필드
-        "민원명", "설명", "담당부서", "인증필요", "유형", "링크", "링크텍스트",
-        "서비스ID", "카테고리", "일련번호", "처리절차", "신청방법", "필요서류",
-        "수수료", "담당기관", "연락처", "처리기간", "신청자격", "관련법령",
-        "첨부파일", "기타정보", "오류여부",
-        
-        # 추가 필드
-        "신청기간", "결제정보", "수령방법", "처리상태", "민원유형",
-        "참고정보", "연관민원", "운영시간", "처리시간", "지원금액",
-        "관련서식", "담당자정보", "서비스상태", "신청경로", "서비스분류",
-        "민원분류", "프로세스이미지", "API정보"
-    ]
+    compression = compression_of(filename) or compression or OUTPUT_COMPRESSION
+    file_path = compressed_path(os.path.join(output_dir, filename), compression)
+    
+    fieldnames = CSV_FIELDNAMES
     
-    with open(file_path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+    with metrics.timer("write"), FramedWriter(file_path, compression, encoding='utf-8-sig') as csvfile:
         writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
         writer.writeheader()
         for minwon in minwon_list:
@@ -713,6 +922,20 @@ def save_to_csv(minwon_list, filename="정부24_민원목록.csv", output_dir=No
     logger.info(f"CSV 파일이 저장되었습니다: {file_path}")
     return file_path
 
+def iter_from_csv(file_path):
+    """save_to_csv로 저장한 CSV 파일의 민원을 한 행씩 읽는 생성기 (전체를 메모리에 올리지 않음, 압축 파일 포함)"""
+    from .compress import open_text
+    
+    with open_text(file_path, encoding='utf-8-sig') as csvfile:
+        for row in csv.DictReader(csvfile):
+            yield MinwonRecord(row)
+
+def load_from_csv(file_path):
+    """save_to_csv로 저장한 CSV 파일을 민원 목록으로 읽어오는 함수"""
+    minwon_list = list(iter_from_csv(file_path))
+    logger.info(f"CSV 파일에서 {len(minwon_list)}개 항목을 읽었습니다: {file_path}")
+    return minwon_list
+
 # 텍스트 분석 함수 추가
 def analyze_text(text, lang='ko'):
     """텍스트 분석으로 중요 키워드와 품질 점수 추출"""
@@ -726,11 +949,16 @@ def analyze_text(text, lang='ko'):
     # 기본 텍스트 정제
     text = clean_text(text)
     
-    # 한국어 텍스트 분석 (KoNLPy 사용)
-    if lang == 'ko' and OKT_AVAILABLE:
+    # 한국어 텍스트 분석 (KoNLPy 또는 내장 분석기 사용)
+    backend = korean_backend() if lang == 'ko' else None
+    if backend:
         try:
             # 명사 추출
-            nouns = okt.nouns(text)
+            if backend == "okt":
+                nouns = okt.nouns(text)
+            else:
+                from .ko_tokenizer import get_tokenizer
+                nouns = get_tokenizer().nouns(text)
             # 불용어 필터링 (간단한 한국어 불용어 목록)
             ko_stopwords = {'이', '그', '저', '것', '및', '등', '외', '관한', '통한', '위한', '중', '및'}
             keywords = [word for word in nouns if word not in ko_stopwords and len(word) > 1]
@@ -742,7 +970,7 @@ def analyze_text(text, lang='ko'):
         except Exception as e:
             logger.warning(f"한국어 텍스트 분석 중 오류: {str(e)}")
     
-    # 영어 또는 KoNLPy 사용 불가 시 기본 분석
+    # 영어 또는 한국어 분석 실패 시 기본 분석
     if NLTK_AVAILABLE:
         try:
             # 토큰화
@@ -764,7 +992,7 @@ def analyze_text(text, lang='ko'):
             logger.warning(f"NLTK 텍스트 분석 중 오류: {str(e)}")
     
     # 모든 분석 방법 실패 시 간단한 워드 카운팅
-    words = [w for w in re.findall(r'\w+', text.lower()) if len(w) > 2]
+    words = [w for w in WORD_RE.findall(text.lower()) if len(w) > 2]
     from collections import Counter
     word_counts = Counter(words)
     
@@ -806,9 +1034,131 @@ def enhance_text_with_keywords(original_text, similar_texts=None):
     
     return original_text
 
-def extract_detail_info(url):
-    # 결과 딕셔너리 초기화 - 더 많은 필드 추가
-    detail_info = {
+# 텍스트 분석 워커 풀 (None이면 크롤러 프로세스 안에서 직접 분석)
+nlp_pool = None
+# 분석 결과를 기다리는 작업 목록을 저장하는 레코드 키 (CSV에는 저장되지 않음)
+NLP_PENDING_KEY = "_nlp_pending"
+
+def start_nlp_pool(workers=0):
+    """텍스트 분석을 별도 프로세스 풀로 이관"""
+    global nlp_pool
+    if nlp_pool is None:
+        from .nlp_pool import NLPWorkerPool
+        nlp_pool = NLPWorkerPool(workers, NLP_BACKEND)
+    return nlp_pool
+
+def stop_nlp_pool():
+    """텍스트 분석 워커 풀 종료"""
+    global nlp_pool
+    if nlp_pool is not None:
+        nlp_pool.shutdown()
+        nlp_pool = None
+
+def nlp_backend_available(korean=False):
+    """텍스트 분석 백엔드 사용 가능 여부 (워커 풀 포함)"""
+    if nlp_pool is not None:
+        return nlp_pool.korean_available if korean else nlp_pool.available
+    if korean:
+        return korean_backend() is not None
+    return korean_backend() is not None or NLTK_AVAILABLE
+
+def is_missing_value(value):
+    """필드 값이 비어 있거나 의미 없는 값인지 확인"""
+    return not value or value == "정보 없음" or len(value.strip()) < 2
+
+def nlp_enrich(fields, tasks):
+    """텍스트 분석 작업을 수행하고 갱신할 필드를 반환 (워커 프로세스에서도 실행됨)"""
+    start = time.perf_counter()
+    updates = {}
+    
+    # 페이지 본문 키워드 (TF-IDF 키워드 단계를 실행하면 그 결과로 덮어씀)
+    if "keywords" in tasks and fields.get("본문"):
+        keywords, _ = analyze_text(fields["본문"])
+        if keywords:
+            updates["키워드"] = ", ".join(keywords)
+            logger.info(f"페이지에서 추출한 주요 키워드: {updates['키워드']}")
+    
+    # 유사 필드 간 텍스트 품질 향상
+    if "enhance" in tasks:
+        if fields.get("처리절차") and fields.get("신청방법"):
+            similar_texts = [fields.get("처리절차"), fields.get("신청방법")]
+            updates["처리절차"] = enhance_text_with_keywords(fields["처리절차"], similar_texts)
+            updates["신청방법"] = enhance_text_with_keywords(fields["신청방법"], similar_texts)
+        if fields.get("필요서류"):
+            updates["필요서류"] = enhance_text_with_keywords(fields["필요서류"])
+    
+    # 키워드에서 민원명 생성 (설명도 비어 있으면 함께 생성)
+    if "title" in tasks:
+        source_text = fields.get("설명") or fields.get("민원명")
+        keywords, _ = analyze_text(source_text) if source_text else ([], 0)
+        if keywords:
+            updates["민원명"] = f"{' '.join(keywords[:3])} 관련 민원"
+            logger.info(f"텍스트 분석으로 민원명 생성: {updates['민원명']}")
+            if is_missing_value(fields.get("설명", "")):
+                updates["설명"] = f"{updates['민원명']}에 관한 민원 서비스입니다."
+    
+    # 민원명과 동일한 설명을 키워드로 개선
+    if "describe" in tasks and fields.get("민원명"):
+        keywords, _ = analyze_text(fields["민원명"])
+        if keywords:
+            updates["설명"] = f"{fields['민원명']}은(는) {', '.join(keywords[:3])}와 관련된 민원입니다."
+            logger.info(f"키워드로 설명 개선: {updates['설명']}")
+    
+    metrics.observe("nlp", time.perf_counter() - start, start)
+    return updates
+
+def _nlp_fields(record, extra_fields=None):
+    """워커 풀에 넘길 분석 대상 필드"""
+    fields = {k: record.get(k, "") for k in ("민원명", "설명", "처리절차", "신청방법", "필요서류")}
+    if extra_fields:
+        fields.update(extra_fields)
+    return fields
+
+def submit_nlp(record, tasks, extra_fields=None):
+    """워커 풀에 분석 작업을 넘기고 결과를 기다리는 목록에 등록 (블로킹 없음)"""
+    future = nlp_pool.submit(_nlp_fields(record, extra_fields), tasks)
+    _add_nlp_pending(record, tuple(tasks), future)
+    return future
+
+def _add_nlp_pending(record, tasks, future):
+    """결과를 기다리는 목록에 분석 작업 등록 (같은 분석이 이미 있으면 이전 작업은 취소하고 교체)"""
+    pending = record.setdefault(NLP_PENDING_KEY, [])
+    for entry in [entry for entry in pending if entry[0] == tasks]:
+        entry[1].cancel()
+        pending.remove(entry)
+    pending.append((tasks, future))
+
+# 유효성 검증이 결과에 달린 분석 작업 (결과를 반영한 뒤 다시 검증)
+VALIDATION_NLP_TASKS = ("title", "describe")
+
+def resolve_nlp_pending(records):
+    """워커 풀의 분석 결과를 레코드에 반영
+
+    검증 때 결과를 기다리지 않고 통과시킨 레코드(민원명/설명 생성)는 결과를 반영한 뒤
+    분석 없이 다시 검증하고, 결과가 비어 여전히 유효하지 않으면 필수정보 누락으로 처리한다.
+    """
+    for record in records:
+        pending = record.pop(NLP_PENDING_KEY, None)
+        if not pending:
+            continue
+        revalidate = False
+        for tasks, future in pending:
+            try:
+                updates = future.result()
+            except Exception as e:
+                logger.warning(f"텍스트 분석 작업 실패: {str(e)} - 민원명: {record.get('민원명', '제목 없음')}")
+                updates = {}
+            record.update(updates)
+            revalidate = revalidate or any(task in VALIDATION_NLP_TASKS for task in tasks)
+        if revalidate and not validate_minwon_data(record, nlp=False):
+            logger.warning(f"텍스트 분석 결과로도 필수 정보를 채우지 못함: {record.get('링크', '')}")
+            mark_missing_required(record)
+    return records
+
+def extract_detail_info(url, doc=None):
+    """상세 페이지에서 민원 정보 추출 (doc이 주어지면 페이지를 가져오지 않고 그 문서를 사용)"""
+    # 결과 레코드 초기화 - 더 많은 필드 추가
+    detail_info = MinwonRecord({
         # 기존 필드
         "인증필요": "",
         "유형": "민원",
@@ -846,13 +1196,18 @@ def extract_detail_info(url):
         "서비스상태": "",      # 서비스 활성화 상태
         "신청경로": "",        # 신청 가능한 경로 (온라인/오프라인)
         "서비스분류": "",      # 서비스의 세부 분류
-    }
+    })
 
+    # 페이지를 가져온 뒤의 추출 시간만 기록 (워커 풀 없이 분석하면 텍스트 분석 시간도 포함)
+    extract_start = None
     try:
-        # 기존 requests.get() 대신 get_page_content() 사용
-        soup = get_page_content(url)
-        if soup is None:
+        # 기존 requests.get() 대신 get_page_document() 사용 (텍스트 뷰를 페이지 단위로 메모이즈)
+        if doc is None:
+            doc = get_page_document(url)
+        if doc is None:
             raise Exception("페이지 콘텐츠를 가져오지 못했습니다.")
+        extract_start = time.perf_counter()
+        soup = doc.soup
 
         # 민원명 추출 시도 (페이지 제목 우선)
         title_found = False
@@ -867,8 +1222,8 @@ def extract_detail_info(url):
         
         for selector in title_selectors:
             title_tag = soup.select_one(selector)
-            if title_tag and title_tag.text.strip():
-                title_text = clean_text(title_tag.text)
+            if title_tag and doc.element_text(title_tag).strip():
+                title_text = doc.clean(title_tag)
                 
                 # "발급", "열람", "신청" 등의 키워드가 포함된 경우 민원명으로 인식
                 keywords = ["발급", "열람", "신청", "등록", "민원", "신고", "조회", "교부"]
@@ -883,7 +1238,7 @@ def extract_detail_info(url):
         if not title_found:
             title_tag = soup.find('title')
             if title_tag:
-                title_text = clean_text(title_tag.text)
+                title_text = doc.clean(title_tag)
                 # 괄호 안에 있는 텍스트 추출 - "제목 - 민원24" 또는 "제목(부제) | 민원24" 형식 처리
                 patterns = [
                     r'^(.*?)\s*[-|]\s*민원24',  # "제목 - 민원24" 또는 "제목 | 민원24" 형식
@@ -967,12 +1322,14 @@ def extract_detail_info(url):
                     
                     if not cont_box:
                         # 다음 h2 태그 전까지의 모든 내용을 콘텐츠로 간주
-                        cont_box = soup.new_tag('div')
+                        # (노드를 옮기거나 복사하지 않고 원래 형제 요소들을 하나처럼 검색 - 문서와 텍스트 뷰는 그대로 유지)
+                        section = []
                         for sibling in siblings:
                             if sibling.name == tag and sibling.get('class') == h_tag.get('class'):
                                 break
                             if sibling.name:  # 텍스트 노드가 아닌 경우만
-                                cont_box.append(sibling)
+                                section.append(sibling)
+                        cont_box = SiblingGroup(section)
                     
                     if cont_box:
                         list_items = cont_box.find_all('li')
@@ -1023,7 +1380,7 @@ def extract_detail_info(url):
                                             content = clean_text(parts[0])
                                     elif "담당" in subheading and ":" in content:  # 담당자 및 연락처 분리
                                         parts = content.split(":")
-                                        if len(parts) > 1 and (re.search(r'\d{2,3}-\d{3,4}-\d{4}', parts[1]) or 
+                                        if len(parts) > 1 and (PHONE_RE.search(parts[1]) or 
                                                             "연락처" in parts[0].lower()):
                                             detail_info["연락처"] = clean_text(parts[1])
                                             content = clean_text(parts[0]) + " (연락처 별도 저장)"
@@ -1043,18 +1400,23 @@ def extract_detail_info(url):
                                     if not mapped:
                                         detail_info["기타정보"] += f"{subheading}: {content} / "
         
+        # 섹션 처리는 트리를 바꾸지 않으므로 내용 확인 때 만든 텍스트 뷰를 그대로 사용
+        page_index = doc.index
+        
         # 섹션 기반 접근이 실패한 경우 전체 페이지에서 유용한 정보 추출 시도
         if not sections_found or not title_found or not detail_info.get("처리절차") or not detail_info.get("신청방법"):
             logger.warning(f"구조화된 섹션이나 필수 정보를 찾지 못했습니다. 대체 추출 방법 시도: {url}")
             
             # 텍스트 분석으로 페이지 컨텐츠에서 중요 정보 발견 시도
-            if NLP_ENABLED and (OKT_AVAILABLE or NLTK_AVAILABLE):
+            if NLP_ENABLED and nlp_backend_available():
                 # 페이지 전체 텍스트
-                full_text = soup.get_text(separator=' ', strip=True)
+                full_text = doc.spaced_text
                 
-                # 키워드 추출 및 문맥 분석
-                keywords, _ = analyze_text(full_text)
-                logger.info(f"페이지에서 추출한 주요 키워드: {', '.join(keywords)}")
+                # 키워드 추출 및 문맥 분석 (워커 풀 사용 시 결과를 기다리지 않음)
+                if nlp_pool is not None:
+                    submit_nlp(detail_info, ["keywords"], {"본문": full_text})
+                else:
+                    detail_info.update(nlp_enrich({"본문": full_text}, ["keywords"]))
                 
                 # 민원 관련 섹션 발견 시도 - 키워드 주변 문맥 분석
                 procedure_patterns = ["신청", "방법", "절차", "순서", "단계", "접수"]
@@ -1065,9 +1427,9 @@ def extract_detail_info(url):
                     procedure_texts = []
                     for pattern in procedure_patterns:
                         if pattern in full_text:
-                            for paragraph in soup.find_all(['p', 'div', 'li']):
-                                if pattern in paragraph.text and len(paragraph.text.strip()) > 15:
-                                    procedure_texts.append(clean_text(paragraph.text))
+                            for _, paragraph_text in page_index.find_blocks(pattern):
+                                if len(paragraph_text.strip()) > 15:
+                                    procedure_texts.append(clean_text(paragraph_text))
                     
                     if procedure_texts:
                         # 여러 텍스트 조각을 결합하여 처리 절차 구성
@@ -1079,9 +1441,9 @@ def extract_detail_info(url):
                     docs_texts = []
                     for pattern in docs_patterns:
                         if pattern in full_text:
-                            for paragraph in soup.find_all(['p', 'div', 'li']):
-                                if pattern in paragraph.text and len(paragraph.text.strip()) > 10:
-                                    docs_texts.append(clean_text(paragraph.text))
+                            for _, paragraph_text in page_index.find_blocks(pattern):
+                                if len(paragraph_text.strip()) > 10:
+                                    docs_texts.append(clean_text(paragraph_text))
                     
                     if docs_texts:
                         detail_info["필요서류"] = " / ".join(docs_texts[:2])
@@ -1116,8 +1478,9 @@ def extract_detail_info(url):
                         # 선택자로 직접 찾기
                         elems = soup.select(pattern["selector"])
                         for elem in elems:
-                            if elem and elem.text.strip() and len(elem.text.strip()) > 5:
-                                detail_info["민원명"] = clean_text(elem.text)
+                            elem_text = doc.element_text(elem).strip() if elem else ""
+                            if elem_text and len(elem_text) > 5:
+                                detail_info["민원명"] = doc.clean(elem)
                                 title_found = True
                                 break
                     
@@ -1128,10 +1491,10 @@ def extract_detail_info(url):
                         # 텍스트 패턴이 있는 요소 찾기
                         elems = soup.select(pattern["selector"])
                         for elem in elems:
-                            if elem and elem.text.strip():
+                            if elem and doc.element_text(elem).strip():
                                 for keyword in pattern["text_pattern"]:
-                                    if keyword in elem.text:
-                                        detail_info["민원명"] = clean_text(elem.text)
+                                    if keyword in doc.element_text(elem):
+                                        detail_info["민원명"] = doc.clean(elem)
                                         title_found = True
                                         break
                             if title_found:
@@ -1144,8 +1507,8 @@ def extract_detail_info(url):
             if not title_found and detail_info["서비스ID"]:
                 service_id = detail_info["서비스ID"]
                 # 서비스 ID에서 형태소 분석하여 민원명 조합 시도
-                if re.match(r'^[A-Za-z0-9_]+$', service_id):
-                    parts = re.findall(r'[A-Z][a-z]*|[a-z]+|\d+', service_id)
+                if SERVICE_ID_FORMAT_RE.match(service_id):
+                    parts = SERVICE_ID_PARTS_RE.findall(service_id)
                     if parts and len(parts) >= 2:
                         # 영문 ID를 한글 관련 용어로 대체 (간단한 예시)
                         id_to_name = {
@@ -1189,7 +1552,7 @@ def extract_detail_info(url):
         
         # 페이지에서 추가 정보 추출
         if not detail_info["신청방법"]:
-            apply_info = soup.find(string=lambda text: text and "신청방법" in text)
+            apply_info = page_index.first_string_containing("신청방법")
             if apply_info:
                 parent = apply_info.parent
                 next_el = parent.find_next()
@@ -1217,16 +1580,12 @@ def extract_detail_info(url):
             detail_info["오류여부"] = "일부 정보 누락"
 
         # 최종 텍스트 품질 개선
-        if NLP_ENABLED and OKT_AVAILABLE:
-            # 유사 필드 간 텍스트 품질 향상
-            if detail_info.get("처리절차") and detail_info.get("신청방법"):
-                similar_texts = [detail_info.get("처리절차"), detail_info.get("신청방법")]
-                detail_info["처리절차"] = enhance_text_with_keywords(detail_info["처리절차"], similar_texts)
-                detail_info["신청방법"] = enhance_text_with_keywords(detail_info["신청방법"], similar_texts)
-            
-            # 필요서류 텍스트 품질 향상
-            if detail_info.get("필요서류"):
-                detail_info["필요서류"] = enhance_text_with_keywords(detail_info["필요서류"])
+        if NLP_ENABLED and nlp_backend_available(korean=True):
+            # 유사 필드 간 텍스트 품질 향상 (워커 풀 사용 시 배치 종료 후 반영)
+            if nlp_pool is not None:
+                submit_nlp(detail_info, ["enhance"])
+            else:
+                detail_info.update(nlp_enrich(detail_info, ["enhance"]))
 
         # 추가 정보 추출 개선 - 구조화된 테이블에서 정보 추출
         tables = soup.find_all('table')
@@ -1338,21 +1697,10 @@ def extract_detail_info(url):
         
         # 처리 단계별 시간/소요일 추출 강화
         if not detail_info["처리기간"] or len(detail_info["처리기간"]) < 3:
-            duration_patterns = [
-                r'(\d+)[일|시간|분]',
-                r'처리기간[은|:]?\s*(\d+)',
-                r'(\d+)\s*(영업일|근무일|업무일)',
-                r'(\d+)~(\d+)[일|시간|분]',
-                r'최대\s*(\d+)[일|시간|분]',
-                r'(\d+)일\s*이내'
-            ]
-            
-            full_text = soup.get_text()
-            for pattern in duration_patterns:
-                matches = re.search(pattern, full_text)
-                if matches:
-                    detail_info["처리기간"] = clean_text(matches.group(0))
-                    break
+            # 처리기간 패턴들을 우선순위대로 합친 정규식으로 페이지 텍스트를 한 번만 훑음
+            matches = duration_scanner.search(page_index.text)
+            if matches:
+                detail_info["처리기간"] = clean_text(matches.group(0))
         
         # 오픈 API 또는 데이터 연계 정보 추출
         api_info = []
@@ -1396,54 +1744,62 @@ def extract_detail_info(url):
         logger.error(f"세부정보 추출 중 오류 발생: {str(e)}, URL: {url}")
         detail_info["오류여부"] = f"세부정보 추출 실패: {str(e)}"
         return detail_info
+    finally:
+        if extract_start is not None:
+            metrics.observe("extract", time.perf_counter() - extract_start, extract_start)
 
 def fetch_single_page(url, page_num):
     """단일 페이지의 민원 목록을 가져오는 함수"""
-    session = get_session()
     max_retries = 3
-    for retry in range(max_retries):
+    attempts = retry.Attempts("list_fetch", url, max_retries)
+    for attempt in attempts:
         try:
-            response = session.get(url, timeout=15)
-            response.raise_for_status()
-            minwon_list = extract_minwon_list(response.text)
+            with metrics.timer("list_fetch", method="requests"):
+                response = http_get(url, lane="list_fetch")
+            with metrics.timer("list_extract"):
+                minwon_list = extract_minwon_list(response.text)
             logger.info(f"페이지 {page_num}에서 {len(minwon_list)}개의 민원을 추출했습니다.")
             return minwon_list
-        except requests.exceptions.RequestException as e:
-            logger.warning(f"페이지 {page_num} 요청 실패, 재시도 {retry+1}/{max_retries}: {str(e)}")
-            if retry == max_retries - 1:
-                logger.error(f"페이지 {page_num} 요청 최종 실패: {str(e)}")
-                return []
-            time.sleep(2 * (retry + 1))
+        except transport.TransportError as e:
+            attempts.fail(e)
+            logger.warning(f"페이지 {page_num} 요청 실패 (시도 {attempt+1}/{max_retries}): {str(e)}")
+    logger.error(f"페이지 {page_num} 요청 최종 실패: {str(attempts.error)}")
     return []
 
 def fetch_pages_parallel(base_url, last_page, max_workers=5):
     """페이지 데이터를 병렬로 가져오는 함수"""
     all_minwons = []
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(fetch_single_page, get_page_url(base_url, page), page): page
-            for page in range(1, last_page + 1)
-        }
-        for future in concurrent.futures.as_completed(futures):
-            page_num = futures[future]
-            try:
-                page_minwons = future.result()
-                all_minwons.extend(page_minwons)
-                logger.info(f"페이지 {page_num}/{last_page}에서 {len(page_minwons)}개 민원 추출")
-            except Exception as e:
-                logger.error(f"페이지 {page_num} 처리 중 오류: {str(e)}")
+    # 상세 단계와 같은 스레드 풀/연결 풀을 사용
+    executor = transport.get_executor(max_workers)
+    futures = {
+        retry.submit(executor, fetch_single_page, get_page_url(base_url, page), page): page
+        for page in range(1, last_page + 1)
+    }
+    for future in concurrent.futures.as_completed(futures):
+        page_num = futures[future]
+        try:
+            page_minwons = future.result()
+            all_minwons.extend(page_minwons)
+            logger.info(f"페이지 {page_num}/{last_page}에서 {len(page_minwons)}개 민원 추출")
+        except Exception as e:
+            logger.error(f"페이지 {page_num} 처리 중 오류: {str(e)}")
     return all_minwons
 
 # 데이터 유효성 검증 함수 추가
-def validate_minwon_data(data):
-    """민원 데이터의 필수 필드 유효성 검증 (개선됨)"""
+def validate_minwon_data(data, nlp=True):
+    """민원 데이터의 필수 필드 유효성 검증 (개선됨)
+
+    텍스트 분석으로 민원명/설명을 보강할 수 있으면 시도한다 (nlp=False면 시도하지 않음).
+    워커 풀이 있으면 분석 결과를 기다리지 않고 제출만 한 뒤 나머지 검사로 판단하며,
+    결과는 resolve_nlp_pending에서 반영하고 다시 검증한다.
+    """
     required_fields = ["민원명", "설명", "처리절차", "신청방법"]
     valid = True
     missing_fields = []
     
     for field in required_fields:
         value = data.get(field, "")
-        if not value or value == "정보 없음" or len(value.strip()) < 2:  # 최소 길이 조건
+        if is_missing_value(value):  # 최소 길이 조건
             missing_fields.append(field)
             valid = False
     
@@ -1451,15 +1807,16 @@ def validate_minwon_data(data):
         logger.warning(f"유효하지 않은 데이터: {', '.join(missing_fields)} - 민원명: {data.get('민원명', '제목 없음')}")
         
         # 로컬 텍스트 분석으로 누락된 필드 보강 시도 - NLP 활성화 여부 확인
-        if NLP_ENABLED and OKT_AVAILABLE and (data.get("설명") or data.get("민원명")):
-            source_text = data.get("설명") or data.get("민원명")
-            keywords, _ = analyze_text(source_text)
-            
-            if keywords and "민원명" in missing_fields and not data.get("민원명"):
-                # 키워드에서 민원명 생성
-                data["민원명"] = f"{' '.join(keywords[:3])} 관련 민원"
-                missing_fields.remove("민원명")
-                logger.info(f"텍스트 분석으로 민원명 생성: {data['민원명']}")
+        if nlp and NLP_ENABLED and nlp_backend_available(korean=True) and (data.get("설명") or data.get("민원명")):
+            if "민원명" in missing_fields and not data.get("민원명"):
+                # 키워드에서 민원명 생성 (비어 있으면 설명도 함께 생성)
+                if nlp_pool is not None:
+                    submit_nlp(data, ["title"])
+                    missing_fields = [field for field in missing_fields if field not in ("민원명", "설명")]
+                    return not missing_fields
+                data.update(nlp_enrich(data, ["title"]))
+                if data.get("민원명"):
+                    missing_fields.remove("민원명")
             
             if "설명" in missing_fields and data.get("민원명"):
                 # 민원명에서 설명 생성
@@ -1476,12 +1833,13 @@ def validate_minwon_data(data):
         logger.warning(f"민원명과 설명이 동일함: {data.get('민원명')}")
         
         # 설명 개선 시도
-        if NLP_ENABLED and OKT_AVAILABLE:
-            keywords, _ = analyze_text(data.get("민원명"))
-            if keywords:
-                data["설명"] = f"{data['민원명']}은(는) {', '.join(keywords[:3])}와 관련된 민원입니다."
-                logger.info(f"키워드로 설명 개선: {data['설명']}")
-            else:
+        if nlp and NLP_ENABLED and nlp_backend_available(korean=True):
+            if nlp_pool is not None:
+                submit_nlp(data, ["describe"])
+                return True
+            updates = nlp_enrich(data, ["describe"])
+            data.update(updates)
+            if not updates:
                 return False
         else:
             return False
@@ -1496,64 +1854,93 @@ def retry_process_minwon(minwon, max_retries=3):
         minwon["오류여부"] = "링크없음"
         return minwon
         
-    for retry in range(max_retries):
-        logger.info(f"민원 '{minwon.get('민원명')}' 재처리 시도 {retry+1}/{max_retries}")
-        if not detail_url.startswith('http'):
-            detail_url = urllib.parse.urljoin("https://www.gov.kr", detail_url)
+    if not detail_url.startswith('http'):
+        detail_url = urllib.parse.urljoin(BASE_URL, detail_url)
+    
+    # 첫 처리(시도 0)는 이미 실패했으므로 시도 1부터 - 매 재처리 전에 재시도 정책대로 대기
+    attempts = retry.Attempts("record", canonical_url(detail_url), max_retries + 1, start=1)
+    for attempt in attempts:
+        logger.info(f"민원 '{minwon.get('민원명')}' 재처리 시도 {attempt}/{max_retries}")
+        tracing.instant("retry", attempt=attempt, url=detail_url)
             
         # 캐시 무효화 후 재시도
-        global url_processing_cache, successful_urls_cache
-        if detail_url in url_processing_cache:
-            del url_processing_cache[detail_url]
-        
-        if detail_url in successful_urls_cache:
-            del successful_urls_cache[detail_url]
-            
-        # 재시도 간 지수 백오프
-        wait_time = min(2 ** retry, 10)  # 최대 10초
-        time.sleep(wait_time)
+        invalidate_url_cache(detail_url)
         
         # 다른 메서드 시도 (Playwright 강제 사용)
-        if retry > 0:
-            logger.info(f"재시도 {retry+1}: Playwright 강제 사용")
+        if attempt > 1:
+            logger.info(f"재시도 {attempt}: Playwright 강제 사용")
             soup = get_content_with_playwright(detail_url)
             if soup:
                 # BeautifulSoup 객체에서 직접 정보 추출
                 detail_info = extract_detail_info(detail_url)
-                minwon.update(detail_info)
+                merge_detail_info(minwon, detail_info)
             else:
                 logger.warning(f"Playwright로도 페이지를 가져오지 못했습니다: {detail_url}")
                 continue
         else:
             detail_info = extract_detail_info(detail_url)
-            minwon.update(detail_info)
+            merge_detail_info(minwon, detail_info)
         
-        if validate_minwon_data(minwon):
+        with metrics.timer("validate"):
+            valid = validate_minwon_data(minwon)
+        if valid:
             minwon["오류여부"] = "재처리 성공"
             return minwon
             
     # 최종 실패 - 최소한의 정보 채우기
+    return mark_missing_required(minwon)
+
+def mark_missing_required(minwon):
+    """필수 정보를 끝내 얻지 못한 민원 표시 (필수 필드에 기본값 설정)"""
     minwon["오류여부"] = "필수정보 누락"
-    
-    # 필수 필드에 기본값 설정
     required_fields = ["처리절차", "신청방법", "필요서류", "담당기관"]
     for field in required_fields:
         if not minwon.get(field):
             minwon[field] = "정보를 가져올 수 없음 (자동 생성)"
-    
+    return minwon
+
+# 목록 페이지에서만 얻을 수 있는 필드 (상세 페이지의 빈 값으로 덮어쓰지 않음)
+LIST_ONLY_FIELDS = ("일련번호", "카테고리")
+
+def merge_detail_info(minwon, detail_info):
+    """상세 정보를 목록 항목에 반영하는 함수 (목록 단계 필드 보존)"""
+    for key, value in detail_info.items():
+        if key in LIST_ONLY_FIELDS and not value and minwon.get(key):
+            continue
+        if key == NLP_PENDING_KEY:
+            # 재처리로 다시 추출한 경우 이전 분석 작업은 새 작업으로 교체
+            for tasks, future in value:
+                _add_nlp_pending(minwon, tasks, future)
+            continue
+        minwon[key] = value
     return minwon
 
 def save_checkpoint(minwon_list, filename="진행상황_checkpoint.csv", output_dir=None):
     """중간 작업 상태 저장"""
     try:
         logger.info(f"중간 작업 상태 저장 중... ({len(minwon_list)}개 항목)")
-        save_to_csv(minwon_list, filename, output_dir)
+        with tracing.span("save_checkpoint", items=len(minwon_list)):
+            save_to_csv(minwon_list, filename, output_dir)
         logger.info(f"체크포인트 저장 완료: {filename}")
     except Exception as e:
         logger.error(f"체크포인트 저장 실패: {str(e)}")
 
+def append_checkpoint(journal, minwon_list):
+    """체크포인트 저널에 배치 결과 덧붙이기 (전체 목록을 다시 쓰지 않음)"""
+    try:
+        with tracing.span("save_checkpoint", items=len(minwon_list)), metrics.timer("write"):
+            journal.append(minwon_list)
+        logger.info(f"체크포인트 저널에 {len(minwon_list)}개 항목 추가 (누적 {journal.rows}개): {journal.path}")
+    except Exception as e:
+        logger.error(f"체크포인트 저장 실패: {str(e)}")
+
 def process_single_minwon(minwon):
     """단일 민원의 상세 정보를 처리하는 함수 (개선됨)"""
+    with tracing.span("minwon", cat="item", 서비스ID=minwon.get("서비스ID", ""), 민원명=minwon.get("민원명", "")):
+        return _process_single_minwon(minwon)
+
+def _process_single_minwon(minwon):
+    """process_single_minwon 내부용 (구간 기록 안에서 실행)"""
     detail_url = minwon.get('링크')
     if not detail_url or detail_url == "링크 없음":
         logger.warning(f"링크 없음: {minwon.get('민원명', '제목 없음')}")
@@ -1562,18 +1949,26 @@ def process_single_minwon(minwon):
         
     try:
         if not detail_url.startswith('http'):
-            detail_url = urllib.parse.urljoin("https://www.gov.kr", detail_url)
+            detail_url = urllib.parse.urljoin(BASE_URL, detail_url)
             
+        # 재처리 대기 뒤 다시 실행된 작업이면 첫 처리(추출/병합/검증)를 반복하지 않고 재처리부터 이어서
+        if retry.resuming("record", canonical_url(detail_url)):
+            with tracing.span("retry_process_minwon"):
+                return retry_process_minwon(minwon)
+        
         logger.info(f"민원 처리 중: {minwon.get('민원명')} - {detail_url}")
         
         # 세부 정보 추출
         detail_info = extract_detail_info(detail_url)
-        minwon.update(detail_info)
+        merge_detail_info(minwon, detail_info)
         
         # 데이터 유효성 검증 추가
-        if not validate_minwon_data(minwon):
+        with metrics.timer("validate"):
+            valid = validate_minwon_data(minwon)
+        if not valid:
             logger.warning(f"유효성 검증 실패, 재시도: {minwon.get('민원명')}")
-            return retry_process_minwon(minwon)
+            with tracing.span("retry_process_minwon"):
+                return retry_process_minwon(minwon)
             
         # 성공 처리
         minwon["오류여부"] = "정상"
@@ -1599,36 +1994,41 @@ def batch_process_minwons(minwon_batch, max_workers=None):
     if max_workers is None:
         max_workers = min(os.cpu_count() or 4, 5)  # 최대 5개로 제한 (서버 부하 방지)
     
-    effective_workers = min(max_workers, len(minwon_batch))
     results = []
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=effective_workers) as executor:
-        # 진행 상황 표시
-        if TQDM_AVAILABLE:
-            futures = {executor.submit(process_single_minwon, minwon): i for i, minwon in enumerate(minwon_batch)}
-            for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="민원 처리"):
-                try:
-                    results.append(future.result())
-                except Exception as e:
-                    minwon = minwon_batch[futures[future]]
-                    logger.error(f"민원 처리 실패: {minwon.get('민원명', '알 수 없음')}, 오류: {str(e)}")
-                    minwon["오류여부"] = f"처리실패: {str(e)}"
-                    results.append(minwon)
-        else:
-            # tqdm 없이 진행
-            futures = {executor.submit(process_single_minwon, minwon): minwon for minwon in minwon_batch}
-            completed = 0
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    results.append(future.result())
-                except Exception as e:
-                    minwon = futures[future]
-                    minwon["오류여부"] = f"처리실패: {str(e)}"
-                    results.append(minwon)
-                
-                completed += 1
-                if completed % 5 == 0:  # 5개마다 진행 상황 출력
-                    logger.info(f"진행률: {completed}/{len(minwon_batch)} ({completed/len(minwon_batch)*100:.1f}%)")
+    # 배치마다 스레드를 새로 만들지 않고 실행 동안 유지되는 스레드 풀 사용 (연결도 계속 재사용)
+    # 재시도 대기 중인 민원은 워커를 놓아주고 타이머가 대기 후 다시 제출함
+    executor = transport.get_executor(max_workers)
+    
+    # 진행 상황 표시
+    if TQDM_AVAILABLE:
+        futures = {retry.submit(executor, process_single_minwon, minwon): i for i, minwon in enumerate(minwon_batch)}
+        for future in tqdm(concurrent.futures.as_completed(futures), total=len(futures), desc="민원 처리"):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                minwon = minwon_batch[futures[future]]
+                logger.error(f"민원 처리 실패: {minwon.get('민원명', '알 수 없음')}, 오류: {str(e)}")
+                minwon["오류여부"] = f"처리실패: {str(e)}"
+                results.append(minwon)
+    else:
+        # tqdm 없이 진행
+        futures = {retry.submit(executor, process_single_minwon, minwon): minwon for minwon in minwon_batch}
+        completed = 0
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                minwon = futures[future]
+                minwon["오류여부"] = f"처리실패: {str(e)}"
+                results.append(minwon)
+            
+            completed += 1
+            if completed % 5 == 0:  # 5개마다 진행 상황 출력
+                logger.info(f"진행률: {completed}/{len(minwon_batch)} ({completed/len(minwon_batch)*100:.1f}%)")
+    
+    # 워커 풀에서 비동기로 처리된 텍스트 분석 결과 반영
+    resolve_nlp_pending(results)
     
     # 성공률 계산 및 표시
     success_count = sum(1 for m in results if "정상" in m.get("오류여부", "") or "성공" in m.get("오류여부", ""))
@@ -1637,14 +2037,49 @@ def batch_process_minwons(minwon_batch, max_workers=None):
     
     return results
 
+def process_minwons_with_queue(queue_path, minwon_list, max_workers=None):
+    """목록 단계 결과를 공유 작업 큐에 넣고 큐가 빌 때까지 상세 정보를 처리하는 함수
+
+    여러 프로세스/호스트가 같은 큐 파일을 쓰면 남은 항목을 나눠 가져가며,
+    큐에 있는 모든 완료 항목(다른 프로세스가 처리한 것 포함)을 반환한다.
+    """
+    from .workqueue import WorkQueue, enqueue_minwons, run_queue_workers
+    
+    if max_workers is None:
+        max_workers = min(os.cpu_count() or 4, 5)  # 최대 5개로 제한 (서버 부하 방지)
+    
+    queue = WorkQueue(queue_path)
+    enqueue_minwons(queue, minwon_list)
+    counts = queue.counts()
+    remaining = counts.get("pending", 0) + counts.get("leased", 0)
+    logger.info(f"작업 큐 상태: 대기 {counts.get('pending', 0)}, 처리 중 {counts.get('leased', 0)}, 완료 {counts.get('done', 0)}, 실패 {counts.get('failed', 0)}")
+    
+    def process(record):
+        result = process_single_minwon(to_record(record))
+        # 워커 풀의 텍스트 분석 결과는 큐에 저장하기 전에 반영
+        resolve_nlp_pending([result])
+        return result
+    
+    progress = tqdm(total=remaining, desc="민원 처리 (작업 큐)") if TQDM_AVAILABLE else None
+    try:
+        processed = run_queue_workers(queue, process, max_workers, progress=progress.update if progress else None)
+    finally:
+        if progress is not None:
+            progress.close()
+    
+    results = [MinwonRecord(result) for result in queue.results()]
+    logger.info(f"작업 큐 처리 완료: 이 프로세스에서 {processed}개 처리, 큐 전체 결과 {len(results)}개")
+    queue.close()
+    return results
+
 # 테스트 URL 함수 추가
 def test_crawling(urls=None):
     """특정 URL에 대한 크롤링 테스트 실행"""
     if urls is None:
         # 기본 테스트 URL 목록
         urls = [
-            "https://www.gov.kr/portal/service/serviceInfo/PTR000050100",  # 일반 페이지
-            "https://www.gov.kr/portal/service/serviceInfo/174100000001"    # 복잡한 구조 페이지 (예시)
+            f"{BASE_URL}/portal/service/serviceInfo/PTR000050100",  # 일반 페이지
+            f"{BASE_URL}/portal/service/serviceInfo/174100000001"    # 복잡한 구조 페이지 (예시)
         ]
     
     logger.info("크롤링 테스트 시작...")
@@ -1672,6 +2107,8 @@ def test_crawling(urls=None):
                 "오류여부": str(e)
             })
     
+    resolve_nlp_pending(results)
+    
     # 테스트 결과 저장
     save_to_csv(results, "테스트결과.csv")
     logger.info(f"테스트 완료: 총 {len(results)}개 URL 처리됨")
@@ -1872,7 +2309,8 @@ class InteractiveCLI:
         current = "활성화" if self.options["nlp"] else "비활성화"
         print(self.colorize(f"현재 텍스트 분석 설정: {current}", Colors.BLUE))
         
-        # 모듈 설치 상태 확인
+        # 모듈 설치 상태 확인 (KoNLPy는 이 시점에 초기화)
+        init_okt()
         nltk_status = "설치됨" if 'NLTK_AVAILABLE' in globals() and NLTK_AVAILABLE else "설치되지 않음"
         konlpy_status = "설치됨" if 'OKT_AVAILABLE' in globals() and OKT_AVAILABLE else "설치되지 않음"
         
@@ -1895,8 +2333,8 @@ class InteractiveCLI:
                 print(self.colorize("✓ 텍스트 분석이 활성화되었습니다.", Colors.GREEN))
                 
                 if not ('OKT_AVAILABLE' in globals() and OKT_AVAILABLE):
-                    print(self.colorize("⚠ KoNLPy가 설치되지 않았거나 JVM을 찾지 못했습니다. 한국어 분석 기능이 제한됩니다.", Colors.WARNING))
-                    print("필요한 패키지:")
+                    print(self.colorize("⚠ KoNLPy가 설치되지 않았거나 JVM을 찾지 못했습니다. JVM이 필요 없는 내장 한국어 분석기를 사용합니다.", Colors.WARNING))
+                    print("Okt를 사용하려면 다음을 설치하세요:")
                     print("1. konlpy 설치: pip install konlpy")
                     print("2. jpype1 설치: pip install jpype1")
                     print("3. Java 설치(Ubuntu): sudo apt install default-jdk")
@@ -2053,13 +2491,32 @@ def run_crawler_with_args(args):
     if not check_playwright_installed():
         logger.warning("Playwright가 설치되지 않았거나 초기화에 실패했습니다. 일부 페이지가 올바르게 수집되지 않을 수 있습니다.")
     
+    # 수집 대상 사이트 변경 (로컬 모의 서버로 부하 테스트 등)
+    if getattr(args, "base_url", None):
+        set_base_url(args.base_url)
+    
     # 테스트 모드 확인
     if args.test:
         print("테스트 모드로 실행합니다.")
         test_crawling()
         return
     
-    base_url = "https://www.gov.kr/search/applyMw?Mcode=11166"
+    base_url = BASE_URL + LIST_PATH
+    
+    # 여러 장비로 나눠 수집 (서비스ID 해시 기준으로 이 샤드 몫만 상세 수집)
+    shard = None
+    if getattr(args, "shard", None):
+        from .shard import parse_shard, shard_filename
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            logger.error(str(e))
+            return
+        logger.info(f"샤드 {shard[0]}/{shard[1]} 수집을 시작합니다.")
+    
+    def result_filename(filename):
+        """샤드 수집이면 샤드 번호를 붙인 결과 파일명"""
+        return shard_filename(filename, *shard) if shard else filename
     
     # 워커 수 설정
     cpu_count = os.cpu_count() or 4
@@ -2067,6 +2524,17 @@ def run_crawler_with_args(args):
     detail_workers = min(5, cpu_count) if args.workers == 0 else args.workers
     batch_size = 30  # 배치 크기 축소 (너무 많은 동시 요청 방지)
     
+    # 목록/상세 단계와 배치가 함께 쓰는 연결 풀을 동시 요청 수에 맞춤
+    transport.set_backend(getattr(args, "http_backend", "requests"))
+    transport.configure_pool(max(page_workers, detail_workers))
+    
+    # 실행 단위 재시도 예산 (작업 수 대비 재시도 비율)
+    retry.reset(getattr(args, "retry_budget", retry.DEFAULT_BUDGET_RATIO))
+    # 호스트/가져오기 방식별 회로 차단기 (장애 시 요청을 멈추고 반열림 시험으로 회복 확인)
+    breaker.configure(getattr(args, "circuit_open_seconds", breaker.DEFAULT_OPEN_SECONDS))
+    # 느린 요청 헤징 (요청 수 대비 추가 요청 비율, 0이면 사용 안 함)
+    hedge.configure(getattr(args, "hedge_budget", hedge.DEFAULT_HEDGE_RATIO), max(page_workers, detail_workers))
+    
     # 통계 정보 초기화
     stats = {
         "총_페이지": 0,
@@ -2078,6 +2546,40 @@ def run_crawler_with_args(args):
     }
     
     processed_minwons = []  # 처리된 민원 목록 초기화
+    checkpoint_journal = None  # 배치 결과를 덧붙이는 체크포인트 저널
+    # 중복 병합 메모리 한도를 넘는 실행은 결과를 메모리에 모으지 않고 저널에서 다시 읽어 저장
+    dedup_memory_limit = getattr(args, "dedup_memory_limit", DEDUP_MEMORY_LIMIT)
+    stream_results = False
+    
+    # 결과 파일 압축 및 가져온 페이지 HTML 보관
+    set_output_compression(getattr(args, "compress", "none"))
+    if getattr(args, "archive_html", False):
+        from .compress import HtmlArchive
+        archive_stamp = time.strftime("%Y%m%d_%H%M%S")
+        archive_path = os.path.join(output_dir, "archive", result_filename(f"pages_{archive_stamp}.jsonl"))
+        set_html_archive(HtmlArchive(archive_path, OUTPUT_COMPRESSION if OUTPUT_COMPRESSION != "none" else "auto"))
+    
+    # 단계별 지표 초기화 및 내보내기 (Prometheus textfile / HTTP 엔드포인트)
+    metrics.registry.reset()
+    metrics_exporter = metrics.MetricsExporter(
+        textfile=getattr(args, "metrics_file", None), port=getattr(args, "metrics_port", 0)
+    ).start()
+    
+    # 파이프라인 구간 기록 (Chrome trace event 파일)
+    if getattr(args, "trace", False):
+        trace_stamp = time.strftime("%Y%m%d_%H%M%S")
+        tracing.start_tracing(os.path.join(output_dir, "trace", f"trace_{trace_stamp}.json"))
+    
+    # 샘플링 프로파일러 (워커 스레드 포함, 종료 시 단계별 프로파일 저장)
+    profiler = None
+    if getattr(args, "profile", False):
+        from .profiler import SamplingProfiler
+        profiler = SamplingProfiler(getattr(args, "profile_interval", 10) / 1000).start()
+    
+    # 텍스트 분석 워커 프로세스 풀 (크롤러 프로세스에서는 JVM을 띄우지 않음)
+    nlp_workers = getattr(args, "nlp_workers", 0)
+    if args.nlp and nlp_workers > 0:
+        start_nlp_pool(nlp_workers)
     
     try:
         # 첫 페이지에서 마지막 페이지 번호 가져오기
@@ -2103,6 +2605,14 @@ def run_crawler_with_args(args):
             logger.info(f"모든 페이지의 민원 목록 수집 중 (병렬 처리: {page_workers}개 워커)...")
             minwon_list = fetch_pages_parallel(base_url, last_page, page_workers)
         
+        logger.info(f"총 {len(minwon_list)}개의 민원 항목이 추출되었습니다.")
+        
+        # 여러 목록/카테고리에 중복 노출된 서비스는 상세 페이지를 한 번만 처리
+        from .dedup import collapse_list_items
+        minwon_list = collapse_list_items(minwon_list)
+        if shard:
+            from .shard import filter_shard
+            minwon_list = filter_shard(minwon_list, *shard)
         stats["총_민원수"] = len(minwon_list)
         logger.info(f"총 {stats['총_민원수']}개의 민원이 추출되었습니다.")
         
@@ -2118,11 +2628,31 @@ def run_crawler_with_args(args):
             minwon_list = minwon_list[:sample_size]
             stats["총_민원수"] = len(minwon_list)
         
-        # 상세 정보 수집
-        batches = [minwon_list[i:i + batch_size] for i in range(0, len(minwon_list), batch_size)]
+        # 상세 정보 수집 - 공유 작업 큐를 쓰면 배치 대신 큐에서 가져가 처리
+        queue_path = getattr(args, "queue", None)
+        if queue_path:
+            set_nlp_enabled(bool(args.nlp and nlp_backend_available()))
+            processed_minwons = process_minwons_with_queue(queue_path, minwon_list, detail_workers)
+            stats["성공"] = sum(1 for m in processed_minwons if "정상" in m.get("오류여부", "") or "성공" in m.get("오류여부", ""))
+            stats["실패"] = len(processed_minwons) - stats["성공"]
+            stats["총_민원수"] = len(processed_minwons)
+            batches = []
+        else:
+            batches = [minwon_list[i:i + batch_size] for i in range(0, len(minwon_list), batch_size)]
+            from .compress import CsvJournal
+            checkpoint_journal = CsvJournal(
+                os.path.join(output_dir, result_filename("정부24_민원_진행상황.csv")), CSV_FIELDNAMES, OUTPUT_COMPRESSION
+            )
+            stream_results = bool(dedup_memory_limit) and len(minwon_list) > dedup_memory_limit
+            if stream_results:
+                logger.info(f"민원 {len(minwon_list)}개가 중복 병합 메모리 한도({dedup_memory_limit}개)를 넘어 "
+                            f"처리 결과를 체크포인트 저널에만 쓰고 마지막에 한 행씩 읽어 저장합니다.")
+                minwon_list = None  # 처리 중인 레코드는 배치 목록에만 남김
         
         # 진행 상황 표시
-        if TQDM_AVAILABLE:
+        if not batches:
+            batch_iter = batches
+        elif TQDM_AVAILABLE:
             batch_iter = tqdm(batches, desc="민원 상세정보 배치 처리")
         else:
             batch_iter = batches
@@ -2133,7 +2663,7 @@ def run_crawler_with_args(args):
                 logger.info(f"배치 {batch_idx}/{len(batches)} 처리 중... (진행률: {batch_idx/len(batches)*100:.1f}%)")
             
             # NLP 활성화 여부에 따라 처리 모드 변경
-            if args.nlp and (OKT_AVAILABLE or NLTK_AVAILABLE):
+            if args.nlp and nlp_backend_available():
                 logger.info("텍스트 분석 기능 활성화 상태로 처리합니다.")
                 # 텍스트 분석이 필요하다는 정보를 global 변수로 설정
                 set_nlp_enabled(True)
@@ -2141,14 +2671,18 @@ def run_crawler_with_args(args):
                 # 명시적으로 NLP 비활성화
                 set_nlp_enabled(False)
             
-            batch_results = batch_process_minwons(batch, detail_workers)
-            processed_minwons.extend(batch_results)
+            with tracing.span("batch", cat="batch", index=batch_idx, size=len(batch)):
+                batch_results = batch_process_minwons(batch, detail_workers)
+            if not stream_results:
+                processed_minwons.extend(batch_results)
             
             # 진행 상황 통계 업데이트
             success_count = sum(1 for m in batch_results if "정상" in m.get("오류여부", "") or "성공" in m.get("오류여부", ""))
             fail_count = len(batch_results) - success_count
             stats["성공"] += success_count
             stats["실패"] += fail_count
+            metrics.inc("hanolcare_records_total", success_count, result="success")
+            metrics.inc("hanolcare_records_total", fail_count, result="fail")
             
             # 중간 진행 상황 출력
             current_time = time.time()
@@ -2156,31 +2690,60 @@ def run_crawler_with_args(args):
             if not TQDM_AVAILABLE:
                 logger.info(f"진행 상황: 성공 {stats['성공']}건, 실패 {stats['실패']}건, 경과시간: {elapsed/60:.1f}분")
             
-            # 중간 결과 저장 (배치당 한 번) - 매번 같은 파일에 덮어씀
-            if batch_idx % 2 == 0 or batch_idx == len(batches):
-                checkpoint_file = "정부24_민원_진행상황.csv"  # 고정된 파일명 사용
-                save_checkpoint(processed_minwons, checkpoint_file, output_dir)
+            # 중간 결과 저장 - 배치마다 새 결과만 저널에 덧붙임 (중단되어도 마지막 배치까지 읽을 수 있음)
+            append_checkpoint(checkpoint_journal, batch_results)
+            if stream_results:
+                # 저널에 쓴 배치의 레코드는 놓아줌 (메모리에는 처리 중인 배치만 남음)
+                batches[batch_idx - 1] = None
         
         # 최종 통계 계산
         stats["처리시간"] = time.time() - stats["시작시간"]
         
-        # 중복 민원 필터링 중...
-        if processed_minwons:
+        output_file = result_filename("정부24_민원목록.csv")
+        error_file = result_filename("정부24_민원목록_오류.csv")
+        near_dup_threshold = getattr(args, "near_dup_threshold", 0.0)
+        keyword_top_k = getattr(args, "keywords", 10)
+        
+        if stream_results:
+            # 저널을 한 행씩 읽어 디스크 분할 중복 병합 후 결과/오류 CSV로 바로 저장
+            # 유사 중복 병합과 TF-IDF 키워드는 전체 민원을 메모리에 올려야 하므로 건너뜀
+            if near_dup_threshold > 0 or keyword_top_k > 0:
+                logger.warning(f"중복 병합 메모리 한도({dedup_memory_limit}개)를 넘어 유사 중복 병합과 TF-IDF 키워드 추출을 "
+                               f"건너뜁니다. (필요하면 --dedup-memory-limit를 늘려 실행)")
             logger.info("중복 민원 필터링 중...")
-            processed_minwons = filter_duplicate_minwons(processed_minwons)
-            logger.info(f"필터링 후 총 {len(processed_minwons)}개 민원 항목 남음")
-        
-        # 결과 저장 - 항상 같은 파일명 사용
-        output_file = "정부24_민원목록.csv"
-        save_to_csv(processed_minwons, output_file, output_dir)
-        logger.info(f"모든 민원 데이터가 저장되었습니다: {os.path.join(output_dir, output_file)}")
-        
-        # 오류 목록 별도 저장 - 항상 같은 파일명 사용
-        error_items = [m for m in processed_minwons if "정상" not in m.get("오류여부", "") and "성공" not in m.get("오류여부", "")]
-        if error_items:
-            error_file = "정부24_민원목록_오류.csv"
-            save_to_csv(error_items, error_file, output_dir)
-            logger.info(f"오류 항목 {len(error_items)}개를 별도 저장했습니다: {os.path.join(output_dir, error_file)}")
+            checkpoint_journal.close()
+            rows = iter_from_csv(checkpoint_journal.path)
+            output_path, _, unique_count, _ = save_streamed_results(
+                iter_unique_minwons(spill_deduplicator(rows, dedup_memory_limit)), output_file, error_file, output_dir
+            )
+            logger.info(f"필터링 후 총 {unique_count}개 민원 항목 남음")
+            logger.info(f"모든 민원 데이터가 저장되었습니다: {output_path}")
+        else:
+            # 중복 민원 필터링 중...
+            if processed_minwons:
+                logger.info("중복 민원 필터링 중...")
+                processed_minwons = filter_duplicate_minwons(processed_minwons, dedup_memory_limit)
+            
+                # 공백/접미어/부서 표기만 다른 유사 중복 병합 (MinHash + LSH)
+                if near_dup_threshold > 0:
+                    from .dedup import filter_near_duplicate_minwons
+                    processed_minwons = filter_near_duplicate_minwons(processed_minwons, near_dup_threshold)
+                logger.info(f"필터링 후 총 {len(processed_minwons)}개 민원 항목 남음")
+        
+            # 전체 민원 기준 TF-IDF 키워드 추출 (민원별 NLP보다 저렴하고 상투어에 강함)
+            if processed_minwons and keyword_top_k > 0:
+                from .keywords import apply_corpus_keywords
+                apply_corpus_keywords(processed_minwons, keyword_top_k)
+        
+            # 결과 저장 - 항상 같은 파일명 사용
+            output_path = save_to_csv(processed_minwons, output_file, output_dir)
+            logger.info(f"모든 민원 데이터가 저장되었습니다: {output_path}")
+        
+            # 오류 목록 별도 저장 - 항상 같은 파일명 사용
+            error_items = [m for m in processed_minwons if "정상" not in m.get("오류여부", "") and "성공" not in m.get("오류여부", "")]
+            if error_items:
+                error_path = save_to_csv(error_items, error_file, output_dir)
+                logger.info(f"오류 항목 {len(error_items)}개를 별도 저장했습니다: {error_path}")
         
         # 최종 통계 출력
         logger.info("=" * 50)
@@ -2198,14 +2761,17 @@ def run_crawler_with_args(args):
         
         # 현재까지의 결과 저장 - 고정된 파일명 사용
         if processed_minwons:
-            interrupt_file = "정부24_민원목록_중단됨.csv"
-            save_to_csv(processed_minwons, interrupt_file, output_dir)
-            logger.info(f"중단 시점까지의 {len(processed_minwons)}개 결과를 저장했습니다: {os.path.join(output_dir, interrupt_file)}")
+            interrupt_file = result_filename("정부24_민원목록_중단됨.csv")
+            interrupt_path = save_to_csv(processed_minwons, interrupt_file, output_dir)
+            logger.info(f"중단 시점까지의 {len(processed_minwons)}개 결과를 저장했습니다: {interrupt_path}")
+        elif stream_results:
+            logger.info(f"중단 시점까지의 {checkpoint_journal.rows}개 결과는 체크포인트 저널에 있습니다: {checkpoint_journal.path}")
         
         # 중단 시점의 통계 출력
+        processed_count = checkpoint_journal.rows if stream_results else len(processed_minwons)
         logger.info("=" * 50)
         logger.info("작업 중단 통계")
-        logger.info(f"처리된 민원: {len(processed_minwons)}/{stats['총_민원수']}건 ({len(processed_minwons)/stats['총_민원수']*100 if stats['총_민원수'] else 0:.1f}%)")
+        logger.info(f"처리된 민원: {processed_count}/{stats['총_민원수']}건 ({processed_count/stats['총_민원수']*100 if stats['총_민원수'] else 0:.1f}%)")
         logger.info(f"경과 시간: {elapsed/60:.1f}분")
         logger.info("=" * 50)
     except Exception as e:
@@ -2214,46 +2780,85 @@ def run_crawler_with_args(args):
         
         # 현재까지의 결과 저장 - 고정된 파일명 사용
         if processed_minwons:
-            error_file = "정부24_민원목록_오류발생.csv"
-            save_to_csv(processed_minwons, error_file, output_dir)
-            logger.info(f"오류 발생 시점까지의 {len(processed_minwons)}개 결과를 저장했습니다: {os.path.join(output_dir, error_file)}")
+            error_file = result_filename("정부24_민원목록_오류발생.csv")
+            error_path = save_to_csv(processed_minwons, error_file, output_dir)
+            logger.info(f"오류 발생 시점까지의 {len(processed_minwons)}개 결과를 저장했습니다: {error_path}")
+        elif stream_results:
+            logger.info(f"오류 발생 시점까지의 {checkpoint_journal.rows}개 결과는 체크포인트 저널에 있습니다: {checkpoint_journal.path}")
         
         # 스택 트레이스 출력
         logger.error("상세 오류 정보:")
         logger.error(traceback.format_exc())
+    finally:
+        stop_nlp_pool()
+        transport.shutdown_executor()
+        hedge.shutdown()
+        transport.close_transport()
+        if checkpoint_journal is not None:
+            checkpoint_journal.close()
+        if html_archive is not None:
+            html_archive.close()
+            set_html_archive(None)
+        metrics_exporter.stop()
+        metrics.log_summary()
+        tracing.stop_tracing()
+        if profiler is not None:
+            from .profiler import log_summary as log_profile_summary
+            profiler.stop()
+            log_profile_summary(profiler)
+            speedscope_path, folded_path = profiler.save(os.path.join(output_dir, "profile"))
+            logger.info(f"프로파일 저장: {speedscope_path}, {folded_path}")
+
+# 중복 민원 병합 규칙
+def merge_minwon(existing, minwon):
+    """중복으로 판정된 민원 정보를 기존 항목에 병합하는 함수"""
+    # 일련번호 목록 유지
+    tp_seq_list = set([existing.get('일련번호', ''), minwon.get('일련번호', '')])
+    tp_seq_list.discard('')  # 빈 값 제거
+    existing['일련번호'] = ', '.join(tp_seq_list)
+    
+    # 링크 정보가 다르면 추가 정보로 저장
+    if existing.get('링크') != minwon.get('링크') and minwon.get('링크'):
+        existing['연관민원'] = existing.get('연관민원', '') + f" | {minwon.get('링크')}"
+    
+    # 더 상세한 설명 선택
+    if len(minwon.get('설명', '')) > len(existing.get('설명', '')):
+        existing['설명'] = minwon.get('설명', '')
+    
+    # 추가 정보 병합 (비어있는 필드 채우기)
+    for field in ['처리절차', '신청방법', '필요서류', '수수료']:
+        if not existing.get(field) and minwon.get(field):
+            existing[field] = minwon.get(field)
+    return existing
+
+# 중복 병합을 메모리에서 처리하는 최대 레코드 수 (넘으면 디스크로 나눠 병합, 0=항상 메모리)
+DEDUP_MEMORY_LIMIT = 50000
+
+def minwon_dedup_key(minwon):
+    """중복 판정 키 (민원명과 담당부서)"""
+    return f"{minwon.get('민원명', '')}_{minwon.get('담당부서', '')}"
 
 # 중복 민원 필터링 함수 추가
-def filter_duplicate_minwons(minwon_list):
-    """유사한 민원을 식별하고 병합하는 함수"""
+def filter_duplicate_minwons(minwon_list, max_in_memory=DEDUP_MEMORY_LIMIT):
+    """유사한 민원을 식별하고 병합하는 함수
+
+    레코드가 max_in_memory개를 넘거나 생성기로 들어오면 키 해시로 디스크에 나눠 병합하므로
+    메모리 사용량이 레코드 수와 관계없이 유지된다 (spill.SpillDeduplicator).
+    """
+    if max_in_memory and (not hasattr(minwon_list, '__len__') or len(minwon_list) > max_in_memory):
+        return list(iter_unique_minwons(spill_deduplicator(minwon_list, max_in_memory)))
+    
     unique_minwons = {}
     duplicates_count = 0
     
     for minwon in minwon_list:
         # 민원명과 담당부서로 고유 키 생성
-        key = f"{minwon.get('민원명', '')}_{minwon.get('담당부서', '')}"
+        key = minwon_dedup_key(minwon)
         
         if key in unique_minwons:
             # 기존 항목이 있으면 일련번호와 링크 정보 병합
             duplicates_count += 1
-            existing = unique_minwons[key]
-            
-            # 일련번호 목록 유지
-            tp_seq_list = set([existing.get('일련번호', ''), minwon.get('일련번호', '')])
-            tp_seq_list.discard('')  # 빈 값 제거
-            existing['일련번호'] = ', '.join(tp_seq_list)
-            
-            # 링크 정보가 다르면 추가 정보로 저장
-            if existing.get('링크') != minwon.get('링크') and minwon.get('링크'):
-                existing['연관민원'] = existing.get('연관민원', '') + f" | {minwon.get('링크')}"
-            
-            # 더 상세한 설명 선택
-            if len(minwon.get('설명', '')) > len(existing.get('설명', '')):
-                existing['설명'] = minwon.get('설명', '')
-            
-            # 추가 정보 병합 (비어있는 필드 채우기)
-            for field in ['처리절차', '신청방법', '필요서류', '수수료']:
-                if not existing.get(field) and minwon.get(field):
-                    existing[field] = minwon.get(field)
+            merge_minwon(unique_minwons[key], minwon)
         else:
             # 새로운 항목 추가
             unique_minwons[key] = minwon
@@ -2261,6 +2866,66 @@ def filter_duplicate_minwons(minwon_list):
     logger.info(f"중복 필터링: {duplicates_count}개 중복 항목 검출, {len(unique_minwons)}개 고유 항목 유지")
     return list(unique_minwons.values())
 
+def spill_deduplicator(minwon_iter, max_in_memory=DEDUP_MEMORY_LIMIT):
+    """민원을 모두 넣은 디스크 분할 중복 병합기 (max_in_memory개를 넘으면 디스크로 내려 둠)
+
+    넘었는지는 deduplicator.spilled로 확인하고, 결과는 iter_unique_minwons로 읽는다.
+    """
+    from .spill import SpillDeduplicator
+    deduplicator = SpillDeduplicator(minwon_dedup_key, merge_minwon, max_in_memory)
+    try:
+        deduplicator.extend(minwon_iter)
+    except BaseException:
+        deduplicator.close()
+        raise
+    return deduplicator
+
+def iter_unique_minwons(deduplicator):
+    """중복 병합기의 고유 민원을 첫 등장 순서대로 하나씩 반환 (다 읽으면 임시 파일 정리)"""
+    with deduplicator:
+        yield from deduplicator
+    logger.info(f"중복 필터링: {deduplicator.duplicates}개 중복 항목 검출, {deduplicator.unique}개 고유 항목 유지")
+
+def save_streamed_results(minwon_iter, filename, error_filename, output_dir, compression=None):
+    """민원을 하나씩 결과 CSV에 쓰고 오류 항목은 오류 CSV에 함께 씀 (목록을 메모리에 모으지 않음)
+
+    (결과 경로, 오류 경로 - 오류가 없으면 None, 전체 수, 오류 수)를 반환한다.
+    """
+    from .compress import FramedWriter, compressed_path, compression_of
+    
+    os.makedirs(output_dir, exist_ok=True)
+    compression = compression_of(filename) or compression or OUTPUT_COMPRESSION
+    file_path = compressed_path(os.path.join(output_dir, filename), compression)
+    error_path = None
+    error_file = None
+    total = errors = 0
+    
+    try:
+        with metrics.timer("write"), FramedWriter(file_path, compression, encoding='utf-8-sig') as csvfile:
+            writer = csv.DictWriter(csvfile, fieldnames=CSV_FIELDNAMES)
+            writer.writeheader()
+            for minwon in minwon_iter:
+                row = {k: minwon.get(k, "") for k in CSV_FIELDNAMES}
+                writer.writerow(row)
+                total += 1
+                if "정상" in row["오류여부"] or "성공" in row["오류여부"]:
+                    continue
+                if error_file is None:
+                    # 오류 파일은 첫 오류 항목이 나올 때 생성 (save_to_csv와 같이 오류가 없으면 만들지 않음)
+                    error_path = compressed_path(os.path.join(output_dir, error_filename), compression)
+                    error_file = FramedWriter(error_path, compression, encoding='utf-8-sig')
+                    error_writer = csv.DictWriter(error_file, fieldnames=CSV_FIELDNAMES)
+                    error_writer.writeheader()
+                error_writer.writerow(row)
+                errors += 1
+    finally:
+        if error_file is not None:
+            error_file.close()
+    
+    logger.info(f"CSV 파일이 저장되었습니다: {file_path} ({total}개 항목)")
+    if error_path:
+        logger.info(f"오류 항목 {errors}개를 별도 저장했습니다: {error_path}")
+    return file_path, error_path, total, errors
 
 
 def main():
@@ -2272,10 +2937,39 @@ def main():
     parser.add_argument("--page", type=int, default=0, help="특정 페이지만 크롤링 (0=전체)")
     parser.add_argument("--workers", type=int, default=0, help="병렬 처리에 사용할 워커 수 (0=자동)")
     parser.add_argument("--nlp", action="store_true", help="텍스트 분석 강화 모드 사용")
+    parser.add_argument("--nlp-backend", choices=NLP_BACKENDS, default="auto", help="한국어 분석 백엔드 (auto=Okt 우선, builtin=JVM 없는 내장 분석기)")
+    parser.add_argument("--nlp-workers", type=int, default=0, help="텍스트 분석 전용 프로세스 수 (0=크롤러 프로세스에서 분석, 1 이상이면 결과를 기다리지 않고 배치 종료 후 반영)")
+    parser.add_argument("--keywords", type=int, default=10, help="수집 후 민원별 TF-IDF 키워드 수 (0=사용 안 함)")
+    parser.add_argument("--near-dup-threshold", type=float, default=0.0, help="유사 중복 병합 유사도 임계값 (0~1, 기본값 0=사용 안 함, 예: 0.9)")
+    parser.add_argument("--dedup-memory-limit", type=int, default=DEDUP_MEMORY_LIMIT, help=f"중복 병합을 메모리에서 처리할 최대 레코드 수, 넘으면 결과를 메모리에 모으지 않고 디스크로 나눠 병합해 바로 저장 - 유사 중복 병합/키워드 추출은 건너뜀 (0=항상 메모리, 기본값: {DEDUP_MEMORY_LIMIT})")
+    parser.add_argument("--compress", choices=("none", "auto", "gzip", "zstd"), default="none", help="결과/오류 CSV와 체크포인트 저널 압축 (auto=zstd, 없으면 gzip)")
+    parser.add_argument("--archive-html", action="store_true", help="가져온 페이지 HTML을 출력 디렉토리/archive에 압축 JSON Lines로 보관")
+    parser.add_argument("--http-backend", choices=transport.BACKENDS, default="requests", help="HTTP 클라이언트 (httpx=HTTP/2 지원, httpx[http2] 필요)")
+    parser.add_argument("--retry-budget", type=float, default=retry.DEFAULT_BUDGET_RATIO, help=f"실행 단위 재시도 예산 - 작업 수 대비 허용 재시도 비율 (기본값: {retry.DEFAULT_BUDGET_RATIO}, 최소 {retry.DEFAULT_MIN_RETRIES}회)")
+    parser.add_argument("--circuit-open-seconds", type=float, default=breaker.DEFAULT_OPEN_SECONDS, help=f"실패가 이어져 회로가 열렸을 때 요청을 멈추는 시간, 초 (0=회로 차단기 사용 안 함, 기본값: {breaker.DEFAULT_OPEN_SECONDS:.0f})")
+    parser.add_argument("--hedge-budget", type=float, default=hedge.DEFAULT_HEDGE_RATIO, help="경로별 p95보다 느린 요청을 한 번 더 보내는 헤징의 예산 - 요청 수 대비 추가 요청 비율 (예: 0.05, 기본값: 0=사용 안 함)")
+    parser.add_argument("--base-url", default=None, help="수집 대상 사이트 주소 (기본값: https://www.gov.kr, 로컬 모의 서버 테스트용)")
+    parser.add_argument("--metrics-file", default=None, help="단계별 지표를 Prometheus 텍스트 형식으로 주기적으로 저장할 파일 (node_exporter textfile collector용)")
+    parser.add_argument("--metrics-port", type=int, default=0, help="수집 중 /metrics HTTP 엔드포인트 포트 (0=사용 안 함)")
+    parser.add_argument("--profile", action="store_true", help="수집 중 샘플링 프로파일러 실행 (출력 디렉토리/profile에 speedscope/접힌 스택 파일 저장)")
+    parser.add_argument("--profile-interval", type=float, default=10, help="프로파일 샘플링 간격 (ms, 기본값: 10)")
+    parser.add_argument("--trace", action="store_true", help="파이프라인 구간을 Chrome trace 파일로 기록 (출력 디렉토리/trace)")
+    parser.add_argument("--shard", default=None, help="i/N 형식으로 N개 중 i번째(0부터) 샤드만 상세 수집 (서비스ID 해시 기준)")
+    parser.add_argument("--merge", nargs="+", metavar="PATH", help="샤드 결과 디렉토리/파일을 병합하여 --output에 저장 (수집하지 않음)")
+    parser.add_argument("--queue", default=None, metavar="PATH", help="SQLite 공유 작업 큐 파일 (여러 프로세스/호스트가 같은 큐에서 민원을 나눠 처리)")
     parser.add_argument("--cli", action="store_true", help="대화형 CLI 모드로 실행")
     parser.add_argument("--auto", action="store_true", help="비대화형 자동 실행 모드 (GitHub Actions용)")
     args = parser.parse_args()
     
+    set_nlp_backend(args.nlp_backend)
+    
+    # 샤드 결과 병합 모드
+    if args.merge:
+        set_output_compression(args.compress)
+        from .shard import merge_shard_results
+        merge_shard_results(args.merge, args.output, args.near_dup_threshold, args.keywords, args.dedup_memory_limit)
+        return
+    
     # 자동 실행 모드가 활성화된 경우 (GitHub Actions 등)
     if args.auto:
         logger.info("자동 실행 모드로 크롤링을 시작합니다 (비대화형)")
@@ -0,0 +1,243 @@
+"""
+MinHash + LSH 기반 유사 중복 민원 검출
+
+filter_duplicate_minwons는 "민원명_담당부서" 키가 정확히 같은 항목만 병합한다.
+공백, 접미어, 부서 표기만 다른 거의 같은 서비스를 찾기 위해 민원명/설명/처리절차
+텍스트의 문자 n-gram 집합을 MinHash 서명으로 요약하고, LSH 밴드 버킷으로 후보
+쌍만 비교한다. 전체 쌍 비교(O(n²)) 없이 10만 건 이상에서도 동작한다.
+
+서비스ID가 서로 다른(둘 다 비어 있지 않은) 민원은 텍스트가 거의 같아도 별개의 서비스이므로
+병합하지 않는다 (예: 지역만 다른 같은 이름의 지원 사업).
+"""
+import logging
+import re
+import zlib
+from collections import defaultdict
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# 유사도 비교에 사용할 필드
+NEAR_DUP_FIELDS = ("민원명", "설명", "처리절차")
+# 값이 다르면 병합하지 않는 식별자 필드
+SERVICE_ID_FIELD = "서비스ID"
+
+# MinHash 해시 함수 개수와 문자 n-gram 크기
+NUM_PERM = 128
+SHINGLE_SIZE = 3
+
+# multiply-shift 해싱: (a*x + b) mod 2^64 의 상위 32비트
+_MASK64 = (1 << 64) - 1
+
+_NORMALIZE_RE = re.compile(r'[\s\W_]+')
+
+
+def _normalize(text):
+    """공백/구두점 차이를 없앤 비교용 텍스트"""
+    return _NORMALIZE_RE.sub('', (text or '').lower())
+
+
+def shingles(record, fields=NEAR_DUP_FIELDS, size=SHINGLE_SIZE):
+    """레코드 텍스트의 문자 n-gram 해시 집합"""
+    result = set()
+    for field in fields:
+        text = _normalize(record.get(field))
+        if not text:
+            continue
+        # 필드 경계를 넘는 n-gram이 생기지 않도록 필드별로 계산
+        prefix = field.encode('utf-8')
+        if len(text) < size:
+            result.add(zlib.crc32(prefix + text.encode('utf-8')))
+            continue
+        for i in range(len(text) - size + 1):
+            result.add(zlib.crc32(prefix + text[i:i + size].encode('utf-8')))
+    return result
+
+
+class MinHasher:
+    """고정된 해시 함수 집합으로 MinHash 서명 계산"""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        import random
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.a = [rng.getrandbits(64) | 1 for _ in range(num_perm)]  # 홀수 계수
+        self.b = [rng.getrandbits(64) for _ in range(num_perm)]
+        if NUMPY_AVAILABLE:
+            self._a = np.array(self.a, dtype=np.uint64)
+            self._b = np.array(self.b, dtype=np.uint64)
+
+    def signature(self, hashes):
+        """해시 집합의 MinHash 서명 (튜플)"""
+        if not hashes:
+            return None
+        if NUMPY_AVAILABLE:
+            values = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+            # uint64 연산은 2^64에서 자연스럽게 순환한다
+            permuted = (self._a[:, None] * values[None, :] + self._b[:, None]) >> np.uint64(32)
+            return tuple(permuted.min(axis=1).tolist())
+        return tuple(
+            min(((a * h + b) & _MASK64) >> 32 for h in hashes)
+            for a, b in zip(self.a, self.b)
+        )
+
+
+def optimal_bands(threshold, num_perm=NUM_PERM):
+    """유사도 임계값에 가장 가까운 S-곡선 변곡점을 주는 (밴드 수, 밴드당 행 수)"""
+    best = (num_perm, 1)
+    best_error = float('inf')
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if bands < 1:
+            break
+        error = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+def estimated_similarity(sig1, sig2):
+    """두 MinHash 서명의 자카드 유사도 추정치"""
+    return sum(1 for x, y in zip(sig1, sig2) if x == y) / len(sig1)
+
+
+class _UnionFind:
+    """그룹마다 서비스ID를 하나만 허용하는 union-find (ids[i]는 i번 항목의 서비스ID 또는 빈 값)"""
+
+    def __init__(self, ids):
+        self.parent = list(range(len(ids)))
+        self.ids = list(ids)  # 대표 항목 기준 그룹의 서비스ID
+
+    def find(self, x):
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def can_union(self, x, y):
+        """두 항목의 그룹을 합쳐도 서로 다른 서비스ID가 섞이지 않는지"""
+        id_x, id_y = self.ids[self.find(x)], self.ids[self.find(y)]
+        return not id_x or not id_y or id_x == id_y
+
+    def union(self, x, y):
+        rx, ry = self.find(x), self.find(y)
+        if rx != ry:
+            # 먼저 등장한 항목을 대표로 유지
+            if rx > ry:
+                rx, ry = ry, rx
+            self.parent[ry] = rx
+            self.ids[rx] = self.ids[rx] or self.ids[ry]
+
+
+def find_near_duplicates(records, threshold=0.85, num_perm=NUM_PERM):
+    """유사 중복 그룹 목록 반환 (각 그룹은 레코드 인덱스 목록, 첫 원소가 대표)
+
+    서비스ID가 서로 다른 레코드는 같은 그룹에 넣지 않는다.
+    """
+    hasher = MinHasher(num_perm)
+    bands, rows = optimal_bands(threshold, num_perm)
+    signatures = [hasher.signature(shingles(record)) for record in records]
+
+    union_find = _UnionFind([(record.get(SERVICE_ID_FIELD) or "").strip() for record in records])
+    buckets = defaultdict(list)
+    comparisons = 0
+    for index, signature in enumerate(signatures):
+        if signature is None:
+            continue
+        compared = set()
+        for band in range(bands):
+            key = (band, signature[band * rows:(band + 1) * rows])
+            bucket = buckets[key]
+            # 버킷의 모든 항목과 비교 (대표 항목과는 다르지만 다른 항목과 같은 경우도 찾음)
+            # 이미 같은 그룹이거나 다른 밴드에서 비교한 항목은 건너뜀
+            for other in bucket:
+                if other in compared or union_find.find(other) == union_find.find(index):
+                    continue
+                compared.add(other)
+                comparisons += 1
+                if (estimated_similarity(signatures[other], signature) >= threshold
+                        and union_find.can_union(other, index)):
+                    union_find.union(other, index)
+            bucket.append(index)
+
+    groups = defaultdict(list)
+    for index in range(len(records)):
+        groups[union_find.find(index)].append(index)
+    logger.info(f"LSH 후보 비교 {comparisons}회 (밴드 {bands} x 행 {rows}, 임계값 {threshold})")
+    return [members for members in groups.values() if len(members) > 1]
+
+
+def filter_near_duplicate_minwons(minwon_list, threshold=0.85, num_perm=NUM_PERM):
+    """유사 중복 민원을 기존 병합 규칙(merge_minwon)으로 병합하는 함수"""
+    from .crawler import merge_minwon
+
+    if len(minwon_list) < 2:
+        return minwon_list
+
+    merged_away = set()
+    for members in find_near_duplicates(minwon_list, threshold, num_perm):
+        representative = minwon_list[members[0]]
+        for index in members[1:]:
+            merge_minwon(representative, minwon_list[index])
+            merged_away.add(index)
+
+    result = [minwon for index, minwon in enumerate(minwon_list) if index not in merged_away]
+    logger.info(f"유사 중복 필터링: {len(merged_away)}개 유사 항목 병합, {len(result)}개 항목 유지")
+    return result
+
+
+def _join_unique(*values):
+    """쉼표로 구분된 값들을 순서를 유지하며 중복 없이 합침"""
+    seen = []
+    for value in values:
+        for part in (value or "").split(","):
+            part = part.strip()
+            if part and part not in seen:
+                seen.append(part)
+    return ", ".join(seen)
+
+
+def collapse_list_items(minwon_list):
+    """상세 페이지를 가져오기 전에 같은 서비스ID/링크의 목록 항목을 하나로 합치는 함수
+
+    여러 목록 페이지나 카테고리에 중복 노출된 서비스의 상세 페이지를 한 번만
+    가져오도록 한다. 합쳐진 항목에는 각 노출 위치의 일련번호와 카테고리를 모두 남긴다.
+    """
+    from .crawler import canonical_url
+
+    by_id = {}
+    by_link = {}
+    collapsed = []
+    duplicates_count = 0
+
+    for minwon in minwon_list:
+        service_id = (minwon.get("서비스ID") or "").strip()
+        link = canonical_url(minwon.get("링크"))
+        existing = by_id.get(service_id) if service_id else None
+        if existing is None and link:
+            existing = by_link.get(link)
+
+        if existing is None:
+            collapsed.append(minwon)
+            existing = minwon
+        else:
+            duplicates_count += 1
+            existing["일련번호"] = _join_unique(existing.get("일련번호"), minwon.get("일련번호"))
+            existing["카테고리"] = _join_unique(existing.get("카테고리"), minwon.get("카테고리"))
+            # 목록 단계 정보 중 비어 있는 값 채우기
+            for key, value in minwon.items():
+                if value and not existing.get(key):
+                    existing[key] = value
+
+        if service_id:
+            by_id.setdefault(service_id, existing)
+        if link:
+            by_link.setdefault(link, existing)
+
+    logger.info(f"목록 단계 중복 제거: {duplicates_count}개 중복 노출 항목 병합, {len(collapsed)}개 상세 페이지 처리 예정")
+    return collapsed
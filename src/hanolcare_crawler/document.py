@@ -0,0 +1,232 @@
+"""
+페이지 단위 텍스트 뷰와 인덱스
+
+extract_detail_info의 대체 추출 경로는 키워드마다 soup.find_all(['p','div','li'])를
+돌며 paragraph.text를 다시 만든다. 중첩된 div에서는 .text 자체가 하위 트리 크기에
+비례하므로 패턴 × 노드 × 깊이 만큼 비용이 든다.
+
+PageTextIndex는 문서를 한 번만 순회하여 전체 텍스트와 블록 요소별 텍스트 구간
+(시작/끝 오프셋)을 기록한다. 키워드 조회는 전체 텍스트에서 등장 위치를 찾은 뒤
+해당 위치를 포함하는 블록을 구간으로 역추적하며, 결과는 키워드별로 캐시된다.
+
+PageDocument는 페이지 하나에 대한 전체 텍스트, 공백 구분 텍스트, 요소별 텍스트와
+clean_text 결과를 한 번만 계산해 두는 래퍼로, 추출 함수들이 soup.get_text()나
+element.text를 반복해서 다시 만들지 않도록 한다.
+"""
+import bisect
+
+from bs4 import CData, NavigableString, Tag
+
+# 대체 추출에서 문단으로 취급하는 블록 요소
+BLOCK_TAGS = ('p', 'div', 'li')
+
+# get_text()/.text에 포함되는 문자열 타입 (주석, 스크립트 등 제외)
+_TEXT_TYPES = (NavigableString, CData)
+
+
+class PageTextIndex:
+    """블록 요소 텍스트 구간과 키워드 → 블록 역색인"""
+
+    def __init__(self, soup, block_tags=BLOCK_TAGS):
+        self.soup = soup
+        self.block_tags = set(block_tags)
+        self._built = False
+        self._term_blocks = {}
+
+    def _build(self):
+        """문서를 한 번 순회하여 전체 텍스트와 블록 구간을 계산"""
+        parts = []
+        offset = 0
+        string_starts = []   # 문자열 노드 시작 오프셋
+        strings = []         # 문자열 노드
+        blocks = []          # [요소, 시작, 끝, 상위 블록 번호]
+        open_blocks = []     # 현재 열려 있는 블록 번호 스택
+
+        stack = [(self.soup, iter(self.soup.contents), None)]
+        while stack:
+            node, children, block_id = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if block_id is not None:
+                    blocks[block_id][2] = offset
+                    open_blocks.pop()
+                continue
+            if isinstance(child, Tag):
+                child_block = None
+                if child.name in self.block_tags:
+                    child_block = len(blocks)
+                    parent_block = open_blocks[-1] if open_blocks else None
+                    blocks.append([child, offset, offset, parent_block])
+                    open_blocks.append(child_block)
+                stack.append((child, iter(child.contents), child_block))
+            elif type(child) in _TEXT_TYPES:
+                text = str(child)
+                if text:
+                    string_starts.append(offset)
+                    strings.append(child)
+                    parts.append(text)
+                    offset += len(text)
+
+        self._text = ''.join(parts)
+        self._string_starts = string_starts
+        self._strings = strings
+        self._blocks = blocks
+        self._block_starts = [block[1] for block in blocks]
+        self._built = True
+
+    @property
+    def text(self):
+        """문서 전체 텍스트 (soup.get_text()와 동일)"""
+        if not self._built:
+            self._build()
+        return self._text
+
+    def block_text(self, block_id):
+        """블록 요소의 하위 트리 텍스트 (element.text와 동일)"""
+        _, start, end, _ = self._blocks[block_id]
+        return self._text[start:end]
+
+    def _occurrences(self, term):
+        """전체 텍스트에서 term의 모든 시작 위치"""
+        text = self.text
+        positions = []
+        pos = text.find(term)
+        while pos != -1:
+            positions.append(pos)
+            pos = text.find(term, pos + 1)
+        return positions
+
+    def blocks_containing(self, term):
+        """term을 텍스트에 포함하는 블록 번호 목록 (문서 순서)"""
+        cached = self._term_blocks.get(term)
+        if cached is not None:
+            return cached
+
+        found = set()
+        end_needed = len(term)
+        for pos in self._occurrences(term):
+            # pos 이전에 시작한 마지막 블록에서 상위로 올라가며 구간 확인
+            block_id = bisect.bisect_right(self._block_starts, pos) - 1
+            while block_id is not None and block_id >= 0:
+                _, start, end, parent = self._blocks[block_id]
+                if start <= pos and pos + end_needed <= end:
+                    if block_id in found:
+                        break  # 상위 블록은 이미 모두 추가됨
+                    found.add(block_id)
+                block_id = parent
+
+        result = sorted(found)
+        self._term_blocks[term] = result
+        return result
+
+    def find_blocks(self, term):
+        """term을 포함하는 (요소, 텍스트) 목록 - find_all(BLOCK_TAGS) + 'term in el.text'와 동일"""
+        return [(self._blocks[i][0], self.block_text(i)) for i in self.blocks_containing(term)]
+
+    def first_string_containing(self, term):
+        """term을 포함하는 첫 번째 문자열 노드 - soup.find(string=lambda t: term in t)와 같되,
+        get_text()처럼 스크립트/스타일/주석 문자열은 보지 않음 (페이지에 보이는 텍스트만)"""
+        text = self.text
+        pos = text.find(term)
+        while pos != -1:
+            index = bisect.bisect_right(self._string_starts, pos) - 1
+            if index >= 0:
+                start = self._string_starts[index]
+                if pos + len(term) <= start + len(self._strings[index]):
+                    return self._strings[index]
+                # 문자열 경계에 걸친 등장은 건너뛰고 다음 문자열부터 검색
+                pos = text.find(term, start + len(self._strings[index]))
+            else:
+                pos = text.find(term, pos + 1)
+        return None
+
+
+class SiblingGroup:
+    """연속한 형제 요소들을 새 컨테이너로 옮기거나 복사하지 않고 하나처럼 검색하는 뷰
+
+    find_all은 요소들을 담은 div.find_all과 같은 순서(요소 자신, 그 하위 요소 순)로
+    결과를 돌려준다. 이름과 class_ 조건만 지원한다.
+    """
+
+    __slots__ = ("elements",)
+
+    def __init__(self, elements):
+        self.elements = list(elements)
+
+    def find_all(self, name, class_=None):
+        names = (name,) if isinstance(name, str) else tuple(name)
+        classes = (class_,) if isinstance(class_, str) else class_
+        found = []
+        for element in self.elements:
+            if element.name in names and (classes is None or any(c in classes for c in element.get("class", ()))):
+                found.append(element)
+            found.extend(element.find_all(name, class_=class_))
+        return found
+
+
+class PageDocument:
+    """BeautifulSoup 문서의 텍스트 뷰를 한 번만 계산해 재사용하는 래퍼
+
+    트리를 수정한 뒤에는 invalidate()를 호출해야 한다. html은 파싱한 원본으로, 다른
+    스레드와 문서를 나눌 때는 트리 대신 html을 새로 파싱해 쓴다.
+    """
+
+    def __init__(self, soup, html=None):
+        self.soup = soup
+        self.html = html
+        self._index = None
+        self._spaced_text = None
+        self._element_text = {}
+        self._clean_text = {}
+
+    @property
+    def index(self):
+        """키워드 → 블록 역색인 (PageTextIndex)"""
+        if self._index is None:
+            self._index = PageTextIndex(self.soup)
+        return self._index
+
+    @property
+    def text(self):
+        """문서 전체 텍스트 (soup.get_text() / soup.text와 동일)"""
+        return self.index.text
+
+    @property
+    def spaced_text(self):
+        """공백으로 구분하고 앞뒤 공백을 없앤 전체 텍스트 (텍스트 분석용)"""
+        if self._spaced_text is None:
+            self._spaced_text = self.soup.get_text(separator=' ', strip=True)
+        return self._spaced_text
+
+    def has_any(self, *keywords):
+        """전체 텍스트에 키워드 중 하나라도 포함되는지 확인"""
+        text = self.text
+        return any(keyword in text for keyword in keywords)
+
+    def element_text(self, element, separator=''):
+        """요소의 하위 트리 텍스트 (element.get_text(separator)와 동일, 요소별 캐시)"""
+        key = (id(element), separator)
+        cached = self._element_text.get(key)
+        # id 재사용에 대비해 요소 자체도 함께 보관하고 비교
+        if cached is None or cached[0] is not element:
+            cached = (element, element.get_text(separator=separator))
+            self._element_text[key] = cached
+        return cached[1]
+
+    def clean(self, element, separator=''):
+        """요소 텍스트의 clean_text 결과 (요소별 캐시)"""
+        key = (id(element), separator)
+        cached = self._clean_text.get(key)
+        if cached is None or cached[0] is not element:
+            from .crawler import clean_text
+            cached = (element, clean_text(self.element_text(element, separator)))
+            self._clean_text[key] = cached
+        return cached[1]
+
+    def invalidate(self):
+        """트리가 수정된 뒤 캐시된 텍스트 뷰를 모두 버림"""
+        self._index = None
+        self._spaced_text = None
+        self._element_text.clear()
+        self._clean_text.clear()
@@ -0,0 +1,167 @@
+"""
+요청 헤징 (꼬리 지연 줄이기)
+
+상세 페이지 대부분은 빨리 오지만 몇 개가 10초 넘게 걸리면, 배치가 as_completed로 모든 민원을
+기다리므로 가장 느린 요청이 처리량을 결정한다. 헤징을 켜면 요청이 그 경로(lane, 예: 목록/상세)에서
+최근 관측한 p95 지연 시간을 넘길 때 같은 요청을 하나 더 보내고 먼저 온 응답을 쓴다.
+
+- 지연 기준: 경로별 최근 WINDOW개 성공 요청의 p95 (MIN_SAMPLES개가 모이기 전에는 헤징하지 않음)
+- 헤징 예산: 실행 전체에서 추가 요청 수를 (요청 수 x 비율)로 제한해 부하가 두 배로 늘지 않게 함
+- 둘 중 먼저 성공한 응답을 쓰고, 먼저 끝난 쪽이 실패하면 남은 요청을 기다린다.
+  진 요청은 취소할 수 없으므로 끝날 때까지 두고 결과만 버린다.
+
+요청은 헤징용 스레드 풀에서 보내고 호출한 워커는 결과를 기다린다. 비율이 0이면(기본값) 헤징하지
+않고 호출한 스레드에서 바로 요청한다. fn은 요청 하나를 보내는 함수로, 회로 차단기 기록처럼 요청마다
+해야 하는 일은 fn 안에서 한다 (헤징한 두 요청이 각각 기록됨).
+"""
+import collections
+import concurrent.futures
+import logging
+import threading
+import time
+
+from . import metrics, tracing
+from .bench import percentile
+
+logger = logging.getLogger(__name__)
+
+# 지연 기준을 계산하는 경로별 최근 요청 수와 최소 요청 수
+WINDOW = 200
+MIN_SAMPLES = 20
+# p95를 다시 계산하는 간격 (관측 수)
+RECOMPUTE_EVERY = 10
+# 헤징 지연 하한 (초) - 아주 빠른 경로에서 불필요한 헤징 방지
+MIN_HEDGE_DELAY = 0.05
+# 헤징 예산 기본값 (요청 수 대비 추가 요청 비율, 0=사용 안 함)
+DEFAULT_HEDGE_RATIO = 0.0
+
+
+class LatencyWindow:
+    """경로 하나의 최근 지연 시간과 p95 (스레드 안전)"""
+
+    def __init__(self, size=WINDOW):
+        self._samples = collections.deque(maxlen=size)
+        self._p95 = None
+        self._since = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+            self._since += 1
+            if self._p95 is None or self._since >= RECOMPUTE_EVERY:
+                self._since = 0
+                self._p95 = percentile(self._samples, 95) if len(self._samples) >= MIN_SAMPLES else None
+
+    def threshold(self):
+        """헤징을 시작할 지연 시간 (아직 기준이 없으면 None)"""
+        with self._lock:
+            return None if self._p95 is None else max(self._p95, MIN_HEDGE_DELAY)
+
+
+class HedgeBudget:
+    """실행 전체의 헤징 예산 (허용 추가 요청 = 요청 수 x 비율)"""
+
+    def __init__(self, ratio=DEFAULT_HEDGE_RATIO):
+        self.ratio = max(0.0, ratio)
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self):
+        with self._lock:
+            if self.hedges + 1 > self.requests * self.ratio:
+                return False
+            self.hedges += 1
+            return True
+
+
+budget = HedgeBudget()
+_lanes = {}
+_lock = threading.Lock()
+_executor = None
+
+
+def configure(ratio=DEFAULT_HEDGE_RATIO, max_workers=5):
+    """실행 시작 시 헤징 설정 (요청 수 대비 추가 요청 비율, 동시 요청 워커 수)"""
+    global budget, _executor
+    shutdown()
+    with _lock:
+        budget = HedgeBudget(ratio)
+        _lanes.clear()
+        if budget.ratio > 0:
+            # 워커마다 원래 요청 하나와 헤징 요청 하나
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(2, max_workers * 2), thread_name_prefix="crawler-hedge"
+            )
+
+
+def shutdown():
+    """헤징용 스레드 풀 종료 (진 요청이 끝나기를 기다리지 않음)"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
+
+
+def lane(name):
+    with _lock:
+        window = _lanes.get(name)
+        if window is None:
+            window = _lanes[name] = LatencyWindow()
+        return window
+
+
+def _timed(window, fn):
+    """fn()을 실행하고 성공한 요청의 지연 시간을 경로에 기록"""
+    start = time.perf_counter()
+    result = fn()
+    window.observe(time.perf_counter() - start)
+    return result
+
+
+def call(lane_name, fn):
+    """fn()을 실행하되 경로의 p95를 넘기면 한 번 더 보내 먼저 성공한 결과 반환"""
+    executor = _executor
+    window = lane(lane_name)
+    if executor is None:
+        return _timed(window, fn)
+
+    budget.record_request()
+    threshold = window.threshold()
+    try:
+        primary = executor.submit(_timed, window, fn)
+    except RuntimeError:  # 실행 종료 중
+        return _timed(window, fn)
+    if threshold is None:
+        return primary.result()
+    try:
+        return primary.result(timeout=threshold)
+    except concurrent.futures.TimeoutError:
+        pass
+    if not budget.try_spend():
+        metrics.inc("hanolcare_hedges_total", lane=lane_name, result="no_budget")
+        return primary.result()
+
+    tracing.instant("hedge", lane=lane_name, after_ms=round(threshold * 1000, 1))
+    try:
+        hedged = executor.submit(_timed, window, fn)
+    except RuntimeError:
+        return primary.result()
+    pending = {primary, hedged}
+    error = None
+    while pending:
+        done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for future in done:
+            if future.exception() is None:
+                metrics.inc("hanolcare_hedges_total", lane=lane_name, result="won" if future is hedged else "lost")
+                return future.result()
+            if future is primary or error is None:
+                error = future.exception()
+    metrics.inc("hanolcare_hedges_total", lane=lane_name, result="failed")
+    raise error
@@ -0,0 +1,198 @@
+"""
+수집 후 코퍼스 단위 TF-IDF 키워드 추출
+
+analyze_text는 문서 하나 안의 빈도만 세기 때문에 정부24 모든 페이지에 나오는
+상투적인 단어가 상위 키워드를 차지한다. 이 모듈은 수집이 끝난 전체 민원으로
+희소 단어-문서 행렬을 한 번에 만들고 TF-IDF를 벡터 연산으로 계산하여 민원별
+상위 키워드를 "키워드" 필드에 기록한다.
+
+단독 실행 (저장된 결과 CSV에 키워드를 채워 다시 저장):
+    python -m hanolcare_crawler.keywords --csv ~/Desktop/data/정부24_민원목록.csv
+"""
+import argparse
+import logging
+import math
+import os
+import sys
+from collections import Counter
+
+from .ko_tokenizer import get_tokenizer
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+    from scipy import sparse
+    SCIPY_AVAILABLE = True
+except ImportError:
+    SCIPY_AVAILABLE = False
+
+# 키워드 추출에 사용할 필드
+KEYWORD_SOURCE_FIELDS = ("민원명", "설명", "처리절차", "신청방법", "필요서류", "신청자격")
+
+# 자동 생성된 대체 문구 등 키워드로 의미 없는 단어
+KEYWORD_STOPWORDS = {"정보", "없음", "자동", "생성", "오류", "인해", "관련", "민원", "서비스"}
+
+# 문서 수가 이보다 적으면 max_df 필터를 적용하지 않음 (소규모 수집 결과 보호)
+MIN_DOCS_FOR_MAX_DF = 10
+
+# 순위 비교 전 점수 반올림 자릿수 - NumPy와 math의 log 결과가 마지막 비트에서 달라도
+# 동점은 같은 동점으로 보고 단어 순으로 정렬 (두 구현의 결과를 같게 유지)
+SCORE_DECIMALS = 9
+
+# 상위 키워드를 한 번에 고르는 행 묶음 크기 (묶음마다 행 수 x 최대 단어 수 크기의 배열 사용)
+BLOCK_ROWS = 1024
+
+
+def tokenize_record(record, tokenizer=None, fields=KEYWORD_SOURCE_FIELDS):
+    """민원 레코드에서 키워드 후보 명사 목록 추출"""
+    tokenizer = tokenizer or get_tokenizer()
+    text = " ".join(record.get(field) or "" for field in fields)
+    return [w for w in tokenizer.nouns(text) if len(w) > 1 and w not in KEYWORD_STOPWORDS]
+
+
+def build_term_matrix(records, tokenizer=None):
+    """희소 단어-문서 행렬 구성 (scipy CSR 행렬, 어휘 목록)"""
+    vocabulary = {}
+    indptr = [0]
+    indices = []
+    counts = []
+    for record in records:
+        for term, count in Counter(tokenize_record(record, tokenizer)).items():
+            indices.append(vocabulary.setdefault(term, len(vocabulary)))
+            counts.append(count)
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(counts, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(records), len(vocabulary)),
+    )
+    terms = [None] * len(vocabulary)
+    for term, index in vocabulary.items():
+        terms[index] = term
+    return matrix, terms
+
+
+def _tfidf_vectorized(records, top_k, min_df, max_df, tokenizer):
+    """NumPy/SciPy 기반 TF-IDF 상위 키워드 계산"""
+    matrix, terms = build_term_matrix(records, tokenizer)
+    n_docs = matrix.shape[0]
+    if matrix.nnz == 0:
+        return [[] for _ in records]
+
+    # 문서 빈도와 역문서 빈도 (smooth idf)
+    df = np.bincount(matrix.indices, minlength=matrix.shape[1])
+    idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+    excluded = df < min_df
+    if n_docs >= MIN_DOCS_FOR_MAX_DF:
+        excluded |= df > max_df * n_docs
+    idf[excluded] = 0.0
+
+    # 로그 스케일 TF × IDF (행 정규화는 행 내 순위에 영향이 없으므로 생략)
+    matrix.data = (1.0 + np.log(matrix.data)) * idf[matrix.indices]
+
+    # 점수 내림차순, 동점이면 단어 순 (순수 파이썬 구현과 같은 순서)을 정수 정렬 키 하나로:
+    # 키 = (점수 순위) x 어휘 수 + (단어 순위), 작을수록 앞. 점수가 0인 항목은 제외
+    sorted_terms = sorted(terms)
+    term_rank = np.empty(len(terms), dtype=np.int64)
+    term_rank[sorted(range(len(terms)), key=terms.__getitem__)] = np.arange(len(terms))
+    unique_scores, score_index = np.unique(np.round(matrix.data, SCORE_DECIMALS), return_inverse=True)
+    keys = (len(unique_scores) - 1 - score_index.astype(np.int64)) * len(terms) + term_rank[matrix.indices]
+    excluded_key = np.iinfo(np.int64).max
+    keys[matrix.data <= 0] = excluded_key
+
+    results = []
+    for block_start in range(0, n_docs, BLOCK_ROWS):
+        block_end = min(block_start + BLOCK_ROWS, n_docs)
+        results.extend(_top_keys(keys, matrix.indptr[block_start:block_end + 1], top_k, excluded_key, sorted_terms))
+    return results
+
+
+def _top_keys(keys, indptr, top_k, excluded_key, sorted_terms):
+    """행 묶음의 상위 top_k 키를 행별 단어 목록으로 (argpartition 후 k개만 정렬)"""
+    lengths = np.diff(indptr)
+    n_rows = len(lengths)
+    width = int(lengths.max()) if n_rows else 0
+    if width == 0:
+        return [[] for _ in range(n_rows)]
+
+    # 행마다 길이가 다르므로 제외 키로 채운 (행 수 x 최대 단어 수) 배열로 펼침
+    start = indptr[0]
+    rows = np.repeat(np.arange(n_rows), lengths)
+    cols = np.arange(indptr[-1] - start) - np.repeat(indptr[:-1] - start, lengths)
+    dense = np.full((n_rows, width), excluded_key, dtype=np.int64)
+    dense[rows, cols] = keys[start:indptr[-1]]
+
+    k = min(top_k, width)
+    if k < width:
+        dense = np.take_along_axis(dense, np.argpartition(dense, k - 1, axis=1)[:, :k], axis=1)
+    dense.sort(axis=1)
+    dense = dense[:, :k]
+
+    n_terms = len(sorted_terms)
+    return [[sorted_terms[key % n_terms] for key in row if key != excluded_key] for row in dense.tolist()]
+
+
+def _tfidf_pure_python(records, top_k, min_df, max_df, tokenizer):
+    """NumPy/SciPy가 없을 때 사용하는 동일한 계산의 순수 파이썬 구현"""
+    docs = [Counter(tokenize_record(record, tokenizer)) for record in records]
+    n_docs = len(docs)
+    df = Counter()
+    for doc in docs:
+        df.update(doc.keys())
+
+    idf = {}
+    for term, freq in df.items():
+        if freq < min_df or (n_docs >= MIN_DOCS_FOR_MAX_DF and freq > max_df * n_docs):
+            continue
+        idf[term] = math.log((1 + n_docs) / (1 + freq)) + 1.0
+
+    results = []
+    for doc in docs:
+        scores = [(round((1.0 + math.log(count)) * idf[term], SCORE_DECIMALS), term)
+                  for term, count in doc.items() if term in idf]
+        # 점수 내림차순, 동점이면 단어 순
+        scores.sort(key=lambda x: (-x[0], x[1]))
+        results.append([term for _, term in scores[:top_k]])
+    return results
+
+
+def extract_corpus_keywords(records, top_k=10, min_df=1, max_df=0.5, tokenizer=None):
+    """전체 민원 코퍼스 기준 TF-IDF 상위 키워드 목록 반환 (레코드 순서와 동일)"""
+    if not records:
+        return []
+    if SCIPY_AVAILABLE:
+        return _tfidf_vectorized(records, top_k, min_df, max_df, tokenizer)
+    logger.warning("NumPy/SciPy가 설치되지 않아 순수 파이썬으로 TF-IDF를 계산합니다. (pip install numpy scipy)")
+    return _tfidf_pure_python(records, top_k, min_df, max_df, tokenizer)
+
+
+def apply_corpus_keywords(records, top_k=10, min_df=1, max_df=0.5, tokenizer=None):
+    """민원별 TF-IDF 상위 키워드를 "키워드" 필드에 기록"""
+    keywords = extract_corpus_keywords(records, top_k, min_df, max_df, tokenizer)
+    for record, terms in zip(records, keywords):
+        record["키워드"] = ", ".join(terms)
+    logger.info(f"TF-IDF 키워드 추출 완료: {len(records)}개 민원 (민원당 최대 {top_k}개)")
+    return records
+
+
+def main(argv=None):
+    """저장된 결과 CSV에 TF-IDF 키워드를 채워 다시 저장"""
+    from .crawler import load_from_csv, save_to_csv
+
+    parser = argparse.ArgumentParser(description="수집 결과 CSV에 코퍼스 TF-IDF 키워드 기록")
+    parser.add_argument("--csv", required=True, help="크롤링 결과 CSV 파일")
+    parser.add_argument("--top-k", type=int, default=10, help="민원당 키워드 수")
+    parser.add_argument("--min-df", type=int, default=1, help="최소 문서 빈도")
+    parser.add_argument("--max-df", type=float, default=0.5, help="최대 문서 비율 (이보다 흔한 단어 제외)")
+    args = parser.parse_args(argv)
+
+    path = os.path.expanduser(args.csv)
+    records = load_from_csv(path)
+    apply_corpus_keywords(records, args.top_k, args.min_df, args.max_df)
+    save_to_csv(records, os.path.basename(path), os.path.dirname(path) or ".")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
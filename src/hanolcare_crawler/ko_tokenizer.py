@@ -0,0 +1,331 @@
+"""
+JVM 없이 동작하는 경량 한국어 형태소 분석기
+
+Java/JPype가 없는 환경에서 analyze_text의 한국어 분석 백엔드로 사용한다.
+어절 단위로 조사·어미를 접미사 트라이로 분리하고, 남은 어간은 명사 사전 트라이로
+최장 일치 분해한다. 사전에 없는 어간은 하나의 명사로 취급한다.
+
+어절 전체가 명사 사전으로 분해되면 조사·어미를 떼지 않는다 ("제한"의 "한" 등).
+명사 끝 글자와 같은 한 글자 어미(한/할/함/해)는 남는 어간이 사전으로 분해될 때만
+떼어낸다 ("이용제한" → "이용제"+"한"이 되지 않도록).
+
+벤치마크 (크롤링 결과 CSV 기준, 압축 CSV 포함, Okt 설치 시 일치도 함께 측정):
+    python -m hanolcare_crawler.ko_tokenizer --csv ~/Desktop/data/정부24_민원목록.csv
+
+Okt 대비 일치도는 JVM과 KoNLPy가 있는 환경에서만 측정할 수 있으며, 명사 F1이
+OKT_MIN_F1보다 낮으면 벤치마크가 종료 코드 1을 반환한다.
+"""
+import argparse
+import csv
+import logging
+import re
+import sys
+import time
+
+from .compress import open_text
+
+logger = logging.getLogger(__name__)
+
+# 정부24 민원 페이지에서 자주 등장하는 명사 (복합명사 분해용)
+DOMAIN_NOUNS = """
+민원 서비스 신청 발급 열람 조회 교부 등록 신고 변경 확인 정정 말소 취소 재발급
+주민 주민등록 등본 초본 증명 증명서 확인서 신청서 신고서 위임장 신분증 사본 원본
+가족 가족관계 관계 기본 혼인 출생 사망 입양 이혼 전입 전출 세대 세대주 세대원
+본인 대리인 법정대리인 배우자 자녀 부모 직계 존속 비속 형제 친족 외국인 재외국민
+사업자 사업 법인 개인 단체 기업 소상공인 창업 영업 허가 인가 승인 면허 자격 자격증
+건축 건축물 대장 토지 임야 지적 부동산 주택 아파트 임대 임차 계약 전세 월세 매매
+자동차 차량 운전 운전면허 이륜 번호판 검사 정기 보험 책임 과태료 범칙금 벌금
+여권 비자 체류 국적 귀화 출입국 병역 군 예비군 민방위 입영 전역 복무
+세금 국세 지방세 소득 소득세 재산 재산세 취득세 부가가치세 납세 납부 환급 체납 완납
+건강 건강보험 국민연금 연금 고용 고용보험 산재 산재보험 실업 급여 수당 장려금
+지원 지원금 보조금 바우처 감면 면제 할인 혜택 대상 대상자 요건 조건 기준
+아동 청소년 노인 어르신 장애 장애인 임산부 영유아 보육 양육 다자녀 한부모 저소득
+기초 생활 생계 의료 주거 교육 보장 수급 수급자 차상위 복지 돌봄 요양 간병
+이용 이용자 제한 권한 한도 역할 포함 피해 손해 재해 이해 검토 심사 결정 선정 지급 소요
+처리 절차 방법 기간 기한 이내 이후 이전 일정 시간 운영 근무 영업일 근무일 업무일 평일 공휴일
+수수료 비용 금액 무료 유료 결제 카드 계좌 이체 현금 납입 수입 인지
+서류 구비 제출 첨부 첨부파일 파일 서식 양식 작성 기재 기록 사항 내용 항목
+접수 접수처 방문 우편 팩스 인터넷 온라인 오프라인 모바일 전자 정부 정부24 홈페이지
+기관 행정 행정기관 관할 관할청 시청 구청 군청 읍 면 동 주민센터 행정복지센터 센터
+담당 담당자 담당부서 부서 소관 소관기관 문의 연락처 전화 전화번호 상담 콜센터
+법령 법률 시행령 시행규칙 조례 규칙 고시 근거 조항 규정 지침
+결과 통지 통보 안내 공지 알림 수령 수령방법 발송 배송 교부처 출력 인쇄
+정보 개인정보 열람자 제3자 동의 공개 비공개 보호 인증 공동인증서 본인인증 로그인
+학교 학생 졸업 재학 성적 입학 장학 장학금 학자금 교육비
+농업 농지 농가 어업 어선 축산 산림 환경 폐기물 대기 수질 에너지 전기 가스 수도
+의료기관 병원 약국 진료 예방접종 검진 보건소 감염병 식품 위생
+""".split()
+
+# Okt 대비 명사 일치도(F1) 하한 - 이보다 낮으면 벤치마크 실패
+OKT_MIN_F1 = 0.7
+
+# 체언 뒤에 붙는 조사 (긴 것부터 일치)
+JOSA = """
+이 가 은 는 을 를 에 에서 에게 에게서 께 께서 한테 으로 로 으로서 로서 으로써 로써
+와 과 의 도 만 까지 부터 마다 처럼 보다 이나 나 이며 며 이란 란 이라 라 이라는 라는
+에는 에서는 에도 에서도 에만 으로는 로는 으로도 로도 와는 과는 와의 과의 에의 에서의
+까지는 부터는 만을 만이 이든 든 이든지 든지 이라도 라도 조차 마저 밖에 뿐 같이 및
+입니다 입니까 이다 이고 이었다 였다 이었습니다 였습니다
+""".split()
+
+# 명사 + 하다/되다 파생 용언 어미 (떼어내면 명사가 남음)
+PREDICATE_ENDINGS = """
+하다 합니다 합니까 하는 하여 해야 하며 하고 하거나 하면 하려면 하기 하기에 하기위해 하지
+한 할 함 해 했 했다 했습니다 하였 하였다 하였습니다 하세요 하십시오 해주세요 하시기 하실 하신
+해서 하므로 하도록 하여야 하게 하던 하자 합시다 시키는 시킨 시켜
+되다 됩니다 됩니까 되는 되어 돼 되며 되고 되거나 되면 되기 되지 된 될 됨 됐 되었 되었다
+되었습니다 되도록 되므로 되어야 되던 받는 받은 받을 받아 받아야 받으려면 받기
+드립니다 드려요 바랍니다
+""".split()
+
+# 명사 끝 글자와 겹치는 한 글자 어미 (어간이 명사 사전으로 분해될 때만 떼어냄)
+AMBIGUOUS_ENDINGS = frozenset("한 할 함 해".split())
+
+# 단독 용언/보조 표현 등 명사에서 제외할 어절
+STOP_WORDS = set("""
+이 그 저 것 수 등 및 외 중 때 곳 분 더 또 또는 그리고 하지만 그러나 따라 통해 위해 관한
+관련 있는 있습니다 있으며 없는 없습니다 경우 해당 다음 각 모든 기타 별도 대한 위한 통한
+""".split())
+
+_HANGUL_RE = re.compile(r'[가-힣]+|[A-Za-z]+|\d+(?:[.,]\d+)*|[^\s가-힣A-Za-z\d]')
+
+
+class Trie:
+    """문자열 최장 일치 검색용 트라이"""
+
+    _END = object()
+
+    def __init__(self, words=(), reverse=False):
+        self.root = {}
+        self.reverse = reverse
+        for word in words:
+            self.add(word)
+
+    def add(self, word):
+        node = self.root
+        for ch in (reversed(word) if self.reverse else word):
+            node = node.setdefault(ch, {})
+        node[self._END] = True
+
+    def longest_prefix(self, text, start=0):
+        """text[start:]의 접두사 중 사전에 있는 가장 긴 단어 길이 (없으면 0)"""
+        node = self.root
+        best = 0
+        for i in range(start, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if self._END in node:
+                best = i - start + 1
+        return best
+
+    def longest_suffix(self, text):
+        """text의 접미사 중 사전에 있는 가장 긴 단어 길이 (reverse 트라이 전용)"""
+        node = self.root
+        best = 0
+        for i in range(len(text) - 1, -1, -1):
+            node = node.get(text[i])
+            if node is None:
+                break
+            if self._END in node:
+                best = len(text) - i
+        return best
+
+
+class KoreanTokenizer:
+    """사전/트라이 기반 경량 한국어 형태소 분석기 (Okt 품사 태그 이름 사용)"""
+
+    def __init__(self, user_nouns=None):
+        nouns = list(DOMAIN_NOUNS)
+        if user_nouns:
+            nouns.extend(user_nouns)
+        self.noun_trie = Trie(nouns)
+        self.josa_trie = Trie(JOSA, reverse=True)
+        self.ending_trie = Trie(PREDICATE_ENDINGS, reverse=True)
+
+    def add_nouns(self, words):
+        """사용자 명사 추가"""
+        for word in words:
+            self.noun_trie.add(word)
+
+    def _noun_cover(self, text):
+        """text 앞부분을 명사 사전으로 최장 일치 분해했을 때 덮이는 길이"""
+        i = 0
+        while i < len(text):
+            length = self.noun_trie.longest_prefix(text, i)
+            if length == 0:
+                break
+            i += length
+        return i
+
+    def _split_stem(self, stem):
+        """명사 사전으로 어간을 최장 일치 분해 (완전히 분해되지 않으면 통째로 반환)"""
+        parts = []
+        i = 0
+        while i < len(stem):
+            length = self.noun_trie.longest_prefix(stem, i)
+            if length == 0:
+                return [stem]
+            parts.append(stem[i:i + length])
+            i += length
+        return parts
+
+    def _analyze_word(self, word):
+        """한글 어절 하나를 (형태소, 품사) 목록으로 분석"""
+        if word in STOP_WORDS:
+            return [(word, "Modifier")]
+        # 어절 전체가 명사로 분해되면 조사·어미를 떼지 않음
+        if self._noun_cover(word) == len(word):
+            return [(part, "Noun") for part in self._split_stem(word)]
+
+        tail = []
+        # 하다/되다 파생 어미 분리 (어간이 2글자 이상 남는 경우만)
+        length = self.ending_trie.longest_suffix(word)
+        stem_len = len(word) - length
+        if length and stem_len >= 2 and (
+                word[-length:] not in AMBIGUOUS_ENDINGS or self._noun_cover(word[:stem_len]) == stem_len):
+            tail.append((word[-length:], "Verb"))
+            word = word[:-length]
+        else:
+            # 조사 분리 - 한 글자 조사는 어간이 2글자 이상 남을 때만 떼어낸다
+            length = self.josa_trie.longest_suffix(word)
+            stem_len = len(word) - length
+            if length and (stem_len >= 2 or (length >= 2 and stem_len >= 1)):
+                tail.append((word[-length:], "Josa"))
+                word = word[:-length]
+
+        if word in STOP_WORDS:
+            return [(word, "Modifier")] + tail
+        return [(part, "Noun") for part in self._split_stem(word)] + tail
+
+    def pos(self, text):
+        """텍스트를 (형태소, 품사) 목록으로 분석"""
+        result = []
+        for token in _HANGUL_RE.findall(text or ""):
+            first = token[0]
+            if '가' <= first <= '힣':
+                result.extend(self._analyze_word(token))
+            elif first.isdigit():
+                result.append((token, "Number"))
+            elif first.isalpha():
+                result.append((token, "Alpha"))
+            else:
+                result.append((token, "Punctuation"))
+        return result
+
+    def morphs(self, text):
+        """형태소 목록 반환"""
+        return [token for token, _ in self.pos(text)]
+
+    def nouns(self, text):
+        """명사 목록 반환 (Okt.nouns와 같은 형태)"""
+        return [token for token, tag in self.pos(text) if tag == "Noun"]
+
+
+_default_tokenizer = None
+
+
+def get_tokenizer():
+    """기본 분석기 인스턴스 반환 (프로세스당 한 번 생성)"""
+    global _default_tokenizer
+    if _default_tokenizer is None:
+        _default_tokenizer = KoreanTokenizer()
+    return _default_tokenizer
+
+
+def load_corpus(csv_paths, columns=("민원명", "설명", "처리절차", "신청방법", "필요서류")):
+    """크롤링 결과 CSV(.csv.gz/.csv.zst 포함)에서 분석용 텍스트 목록을 읽어옴"""
+    texts = []
+    for path in csv_paths:
+        with open_text(path) as f:
+            for row in csv.DictReader(f):
+                for column in columns:
+                    value = row.get(column) or ""
+                    if len(value) >= 5:
+                        texts.append(value)
+    return texts
+
+
+def benchmark(texts, analyzer, repeat=1):
+    """분석기 처리 속도 측정 (텍스트/초, 글자/초)"""
+    chars = sum(len(t) for t in texts)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            analyzer(text)
+    elapsed = time.perf_counter() - start
+    total = len(texts) * repeat
+    return {
+        "texts": total,
+        "seconds": elapsed,
+        "texts_per_sec": total / elapsed if elapsed else 0.0,
+        "chars_per_sec": chars * repeat / elapsed if elapsed else 0.0,
+    }
+
+
+def compare_with_okt(texts, okt, tokenizer=None, top_k=10):
+    """Okt 명사 추출 결과와의 일치도 (정밀도/재현율/상위 키워드 겹침)"""
+    from collections import Counter
+    tokenizer = tokenizer or get_tokenizer()
+    tp = fp = fn = 0
+    top_overlap = 0.0
+    for text in texts:
+        ours = [w for w in tokenizer.nouns(text) if len(w) > 1]
+        theirs = [w for w in okt.nouns(text) if len(w) > 1]
+        ours_set, theirs_set = set(ours), set(theirs)
+        tp += len(ours_set & theirs_set)
+        fp += len(ours_set - theirs_set)
+        fn += len(theirs_set - ours_set)
+
+        our_top = {w for w, _ in Counter(ours).most_common(top_k)}
+        their_top = {w for w, _ in Counter(theirs).most_common(top_k)}
+        if our_top or their_top:
+            top_overlap += len(our_top & their_top) / len(our_top | their_top)
+
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        f"top{top_k}_jaccard": top_overlap / len(texts) if texts else 0.0,
+    }
+
+
+def main(argv=None):
+    """내장 분석기 벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="내장 한국어 분석기 속도/Okt 일치도 벤치마크")
+    parser.add_argument("--csv", nargs="+", required=True, help="크롤링 결과 CSV 파일")
+    parser.add_argument("--repeat", type=int, default=1, help="속도 측정 반복 횟수")
+    parser.add_argument("--limit", type=int, default=0, help="사용할 최대 텍스트 수 (0=전체)")
+    args = parser.parse_args(argv)
+
+    texts = load_corpus(args.csv)
+    if args.limit > 0:
+        texts = texts[:args.limit]
+    if not texts:
+        print("분석할 텍스트가 없습니다.")
+        return 1
+    print(f"코퍼스: {len(texts)}개 텍스트, {sum(len(t) for t in texts)}자")
+
+    tokenizer = get_tokenizer()
+    result = benchmark(texts, tokenizer.nouns, args.repeat)
+    print(f"[내장 분석기] {result['texts_per_sec']:.1f} 텍스트/초, {result['chars_per_sec']:.0f} 자/초")
+
+    from . import crawler
+    if not crawler.init_okt():
+        print("Okt를 사용할 수 없어 일치도 비교를 건너뜁니다.")
+        return 0
+    result = benchmark(texts, crawler.okt.nouns, args.repeat)
+    print(f"[Okt] {result['texts_per_sec']:.1f} 텍스트/초, {result['chars_per_sec']:.0f} 자/초")
+    agreement = compare_with_okt(texts, crawler.okt, tokenizer)
+    print("[Okt 대비 명사 일치도] " + ", ".join(f"{k}: {v:.3f}" for k, v in agreement.items()))
+    if agreement["f1"] < OKT_MIN_F1:
+        print(f"명사 F1 {agreement['f1']:.3f}이(가) 기준 {OKT_MIN_F1}보다 낮습니다.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
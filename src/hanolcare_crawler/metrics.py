@@ -0,0 +1,361 @@
+"""
+수집 단계별 지표 (카운터/지연 시간 히스토그램)
+
+목록 가져오기, 상세 페이지 가져오기(requests/Playwright), 파싱, 추출, 텍스트 분석,
+검증, 저장 단계의 소요 시간과 캐시 적중, 재시도 횟수를 프로세스 안에서 모은다.
+Prometheus 텍스트 형식으로 내보낼 수 있고 (textfile collector용 파일 또는 /metrics
+HTTP 엔드포인트), 수집이 끝나면 단계별 요약을 로그로 남긴다.
+
+사용:
+    from . import metrics
+    with metrics.timer("detail_fetch", method="requests"):
+        ...
+    metrics.inc("hanolcare_retries_total", stage="detail_fetch")
+"""
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from . import tracing
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 히스토그램 구간 (초) - Prometheus 기본 구간에 Playwright용 긴 구간 추가
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+STAGE_SECONDS = "hanolcare_stage_seconds"
+
+# 지표 이름: (종류, 설명)
+METRICS = {
+    STAGE_SECONDS: ("histogram", "수집 단계별 소요 시간 (초)"),
+    "hanolcare_fetch_total": ("counter", "페이지 요청 수 (방식/결과별)"),
+    "hanolcare_cache_requests_total": ("counter", "캐시 조회 수 (hit/miss/shared)"),
+    "hanolcare_retries_total": ("counter", "단계별 재시도 수"),
+    "hanolcare_retry_giveups_total": ("counter", "재시도 포기 수 (단계/이유별: attempts, budget, retry_after)"),
+    "hanolcare_records_total": ("counter", "처리한 민원 수 (결과별)"),
+    "hanolcare_circuit_transitions_total": ("counter", "회로 차단기 상태 전환 수 (회로/상태별)"),
+    "hanolcare_circuit_rejected_total": ("counter", "열린 회로가 보내지 않고 거부한 요청 수 (회로별)"),
+    "hanolcare_hedges_total": ("counter", "헤징 요청 수 (경로/결과별: won, lost, failed, no_budget)"),
+    "hanolcare_http_requests_total": ("counter", "보낸 HTTP 요청 수 (스킴별)"),
+    "hanolcare_http_connections_total": ("counter", "새로 맺은 HTTP 연결 수 (스킴별, 재사용률 = 1 - 연결 / 요청)"),
+}
+
+
+class Histogram:
+    """누적 구간 히스토그램 (합계/개수 포함)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        """관측된 최솟값/최댓값 범위로 제한한 분위수 추정"""
+        if not self.count:
+            return 0.0
+        return min(max(self._bucket_quantile(q), self.min), self.max)
+
+    def _bucket_quantile(self, q):
+        """구간 안에서 선형 보간한 분위수 (Prometheus histogram_quantile과 같은 방식)"""
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for index, bucket_count in enumerate(self.counts):
+            upper = self.buckets[index] if index < len(self.buckets) else None
+            if cumulative + bucket_count >= rank and bucket_count:
+                if upper is None:
+                    # +Inf 구간에 걸리면 관측된 최댓값을 반환
+                    return self.max
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+            if upper is not None:
+                lower = upper
+        return self.buckets[-1]
+
+
+class MetricsRegistry:
+    """레이블별 카운터와 히스토그램 저장소 (스레드 안전)"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = {}
+        self._histograms = {}
+        self.started = time.time()
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted(labels.items()))
+
+    def inc(self, name, amount=1, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.started = time.time()
+
+    def counter_value(self, name, **labels):
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+
+    def counters(self, name):
+        """이름이 같은 카운터의 (레이블 딕셔너리, 값) 목록"""
+        with self._lock:
+            return [(dict(labels), value) for (metric, labels), value in self._counters.items() if metric == name]
+
+    def histograms(self, name):
+        """이름이 같은 히스토그램의 (레이블 딕셔너리, Histogram) 목록"""
+        with self._lock:
+            return [(dict(labels), histogram) for (metric, labels), histogram in self._histograms.items() if metric == name]
+
+    def render_prometheus(self):
+        """Prometheus 텍스트 노출 형식 문자열"""
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+            lines = []
+            described = set()
+
+            def describe(name, kind):
+                if name not in described:
+                    described.add(name)
+                    help_text = METRICS.get(name, (kind, name))[1]
+                    lines.append(f"# HELP {name} {help_text}")
+                    lines.append(f"# TYPE {name} {kind}")
+
+            for (name, labels), value in counters:
+                describe(name, "counter")
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+            for (name, labels), histogram in histograms:
+                describe(name, "histogram")
+                cumulative = 0
+                for bound, bucket_count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+                    cumulative += bucket_count
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {cumulative}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in labels) + "}"
+
+
+# 프로세스 전역 저장소
+registry = MetricsRegistry()
+
+
+def inc(name, amount=1, **labels):
+    """카운터 증가"""
+    registry.inc(name, amount, **labels)
+
+
+def observe(stage, seconds, start=None, **labels):
+    """단계 소요 시간 기록 (start를 주면 구간 기록 중일 때 타임라인에도 남김)"""
+    registry.observe(STAGE_SECONDS, seconds, stage=stage, **labels)
+    if start is not None:
+        tracing.record(stage, start, seconds, **labels)
+
+
+@contextmanager
+def timer(stage, **labels):
+    """with 블록의 소요 시간을 단계 히스토그램과 (기록 중이면) 타임라인에 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(stage, time.perf_counter() - start, start, **labels)
+
+
+def write_textfile(path):
+    """node_exporter textfile collector가 읽을 수 있도록 원자적으로 파일 저장"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(registry.render_prometheus())
+    os.replace(temp_path, path)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = registry.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MetricsExporter:
+    """수집 중 지표 내보내기 (textfile 주기적 갱신, HTTP /metrics 엔드포인트)"""
+
+    def __init__(self, textfile=None, port=0, interval=10.0, host="0.0.0.0"):
+        self.textfile = textfile
+        self.port = port
+        self.interval = interval
+        self.host = host
+        self._stop = threading.Event()
+        self._writer = None
+        self._server = None
+
+    def start(self):
+        if self.port:
+            self._server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+            self._server.daemon_threads = True
+            threading.Thread(target=self._server.serve_forever, name="metrics-http", daemon=True).start()
+            logger.info(f"지표 HTTP 엔드포인트 시작: http://{self.host}:{self._server.server_address[1]}/metrics")
+        if self.textfile:
+            self._writer = threading.Thread(target=self._write_loop, name="metrics-textfile", daemon=True)
+            self._writer.start()
+            logger.info(f"지표 파일 {self.interval:.0f}초마다 갱신: {self.textfile}")
+        return self
+
+    def _write_loop(self):
+        while not self._stop.wait(self.interval):
+            self._write()
+
+    def _write(self):
+        try:
+            write_textfile(self.textfile)
+        except OSError as e:
+            logger.warning(f"지표 파일 저장 실패: {str(e)}")
+
+    def stop(self):
+        """내보내기 종료 (textfile은 마지막 값으로 한 번 더 저장)"""
+        self._stop.set()
+        if self._writer is not None:
+            self._writer.join(timeout=5)
+            self._writer = None
+        if self.textfile:
+            self._write()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def _stage_label(labels):
+    stage = labels.get("stage", "")
+    method = labels.get("method")
+    return f"{stage}({method})" if method else stage
+
+
+def summary_lines():
+    """단계별 소요 시간, 캐시 적중률, 재시도 수 요약 (로그 출력용 문자열 목록)"""
+    stages = sorted(registry.histograms(STAGE_SECONDS), key=lambda item: item[1].sum, reverse=True)
+    lines = []
+    if stages:
+        wall = time.time() - registry.started
+        lines.append(f"{'단계':24s} {'횟수':>7s} {'합계(초)':>9s} {'평균 ms':>9s} {'p50 ms':>9s} {'p95 ms':>9s}")
+        for labels, histogram in stages:
+            mean = histogram.sum / histogram.count * 1000 if histogram.count else 0.0
+            lines.append(
+                f"{_stage_label(labels):24s} {histogram.count:7d} {histogram.sum:9.2f} {mean:9.1f} "
+                f"{histogram.quantile(0.5) * 1000:9.1f} {histogram.quantile(0.95) * 1000:9.1f}"
+            )
+        lines.append(f"(경과 시간 {wall:.1f}초, 병렬 워커의 단계 시간 합계는 경과 시간보다 클 수 있음)")
+
+    caches = {}
+    for labels, value in registry.counters("hanolcare_cache_requests_total"):
+        caches.setdefault(labels.get("cache", ""), {})[labels.get("result", "")] = value
+    for cache, results in sorted(caches.items()):
+        total = sum(results.values())
+        hits = total - results.get("miss", 0)
+        detail = ", ".join(f"{result} {count}" for result, count in sorted(results.items()))
+        lines.append(f"캐시 {cache}: 적중률 {hits / total * 100 if total else 0:.1f}% ({detail})")
+
+    retries = registry.counters("hanolcare_retries_total")
+    if retries:
+        detail = ", ".join(f"{labels.get('stage', '')} {value}" for labels, value in sorted(retries, key=lambda item: item[0].get("stage", "")))
+        lines.append(f"재시도: {detail}")
+    giveups = registry.counters("hanolcare_retry_giveups_total")
+    if giveups:
+        detail = ", ".join(
+            f"{labels.get('stage', '')}/{labels.get('reason', '')} {value}"
+            for labels, value in sorted(giveups, key=lambda item: sorted(item[0].items()))
+        )
+        lines.append(f"재시도 포기: {detail}")
+
+    circuits = {}
+    for labels, value in registry.counters("hanolcare_circuit_transitions_total"):
+        if labels.get("state") == "open":
+            circuits.setdefault(labels.get("circuit", ""), [0, 0])[0] += value
+    for labels, value in registry.counters("hanolcare_circuit_rejected_total"):
+        circuits.setdefault(labels.get("circuit", ""), [0, 0])[1] += value
+    if circuits:
+        detail = ", ".join(f"{name} 열림 {opened}회/거부 {rejected}" for name, (opened, rejected) in sorted(circuits.items()))
+        lines.append(f"회로 차단: {detail}")
+
+    hedges = registry.counters("hanolcare_hedges_total")
+    if hedges:
+        detail = ", ".join(
+            f"{labels.get('lane', '')}/{labels.get('result', '')} {value}"
+            for labels, value in sorted(hedges, key=lambda item: sorted(item[0].items()))
+        )
+        lines.append(f"요청 헤징: {detail}")
+
+    fetches = registry.counters("hanolcare_fetch_total")
+    if fetches:
+        detail = ", ".join(
+            f"{labels.get('method', '')}/{labels.get('outcome', '')} {value}"
+            for labels, value in sorted(fetches, key=lambda item: sorted(item[0].items()))
+        )
+        lines.append(f"페이지 요청: {detail}")
+
+    http_requests = sum(value for _, value in registry.counters("hanolcare_http_requests_total"))
+    if http_requests:
+        connections = sum(value for _, value in registry.counters("hanolcare_http_connections_total"))
+        reuse = max(0.0, 1 - connections / http_requests)
+        lines.append(f"HTTP 연결: 요청 {http_requests}개, 새 연결 {connections}개 (연결 재사용률 {reuse * 100:.1f}%)")
+    return lines
+
+
+def log_summary():
+    """수집 종료 시 지표 요약을 로그로 출력"""
+    lines = summary_lines()
+    if not lines:
+        return
+    logger.info("단계별 지표 요약")
+    for line in lines:
+        logger.info(line)
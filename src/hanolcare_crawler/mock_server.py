@@ -0,0 +1,442 @@
+"""
+부하 테스트용 로컬 정부24 모의 서버
+
+fixtures/의 목록/상세 페이지로 가상 사이트를 만들어 http.server로 제공한다.
+목록은 pageIndex 파라미터로 페이지를 나누고 applySetPage 페이지네이션을 그리며,
+상세 페이지는 /portal/service/serviceInfo/<서비스ID>로 제공한다. --scale로 민원 수를
+늘릴 수 있고 지연 시간, 오류(500), 요청 제한(429), JS 전용 페이지를 지정한 비율로
+섞어 보낼 수 있다.
+
+실행:
+    python -m hanolcare_crawler.mock_server --port 8024 --scale 20 --latency 0.05 --error-rate 0.02
+    python -m hanolcare_crawler --auto --base-url http://127.0.0.1:8024 --output /tmp/mock_out
+"""
+import argparse
+import json
+import logging
+import random
+import sys
+import threading
+import time
+import socketserver
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bs4 import BeautifulSoup
+
+from .bench import FIXTURES_DIR, load_fixtures
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 모의 서버 (선택, HTTP/2 전송 비교용)
+try:
+    import h2.config
+    import h2.connection
+    import h2.events
+    import h2.exceptions
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+LIST_PATHS = ("/search/applyMw", "/portal/service/serviceList")
+DETAIL_PATH = "/portal/service/serviceInfo/"
+STATS_PATH = "/__stats"
+
+# 페이지네이션에 한 번에 보이는 페이지 번호 수 (정부24와 동일)
+PAGE_WINDOW = 10
+
+_ITEMS_MARKER = "@@ITEMS@@"
+_PAGINATION_MARKER = "@@PAGINATION@@"
+
+
+class FaultConfig:
+    """모의 서버가 응답에 섞는 지연과 장애 설정 (비율은 0~1)"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit_rate=0.0,
+                 retry_after=1, js_only_rate=0.0, seed=None, slow_rate=0.0, slow_latency=0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.js_only_rate = js_only_rate
+        self.seed = seed
+        # 꼬리 지연: slow_rate 비율의 요청에 slow_latency초를 더함 (헤징 등 꼬리 지연 대책 확인용)
+        self.slow_rate = slow_rate
+        self.slow_latency = slow_latency
+
+
+class FixtureSite:
+    """픽스처로 만든 가상 정부24 사이트 - 목록/상세 페이지 HTML 생성"""
+
+    def __init__(self, fixtures_dir=FIXTURES_DIR, scale=1, per_page=8):
+        manifest = load_fixtures(fixtures_dir)
+        self.per_page = per_page
+
+        # 목록 항목 (정부24 기본 목록 마크업인 li.result_li_box만 사용)
+        base_items = []
+        skeleton = None
+        for entry in manifest["list"]:
+            soup = BeautifulSoup(entry["html"], "html.parser")
+            items = soup.select("li.result_li_box")
+            if not items:
+                continue
+            for item in items:
+                link = item.select_one("a.list_font17")
+                service_id = link["href"].rstrip("/").split("/")[-1]
+                base_items.append((service_id, link.get_text(strip=True), str(item)))
+            if skeleton is None:
+                skeleton = self._make_skeleton(soup)
+        if skeleton is None:
+            raise ValueError(f"목록 픽스처를 찾지 못했습니다: {fixtures_dir}")
+        self._skeleton = skeleton
+
+        # scale배로 복제 (복제본은 서비스ID와 민원명에 번호를 붙여 서로 다른 민원으로 만듦)
+        self.items = []
+        self.names = {}
+        for copy_index in range(max(scale, 1)):
+            for service_id, name, html in base_items:
+                if copy_index:
+                    new_id, new_name = f"{service_id}{copy_index:03d}", f"{name} {copy_index}"
+                    html = html.replace(service_id, new_id).replace(name, new_name)
+                    service_id, name = new_id, new_name
+                self.items.append(html)
+                self.names.setdefault(service_id, name)
+        self.last_page = max((len(self.items) + per_page - 1) // per_page, 1)
+
+        # 상세 템플릿: 픽스처에 있는 서비스는 해당 페이지, 나머지는 템플릿 중 하나를 이름만 바꿔 사용
+        base_names = {service_id: name for service_id, name, _ in base_items}
+        self._templates = {}
+        for entry in manifest["detail"]:
+            service_id = entry["service_id"]
+            self._templates[service_id] = (entry["html"], base_names.get(service_id))
+        self._template_ids = sorted(self._templates)
+        self.js_only_html = manifest["js_only"][0]["html"] if manifest.get("js_only") else "<html><body></body></html>"
+
+    @staticmethod
+    def _make_skeleton(soup):
+        """목록 페이지에서 항목과 페이지네이션 자리를 표시한 뼈대 HTML"""
+        container = soup.select_one("div.result_list ul")
+        container.clear()
+        container.append(_ITEMS_MARKER)
+        pagination = soup.select_one("div.pagination_box")
+        pagination.replace_with(_PAGINATION_MARKER)
+        return str(soup)
+
+    def pagination(self, current):
+        """applySetPage 페이지네이션 HTML"""
+        first = (current - 1) // PAGE_WINDOW * PAGE_WINDOW + 1
+        parts = ['<div class="pagination_box"><ul>',
+                 '<li class="page_first"><a href="#" onclick="applySetPage(\'1\'); return false;">처음</a></li>']
+        for page in range(first, min(first + PAGE_WINDOW, self.last_page + 1)):
+            on = ' class="on"' if page == current else ''
+            parts.append(f'<li{on}><a href="#" onclick="applySetPage(\'{page}\'); return false;">{page}</a></li>')
+        parts.append(f'<li class="page_last"><a href="#" onclick="applySetPage(\'{self.last_page}\'); return false;">마지막</a></li>')
+        parts.append('</ul></div>')
+        return "".join(parts)
+
+    def list_page(self, page):
+        """pageIndex에 해당하는 목록 페이지 (범위 밖이면 빈 목록)"""
+        start = (page - 1) * self.per_page
+        items = self.items[start:start + self.per_page] if page >= 1 else []
+        return (self._skeleton.replace(_ITEMS_MARKER, "\n".join(items))
+                .replace(_PAGINATION_MARKER, self.pagination(max(min(page, self.last_page), 1))))
+
+    def detail_page(self, service_id):
+        """서비스ID의 상세 페이지 (목록에 없는 ID면 None)"""
+        if service_id not in self.names:
+            return None
+        if service_id in self._templates:
+            return self._templates[service_id][0]
+        # 복제본이나 픽스처가 없는 서비스는 ID로 고정된 템플릿을 골라 민원명만 바꿈
+        template_id = self._template_ids[zlib.crc32(service_id.encode("utf-8")) % len(self._template_ids)]
+        html, template_name = self._templates[template_id]
+        name = self.names[service_id]
+        return html.replace(template_name, name) if template_name else html
+
+
+class MockRequestHandler(BaseHTTPRequestHandler):
+    """모의 정부24 요청 처리"""
+
+    server_version = "MockGov24/1.0"
+    # 실제 사이트처럼 keep-alive 연결 유지 (모든 응답에 Content-Length가 있음)
+    protocol_version = "HTTP/1.1"
+    # 유휴 연결을 닫기까지의 시간 (초)
+    timeout = 30
+
+    def setup(self):
+        super().setup()
+        self.server.count("connections")
+
+    def log_message(self, format, *args):
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        status, body, content_type, headers = self.server.respond(self.path)
+        self._send(status, body, content_type, headers)
+
+
+if H2_AVAILABLE:
+    class MockH2Handler(socketserver.BaseRequestHandler):
+        """HTTP/2 평문(h2c, prior knowledge) 연결 하나 처리 - 스트림마다 별도 스레드에서 응답"""
+
+        def setup(self):
+            self.server.count("connections")
+            config = h2.config.H2Configuration(client_side=False, header_encoding="utf-8")
+            self.conn = h2.connection.H2Connection(config=config)
+            self.lock = threading.Lock()
+            self.window_open = threading.Condition(self.lock)
+            self.closed = False
+
+        def _flush(self):
+            """보낼 프레임 전송 (lock을 잡은 상태에서 호출)"""
+            data = self.conn.data_to_send()
+            if data:
+                self.request.sendall(data)
+
+        def handle(self):
+            with self.lock:
+                self.conn.initiate_connection()
+                self._flush()
+            while not self.closed:
+                try:
+                    data = self.request.recv(65536)
+                except OSError:
+                    break
+                if not data:
+                    break
+                with self.lock:
+                    try:
+                        events = self.conn.receive_data(data)
+                    except h2.exceptions.ProtocolError:
+                        break
+                    for event in events:
+                        if isinstance(event, h2.events.RequestReceived):
+                            path = dict(event.headers).get(":path", "/")
+                            threading.Thread(target=self._respond, args=(event.stream_id, path), daemon=True).start()
+                        elif isinstance(event, (h2.events.WindowUpdated, h2.events.RemoteSettingsChanged)):
+                            self.window_open.notify_all()
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            self.closed = True
+                    self._flush()
+            with self.lock:
+                self.closed = True
+                self.window_open.notify_all()
+
+        def _respond(self, stream_id, path):
+            status, body, content_type, headers = self.server.respond(path)
+            data = body.encode("utf-8")
+            response_headers = [
+                (":status", str(status)), ("content-type", content_type), ("content-length", str(len(data))),
+                ("server", MockRequestHandler.server_version),
+            ] + [(key.lower(), value) for key, value in (headers or {}).items()]
+            try:
+                with self.lock:
+                    if self.closed:
+                        return
+                    self.conn.send_headers(stream_id, response_headers)
+                    offset = 0
+                    while True:
+                        # 흐름 제어 창이 남은 만큼만 보내고, 모자라면 WINDOW_UPDATE를 기다림
+                        window = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                        if window <= 0 and offset < len(data):
+                            self._flush()
+                            self.window_open.wait()
+                            if self.closed:
+                                return
+                            continue
+                        chunk = data[offset:offset + window]
+                        offset += len(chunk)
+                        self.conn.send_data(stream_id, chunk, end_stream=offset >= len(data))
+                        if offset >= len(data):
+                            break
+                    self._flush()
+            except (h2.exceptions.StreamClosedError, OSError):
+                pass
+
+
+class MockGovServer(ThreadingHTTPServer):
+    """픽스처 기반 정부24 모의 서버 (백그라운드 스레드에서 실행 가능)"""
+
+    daemon_threads = True
+
+    handler_class = MockRequestHandler
+
+    def __init__(self, host="127.0.0.1", port=0, config=None, fixtures_dir=FIXTURES_DIR, scale=1, per_page=8):
+        self.site = FixtureSite(fixtures_dir, scale, per_page)
+        self.config = config or FaultConfig()
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._thread = None
+        super().__init__((host, port), self.handler_class)
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, key):
+        with self._lock:
+            self._stats[key] = self._stats.get(key, 0) + 1
+
+    def snapshot_stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def uniform(self, low, high):
+        with self._lock:
+            return self._rng.uniform(low, high)
+
+    def draw_fault(self, kind):
+        """이번 요청에 적용할 장애 종류 (None, error, rate_limit, js_only)"""
+        config = self.config
+        with self._lock:
+            roll = self._rng.random()
+        if roll < config.error_rate:
+            return "error"
+        roll -= config.error_rate
+        if roll < config.rate_limit_rate:
+            return "rate_limit"
+        roll -= config.rate_limit_rate
+        # JS 전용 페이지는 상세 페이지에만 섞음
+        if kind == "detail" and roll < config.js_only_rate:
+            return "js_only"
+        return None
+
+    def respond(self, target):
+        """요청 경로(쿼리 포함)에 대한 응답 - (상태 코드, 본문, Content-Type, 추가 헤더)"""
+        parts = urllib.parse.urlsplit(target)
+        path = parts.path.rstrip("/") or "/"
+        html_type = "text/html; charset=utf-8"
+
+        if path == STATS_PATH:
+            return 200, json.dumps(self.snapshot_stats(), ensure_ascii=False), "application/json; charset=utf-8", None
+
+        if path.startswith(LIST_PATHS):
+            kind = "list"
+        elif path.startswith(DETAIL_PATH):
+            kind = "detail"
+        else:
+            self.count("not_found")
+            return 404, "<html><body>페이지를 찾을 수 없습니다.</body></html>", html_type, None
+        self.count(f"{kind}_requests")
+
+        # 지연과 장애 주입
+        config = self.config
+        fault = self.draw_fault(kind)
+        delay = config.latency + (self.uniform(0, config.jitter) if config.jitter else 0.0)
+        if config.slow_rate and self.uniform(0, 1) < config.slow_rate:
+            self.count("slow")
+            delay += config.slow_latency
+        if delay > 0:
+            time.sleep(delay)
+        if fault == "error":
+            self.count("status_500")
+            return 500, "<html><body>일시적인 오류가 발생했습니다.</body></html>", html_type, None
+        if fault == "rate_limit":
+            self.count("status_429")
+            return (429, "<html><body>요청이 너무 많습니다.</body></html>", html_type,
+                    {"Retry-After": str(config.retry_after)})
+        if fault == "js_only":
+            self.count("js_only")
+            return 200, self.site.js_only_html, html_type, None
+
+        if kind == "list":
+            query = urllib.parse.parse_qs(parts.query)
+            try:
+                page = int(float(query.get("pageIndex", ["1"])[0]))
+            except ValueError:
+                page = 1
+            self.count("status_200")
+            return 200, self.site.list_page(page), html_type, None
+
+        html = self.site.detail_page(path[len(DETAIL_PATH):])
+        if html is None:
+            self.count("not_found")
+            return 404, "<html><body>서비스 정보를 찾을 수 없습니다.</body></html>", html_type, None
+        self.count("status_200")
+        return 200, html, html_type, None
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작 후 기본 주소 반환"""
+        self._thread = threading.Thread(target=self.serve_forever, name="mock-gov24", daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        """서버 종료"""
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+
+if H2_AVAILABLE:
+    class MockGovH2Server(MockGovServer):
+        """HTTP/2 평문(h2c) 모의 서버 - 클라이언트는 prior knowledge로 접속해야 함 (HTTP/2 전송 비교용)"""
+
+        handler_class = MockH2Handler
+
+
+def main(argv=None):
+    """모의 서버 실행"""
+    parser = argparse.ArgumentParser(description="부하 테스트용 로컬 정부24 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소")
+    parser.add_argument("--port", type=int, default=8024, help="포트 (0=임의 포트)")
+    parser.add_argument("--fixtures", default=FIXTURES_DIR, help="픽스처 디렉토리")
+    parser.add_argument("--scale", type=int, default=1, help="픽스처 민원을 몇 배로 늘릴지")
+    parser.add_argument("--per-page", type=int, default=8, help="목록 페이지당 민원 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연에 더할 최대 무작위 시간 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 오류 비율 (0~1)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--js-only-rate", type=float, default=0.0, help="상세 페이지를 JS 전용 페이지로 보낼 비율 (0~1)")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="응답을 --slow-latency만큼 더 늦출 요청 비율 (0~1, 꼬리 지연)")
+    parser.add_argument("--slow-latency", type=float, default=0.0, help="느린 요청에 더할 지연 시간 (초)")
+    parser.add_argument("--seed", type=int, default=None, help="장애 주입 난수 시드")
+    parser.add_argument("--http2", action="store_true", help="HTTP/2 평문(h2c, prior knowledge)으로 제공 (h2 패키지 필요)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    config = FaultConfig(args.latency, args.jitter, args.error_rate, args.rate_limit_rate,
+                         args.retry_after, args.js_only_rate, args.seed, args.slow_rate, args.slow_latency)
+    if args.http2 and not H2_AVAILABLE:
+        logger.error("HTTP/2 모의 서버에는 h2 패키지가 필요합니다. (pip install h2)")
+        return 1
+    server_class = MockGovH2Server if args.http2 else MockGovServer
+    server = server_class(args.host, args.port, config, args.fixtures, args.scale, args.per_page)
+    logger.info(f"모의 서버 실행: {server.base_url} (목록 {server.site.last_page}페이지, 민원 {len(server.site.items)}건)")
+    logger.info(f"크롤러 실행 예: python -m hanolcare_crawler --auto --base-url {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info(f"모의 서버 종료 - 요청 통계: {server.snapshot_stats()}")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
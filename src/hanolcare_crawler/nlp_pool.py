@@ -0,0 +1,76 @@
+"""
+텍스트 분석(NLP) 워커 프로세스 풀
+
+KoNLPy Okt는 JPype를 통해 JVM 안에서 동작하기 때문에 크롤러 프로세스에서 직접
+호출하면 페치 스레드와 락을 경쟁하고 힙 메모리도 크게 늘어난다. 이 모듈은 분석
+작업을 별도 프로세스(각자 자신의 JVM을 가짐)로 넘기고 결과를 Future로 돌려준다.
+"""
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker(backend):
+    """워커 프로세스 초기화 - 프로세스마다 독립된 분석기(JVM)를 준비"""
+    from . import crawler
+    crawler.set_nlp_enabled(True)
+    crawler.set_nlp_backend(backend)
+    crawler.korean_backend()
+
+
+def _probe_worker():
+    """워커 프로세스의 분석기 사용 가능 여부 확인"""
+    from . import crawler
+    return {
+        "pid": os.getpid(),
+        "korean": crawler.korean_backend(),
+        "nltk": crawler.NLTK_AVAILABLE,
+    }
+
+
+def _run_task(fields, tasks):
+    """워커 프로세스에서 텍스트 분석 작업 실행"""
+    from . import crawler
+    return crawler.nlp_enrich(fields, tasks)
+
+
+class NLPWorkerPool:
+    """텍스트 분석 작업을 별도 프로세스에서 비동기로 처리하는 풀"""
+
+    def __init__(self, workers=0, backend="auto"):
+        if workers <= 0:
+            # 크롤러 프로세스 몫으로 코어 하나는 남겨둔다
+            workers = max((os.cpu_count() or 2) - 1, 1)
+        self.workers = workers
+        # fork 시 부모의 JVM/스레드 상태가 복제되지 않도록 spawn 사용
+        context = multiprocessing.get_context("spawn")
+        self._executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(backend,),
+        )
+        self.korean_backend = None
+        self.korean_available = False
+        self.available = False
+        try:
+            probe = self._executor.submit(_probe_worker).result(timeout=120)
+            self.korean_backend = probe["korean"]
+            self.korean_available = probe["korean"] is not None
+            self.available = self.korean_available or probe["nltk"]
+        except Exception as e:
+            logger.warning(f"텍스트 분석 워커 초기화 확인 실패: {str(e)}")
+        logger.info(f"텍스트 분석 워커 풀 시작: {workers}개 프로세스 "
+                    f"(한국어 분석: {self.korean_backend or '미사용'})")
+
+    def submit(self, fields, tasks):
+        """분석 작업을 큐에 넣고 갱신할 필드를 돌려줄 Future 반환"""
+        return self._executor.submit(_run_task, dict(fields), tuple(tasks))
+
+    def shutdown(self, wait=True):
+        """워커 프로세스 종료"""
+        self._executor.shutdown(wait=wait)
+        logger.info("텍스트 분석 워커 풀 종료")
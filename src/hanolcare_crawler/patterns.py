@@ -0,0 +1,212 @@
+"""
+미리 컴파일된 정규식과 다중 패턴 스캐너
+
+목록/상세 추출 루프는 onclick 함수 호출, 서비스ID, 처리기간, 연락처, 페이지 번호
+정규식을 문자열 그대로 re.search에 넘기고, 처리기간처럼 여러 패턴을 우선순위대로
+하나씩 전체 페이지 텍스트에 다시 적용한다. 이 모듈은 패턴을 모듈 로드 시 한 번만
+컴파일하고, 우선순위가 있는 패턴 묶음은 이름 있는 그룹으로 합친 정규식 하나로
+텍스트를 한 번만 훑는다 (MultiPatternScanner).
+
+저장된 페이지로 기존 방식과 비교하는 마이크로 벤치마크:
+    python -m hanolcare_crawler.patterns --pages ~/Desktop/data/pages --repeat 20
+"""
+import argparse
+import os
+import re
+import sys
+import time
+
+# 연속된 공백 (clean_text)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# 단어 토큰 (영문 키워드 추출)
+WORD_RE = re.compile(r'\w+')
+
+# 연락처 (전화번호)
+PHONE_RE = re.compile(r'\d{2,3}-\d{3,4}-\d{4}')
+
+# 페이지네이션 마지막 페이지 onclick과 URL의 페이지 번호
+APPLY_SET_PAGE_RE = re.compile(r"applySetPage\('(\d+\.?\d*)'\)")
+PAGE_INDEX_RE = re.compile(r'pageIndex=\d+')
+
+# 영문 서비스ID 형식과 단어 분해
+SERVICE_ID_FORMAT_RE = re.compile(r'^[A-Za-z0-9_]+$')
+SERVICE_ID_PARTS_RE = re.compile(r'[A-Z][a-z]*|[a-z]+|\d+')
+
+# 우선순위가 있는 패턴 묶음: (이름, 정규식) 목록과 일치가 시작될 수 있는 첫 글자 집합
+# 첫 글자 집합은 합친 정규식 앞의 전방 탐색으로 쓰여 일치할 수 없는 위치를 빠르게 건너뛴다.
+
+# 목록 항목 버튼 onclick - (사업코드, 상위분류코드, 순번)
+ONCLICK_PATTERNS = (
+    ("goUrlNewChk", r"goUrlNewChk\('([^']+)',\s*'([^']+)',\s*'([^']+)'"),
+    ("goServiceDetail", r"goServiceDetail\('([^']+)',\s*'([^']+)',\s*'([^']+)'"),
+    ("fn_goServiceDetail", r"fn_goServiceDetail\('([^']+)',\s*'([^']+)',\s*'([^']+)'"),
+)
+ONCLICK_LEAD = r"[gf]"
+
+# 상세 링크의 민원 ID
+SERVICE_ID_PATTERNS = (
+    ("serviceInfo", r'serviceInfo/([A-Za-z0-9_]+)'),
+    ("id_param", r'[?&]id=([A-Za-z0-9_]+)'),
+)
+SERVICE_ID_LEAD = r"[s?&]"
+
+# 페이지 텍스트의 처리기간 (앞에 있을수록 우선)
+DURATION_PATTERNS = (
+    ("unit", r'(\d+)[일|시간|분]'),
+    ("label", r'처리기간[은|:]?\s*(\d+)'),
+    ("business_days", r'(\d+)\s*(영업일|근무일|업무일)'),
+    ("range", r'(\d+)~(\d+)[일|시간|분]'),
+    ("maximum", r'최대\s*(\d+)[일|시간|분]'),
+    ("within", r'(\d+)일\s*이내'),
+)
+DURATION_LEAD = r"[\d처최]"
+
+
+class MultiPatternScanner:
+    """우선순위가 있는 여러 정규식을 하나로 합쳐 텍스트를 한 번에 훑는 스캐너
+
+    first()는 패턴을 순서대로 re.search 하여 처음 일치한 결과를 쓰는 기존 루프와
+    같은 결과를 돌려준다. 반환되는 일치 객체는 원래 패턴으로 만든 것이므로
+    group 번호도 기존과 같다.
+
+    비용: 합친 정규식으로 가장 앞의 일치를 한 번 찾는다. 어떤 패턴도 일치하지 않거나
+    (기존: 패턴 수만큼 전체 탐색) 가장 앞의 일치가 최우선 패턴이면 그 한 번으로 끝난다.
+    그 밖에는 뒤쪽에서 상위 패턴이 일치할 수 있으므로 기존 루프로 돌아가되, 어떤 패턴도
+    가장 앞의 일치보다 앞에서는 일치하지 않으므로 상위 패턴만 그 위치부터 탐색한다
+    (기존 루프보다 최대 한 번 더 훑음).
+    """
+
+    def __init__(self, patterns, lead=None):
+        self.names = [name for name, _ in patterns]
+        self.compiled = [re.compile(pattern) for _, pattern in patterns]
+        # 각 패턴을 이름 있는 그룹으로 감싼 단일 정규식 (내부 그룹 번호는 사용하지 않음)
+        combined = "|".join(f"(?P<{name}>{pattern})" for name, pattern in patterns)
+        if lead:
+            # 대안이 여러 개면 re가 접두 최적화를 못 하므로 첫 글자 검사를 앞에 둔다
+            combined = f"(?={lead})(?:{combined})"
+        self.combined = re.compile(combined)
+        self._priority = {name: index for index, name in enumerate(self.names)}
+
+    def first(self, text):
+        """우선순위가 가장 높은 패턴의 첫 일치 - (패턴 이름, 일치 객체), 없으면 (None, None)"""
+        if not text:
+            return None, None
+        leftmost = self.combined.search(text)
+        if leftmost is None:
+            # 합친 정규식이 어디에서도 일치하지 않으면 어떤 패턴도 일치하지 않는다
+            return None, None
+        index = self._priority[leftmost.lastgroup]
+        start = leftmost.start()
+        # 상위 패턴은 이 위치 앞에서는 일치하지 않으므로 여기부터 기존 루프대로 확인
+        for higher in range(index):
+            match = self.compiled[higher].search(text, start)
+            if match:
+                return self.names[higher], match
+        # 가장 앞의 일치 위치가 이 패턴의 첫 일치
+        return self.names[index], self.compiled[index].match(text, start)
+
+    def search(self, text):
+        """first()의 일치 객체만 반환 (re.search 대체용)"""
+        return self.first(text)[1]
+
+
+onclick_scanner = MultiPatternScanner(ONCLICK_PATTERNS, ONCLICK_LEAD)
+service_id_scanner = MultiPatternScanner(SERVICE_ID_PATTERNS, SERVICE_ID_LEAD)
+duration_scanner = MultiPatternScanner(DURATION_PATTERNS, DURATION_LEAD)
+
+
+def _legacy_first(patterns, text):
+    """기존 방식 - 패턴 문자열을 순서대로 re.search"""
+    for _, pattern in patterns:
+        match = re.search(pattern, text)
+        if match:
+            return match
+    return None
+
+
+def load_pages(path):
+    """저장된 HTML 페이지들의 본문 텍스트와 onclick/링크 속성 값 목록"""
+    from bs4 import BeautifulSoup
+
+    files = []
+    if os.path.isdir(path):
+        for root, _, names in os.walk(path):
+            files.extend(os.path.join(root, name) for name in sorted(names)
+                         if name.endswith(('.html', '.htm')))
+    else:
+        files.append(path)
+
+    texts, attributes = [], []
+    for file_path in files:
+        with open(file_path, encoding='utf-8', errors='replace') as f:
+            soup = BeautifulSoup(f.read(), 'html.parser')
+        texts.append(soup.get_text())
+        for element in soup.find_all(['a', 'button']):
+            for attr in ('onclick', 'href'):
+                value = element.get(attr)
+                if value:
+                    attributes.append(value)
+    return files, texts, attributes
+
+
+def benchmark(texts, attributes, repeat=10):
+    """기존 re.search 루프와 스캐너의 처리 시간 비교 및 결과 일치 확인"""
+    cases = [
+        ("처리기간", DURATION_PATTERNS, duration_scanner, texts),
+        ("onclick", ONCLICK_PATTERNS, onclick_scanner, attributes),
+        ("서비스ID", SERVICE_ID_PATTERNS, service_id_scanner, attributes),
+    ]
+    results = {}
+    for label, patterns, scanner, inputs in cases:
+        mismatches = 0
+        for text in inputs:
+            legacy = _legacy_first(patterns, text)
+            current = scanner.search(text)
+            if (legacy and legacy.group(0)) != (current and current.group(0)):
+                mismatches += 1
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in inputs:
+                _legacy_first(patterns, text)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for text in inputs:
+                scanner.search(text)
+        scanner_time = time.perf_counter() - start
+
+        results[label] = {
+            "inputs": len(inputs),
+            "legacy_sec": legacy_time,
+            "scanner_sec": scanner_time,
+            "speedup": legacy_time / scanner_time if scanner_time else 0.0,
+            "mismatches": mismatches,
+        }
+    return results
+
+
+def main(argv=None):
+    """저장된 페이지로 정규식 스캐너 마이크로 벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="정규식 스캐너 마이크로 벤치마크")
+    parser.add_argument("--pages", required=True, help="저장된 HTML 파일 또는 디렉토리")
+    parser.add_argument("--repeat", type=int, default=10, help="반복 횟수")
+    args = parser.parse_args(argv)
+
+    files, texts, attributes = load_pages(os.path.expanduser(args.pages))
+    if not files:
+        print("HTML 파일을 찾지 못했습니다.")
+        return 1
+
+    print(f"페이지 {len(files)}개, onclick/href 속성 {len(attributes)}개, 반복 {args.repeat}회")
+    for label, result in benchmark(texts, attributes, args.repeat).items():
+        print(f"{label:8s} 입력 {result['inputs']:6d}개  기존 {result['legacy_sec']:.4f}초  "
+              f"스캐너 {result['scanner_sec']:.4f}초  ({result['speedup']:.2f}배)  "
+              f"불일치 {result['mismatches']}건")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
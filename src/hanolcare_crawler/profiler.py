@@ -0,0 +1,221 @@
+"""
+수집 중 샘플링 프로파일러
+
+별도 스레드가 일정 간격으로 sys._current_frames()를 읽어 모든 워커 스레드의 호출 스택을
+모은다. 코드에 계측을 넣지 않으므로 기본 간격(10ms)에서는 부하가 작아 야간 수집에서도
+켜 둘 수 있다. 각 샘플은 스택에서 가장 안쪽의 크롤러 단계 함수(extract_detail_info,
+_fetch_page_document, analyze_text 등)로 단계를 정하고, 결과는 다음 파일로 저장한다.
+
+- profile_<시각>.speedscope.json: 전체 + 단계별 프로파일 (https://www.speedscope.app 에서 열기)
+- profile_<시각>.folded: flamegraph.pl 등에서 쓰는 접힌 스택 형식 (단계가 루트 프레임)
+"""
+import collections
+import datetime
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 기본 샘플링 간격 (초)
+DEFAULT_INTERVAL = 0.01
+
+# 크롤러 함수 -> 단계 (스택에서 가장 안쪽에 있는 함수의 단계로 분류)
+STAGE_FUNCTIONS = {
+    "fetch_single_page": "list_fetch",
+    "extract_minwon_list": "list_extract",
+    "get_last_page_number": "list_extract",
+    "get_page_content": "fetch",
+    "get_page_document": "fetch",
+    "_fetch_page_document": "fetch",
+    "_render_with_playwright": "playwright",
+    "parse_document": "parse",
+    "extract_detail_info": "extract",
+    "analyze_text": "nlp",
+    "nlp_enrich": "nlp",
+    "enhance_text_with_keywords": "nlp",
+    "resolve_nlp_pending": "nlp",
+    "validate_minwon_data": "validate",
+    "retry_process_minwon": "retry",
+    "save_to_csv": "write",
+    "save_checkpoint": "write",
+    "append_checkpoint": "write",
+    "filter_duplicate_minwons": "dedup",
+    "filter_near_duplicate_minwons": "dedup",
+    "collapse_list_items": "dedup",
+    "apply_corpus_keywords": "keywords",
+}
+
+# 크롤러 함수가 없는 스택 중 대기 상태로 보는 함수 (스레드 풀 유휴, 결과 대기 등)
+IDLE_FUNCTIONS = {"wait", "get", "_worker", "as_completed", "result", "select", "accept", "serve_forever"}
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class SamplingProfiler:
+    """모든 스레드의 스택을 주기적으로 샘플링하는 프로파일러"""
+
+    def __init__(self, interval=DEFAULT_INTERVAL):
+        self.interval = interval
+        self.samples = collections.Counter()  # (단계, 프레임 인덱스 튜플) -> 샘플 수
+        self.frames = []  # (함수명, 파일, 줄)
+        self._frame_index = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self.started = None
+        self.elapsed = 0.0
+        self.ticks = 0
+        self.sampling_time = 0.0
+
+    def start(self):
+        self.started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return self
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.elapsed = time.perf_counter() - self.started
+        return self
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            start = time.perf_counter()
+            self.sample(exclude=own_id)
+            self.sampling_time += time.perf_counter() - start
+            self.ticks += 1
+
+    def _frame_id(self, code):
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        index = self._frame_index.get(key)
+        if index is None:
+            index = self._frame_index[key] = len(self.frames)
+            self.frames.append(key)
+        return index
+
+    def sample(self, exclude=None):
+        """현재 모든 스레드의 스택을 한 번 기록"""
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == exclude:
+                continue
+            stack = []
+            stage = None
+            while frame is not None:
+                code = frame.f_code
+                stack.append(self._frame_id(code))
+                if stage is None and code.co_filename.startswith(PACKAGE_DIR):
+                    stage = STAGE_FUNCTIONS.get(code.co_name)
+                frame = frame.f_back
+            if stage is None:
+                stage = "idle" if self.frames[stack[0]][0] in IDLE_FUNCTIONS else "other"
+            stack.reverse()  # 바깥 -> 안쪽
+            self.samples[(stage, tuple(stack))] += 1
+
+    def stage_totals(self):
+        """단계별 샘플 수"""
+        totals = collections.Counter()
+        for (stage, _), count in self.samples.items():
+            totals[stage] += count
+        return totals
+
+    def function_totals(self, stage=None):
+        """함수별 (자기 시간 샘플 수, 포함 시간 샘플 수)"""
+        self_counts = collections.Counter()
+        total_counts = collections.Counter()
+        for (sample_stage, stack), count in self.samples.items():
+            if stage is not None and sample_stage != stage:
+                continue
+            self_counts[stack[-1]] += count
+            for index in set(stack):
+                total_counts[index] += count
+        return self_counts, total_counts
+
+    def _frame_name(self, index):
+        name, filename, line = self.frames[index]
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def to_speedscope(self, name="hanolcare-crawler"):
+        """speedscope 파일 형식 딕셔너리 (전체 + 단계별 sampled 프로파일)"""
+        groups = collections.defaultdict(list)
+        for (stage, stack), count in self.samples.items():
+            groups[stage].append((stack, count))
+            groups["all"].append((stack, count))
+        order = ["all"] + [stage for stage, _ in self.stage_totals().most_common()]
+        profiles = []
+        for stage in order:
+            entries = groups[stage]
+            weights = [count * self.interval for _, count in entries]
+            profiles.append({
+                "type": "sampled",
+                "name": f"{stage} ({sum(count for _, count in entries)} samples)",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": [list(stack) for stack, _ in entries],
+                "weights": weights,
+            })
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "hanolcare_crawler.profiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": [{"name": n, "file": f, "line": l} for n, f, l in self.frames]},
+            "profiles": profiles,
+        }
+
+    def to_folded(self):
+        """접힌 스택 형식 문자열 (단계;바깥 함수;...;안쪽 함수 샘플수)"""
+        lines = []
+        for (stage, stack), count in sorted(self.samples.items(), key=lambda item: -item[1]):
+            names = [stage] + [self.frames[index][0] for index in stack]
+            lines.append(f"{';'.join(names)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def save(self, output_dir, prefix=None):
+        """speedscope/접힌 스택 파일 저장 후 경로 반환"""
+        os.makedirs(output_dir, exist_ok=True)
+        prefix = prefix or f"profile_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        speedscope_path = os.path.join(output_dir, f"{prefix}.speedscope.json")
+        with open(speedscope_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_speedscope(prefix), f, ensure_ascii=False)
+        folded_path = os.path.join(output_dir, f"{prefix}.folded")
+        with open(folded_path, "w", encoding="utf-8") as f:
+            f.write(self.to_folded())
+        return speedscope_path, folded_path
+
+    def summary_lines(self, top=10):
+        """단계별 샘플 비율과 작업 단계의 상위 함수 (로그 출력용)"""
+        totals = self.stage_totals()
+        all_samples = sum(totals.values())
+        if not all_samples:
+            return []
+        overhead = self.sampling_time / self.elapsed * 100 if self.elapsed else 0.0
+        lines = [f"샘플 {self.ticks}회 x {self.interval * 1000:.0f}ms, 스레드 샘플 {all_samples}개 (샘플링 부하 {overhead:.2f}%)"]
+        for stage, count in totals.most_common():
+            lines.append(f"  {stage:14s} {count:7d} ({count / all_samples * 100:5.1f}%)")
+
+        # 대기 샘플을 뺀 작업 시간 기준 상위 함수
+        self_counts = collections.Counter()
+        for stage in totals:
+            if stage != "idle":
+                self_counts.update(self.function_totals(stage)[0])
+        busy = sum(self_counts.values())
+        if busy:
+            lines.append(f"자기 시간 상위 함수 (대기 제외 {busy}개 샘플 기준):")
+            for index, count in self_counts.most_common(top):
+                lines.append(f"  {count / busy * 100:5.1f}%  {self._frame_name(index)}")
+        return lines
+
+
+def log_summary(profiler):
+    """프로파일 요약을 로그로 출력"""
+    for line in profiler.summary_lines():
+        logger.info(line)
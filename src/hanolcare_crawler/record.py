@@ -0,0 +1,149 @@
+"""
+고정 스키마 민원 레코드
+
+민원 하나는 50개 가까운 문자열 필드를 가지며 대부분 빈 문자열이거나 "정보 없음" 같은
+반복 값이다. 딕셔너리로 두면 레코드마다 키 해시 테이블을 따로 가지므로, 필드 순서를
+모듈 전역 스키마로 고정하고 값만 __slots__ 객체의 리스트(열 인덱스)에 저장한다.
+유형/인증필요/오류여부/담당부서처럼 몇 가지 값만 반복되는 필드와 자동 생성 문구는
+sys.intern으로 같은 문자열 객체를 공유한다.
+
+MinwonRecord는 MutableMapping이므로 기존 코드의 record["민원명"], record.get(...),
+items(), update(), setdefault(), pop() 등을 그대로 사용할 수 있다. 스키마에 없는 키
+(예: 텍스트 분석 대기 목록)는 별도 딕셔너리에 저장한다.
+"""
+import sys
+from collections.abc import MutableMapping
+
+# 레코드 필드 (CSV 열 순서와 동일)
+RECORD_FIELDS = (
+    # 기본 필드
+    "민원명", "설명", "담당부서", "인증필요", "유형", "링크", "링크텍스트",
+    "서비스ID", "카테고리", "일련번호", "처리절차", "신청방법", "필요서류",
+    "수수료", "담당기관", "연락처", "처리기간", "신청자격", "관련법령",
+    "첨부파일", "기타정보", "오류여부",
+
+    # 추가 필드
+    "신청기간", "결제정보", "수령방법", "처리상태", "민원유형",
+    "참고정보", "연관민원", "운영시간", "처리시간", "지원금액",
+    "관련서식", "담당자정보", "서비스상태", "신청경로", "서비스분류",
+    "민원분류", "프로세스이미지", "API정보",
+
+    # 수집 후 단계에서 채우는 필드
+    "키워드",
+)
+FIELD_INDEX = {name: index for index, name in enumerate(RECORD_FIELDS)}
+
+# 값의 종류가 적어 문자열 객체를 공유하는 필드
+INTERNED_FIELDS = frozenset({"유형", "인증필요", "오류여부", "담당부서", "민원분류", "카테고리"})
+
+# 여러 필드에 반복해서 들어가는 자동 생성 문구
+SENTINEL_VALUES = {
+    value: sys.intern(value)
+    for value in (
+        "정상", "정보 없음", "정보 없음 (자동 생성)", "링크 없음", "링크없음", "필수정보 누락", "일부 정보 누락",
+        "재처리 성공", "정보를 가져올 수 없음 (자동 생성)", "오류로 인해 정보를 가져올 수 없음", "민원",
+    )
+}
+
+# 값이 없는 칸 표시 (빈 문자열과 구분)
+_MISSING = object()
+_FIELD_COUNT = len(RECORD_FIELDS)
+
+
+def _compact(key, value):
+    if key in INTERNED_FIELDS:
+        return sys.intern(value)
+    return SENTINEL_VALUES.get(value, value)
+
+
+class MinwonRecord(MutableMapping):
+    """열 인덱스 배열에 값을 저장하는 딕셔너리 호환 민원 레코드"""
+
+    __slots__ = ("_values", "_extra")
+
+    def __init__(self, data=None, **kwargs):
+        self._values = [_MISSING] * _FIELD_COUNT
+        self._extra = None
+        if data:
+            self.update(data)
+        if kwargs:
+            self.update(kwargs)
+
+    def __getitem__(self, key):
+        index = FIELD_INDEX.get(key)
+        if index is None:
+            if self._extra is None:
+                raise KeyError(key)
+            return self._extra[key]
+        value = self._values[index]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        index = FIELD_INDEX.get(key)
+        if index is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+            return
+        if type(value) is str:
+            value = _compact(key, value)
+        self._values[index] = value
+
+    def __delitem__(self, key):
+        index = FIELD_INDEX.get(key)
+        if index is None:
+            if self._extra is None:
+                raise KeyError(key)
+            del self._extra[key]
+            return
+        if self._values[index] is _MISSING:
+            raise KeyError(key)
+        self._values[index] = _MISSING
+
+    def __iter__(self):
+        for name, value in zip(RECORD_FIELDS, self._values):
+            if value is not _MISSING:
+                yield name
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        count = _FIELD_COUNT - self._values.count(_MISSING)
+        return count + (len(self._extra) if self._extra else 0)
+
+    def __contains__(self, key):
+        index = FIELD_INDEX.get(key)
+        if index is None:
+            return self._extra is not None and key in self._extra
+        return self._values[index] is not _MISSING
+
+    def get(self, key, default=None):
+        # Mapping.get은 예외 처리를 거치므로 자주 호출되는 경로를 직접 구현
+        index = FIELD_INDEX.get(key)
+        if index is None:
+            return self._extra.get(key, default) if self._extra else default
+        value = self._values[index]
+        return default if value is _MISSING else value
+
+    def copy(self):
+        other = MinwonRecord()
+        other._values = list(self._values)
+        other._extra = dict(self._extra) if self._extra else None
+        return other
+
+    def to_dict(self):
+        """일반 딕셔너리로 변환 (JSON 직렬화 등)"""
+        return dict(self.items())
+
+    def __reduce__(self):
+        return MinwonRecord, (self.to_dict(),)
+
+    def __repr__(self):
+        return f"MinwonRecord({self.to_dict()!r})"
+
+
+def to_record(data):
+    """딕셔너리를 MinwonRecord로 변환 (이미 레코드면 그대로 반환)"""
+    return data if isinstance(data, MinwonRecord) else MinwonRecord(data)
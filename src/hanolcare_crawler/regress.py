@@ -0,0 +1,243 @@
+"""
+성능 회귀 검사
+
+오프라인 추출 벤치마크(bench)와 로컬 모의 서버(mock_server)를 대상으로 한 전체 수집을
+실행하고, 처리량, p50/p95 지연 시간, 최대 메모리를 저장된 기준값 파일과 비교한다.
+기준값보다 허용 비율 이상 나빠진 지표가 있으면 표로 보여주고 종료 코드 1을 반환한다.
+
+기준값은 실행 환경에 따라 달라지므로 기준 장비에서 --update-baseline으로 갱신한다:
+    python -m hanolcare_crawler.regress
+    python -m hanolcare_crawler.regress --update-baseline
+"""
+import argparse
+import datetime
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import threading
+import time
+
+from .bench import FIXTURES_DIR, git_revision, percentile, run_benchmark
+
+try:
+    import resource
+    RESOURCE_AVAILABLE = True
+except ImportError:  # Windows
+    RESOURCE_AVAILABLE = False
+
+BASELINE_PATH = os.path.join(FIXTURES_DIR, "perf_baseline.json")
+
+# 기준값 대비 허용하는 악화 비율 (지표별 threshold가 있으면 그 값을 사용)
+DEFAULT_THRESHOLD = 0.25
+
+# 전체 수집 측정 조건 (기준값과 같은 조건으로 비교해야 의미가 있음)
+E2E_SCALE = 5
+E2E_WORKERS = 4
+E2E_LATENCY = 0.02
+E2E_SEED = 24
+
+
+def _metric(value, higher_is_better, unit):
+    return {"value": value, "higher_is_better": higher_is_better, "unit": unit}
+
+
+def offline_metrics(repeat=3):
+    """오프라인 추출 벤치마크 지표"""
+    result = run_benchmark(repeat)
+    functions = result["functions"]
+    metrics = {
+        "offline.pages_per_sec": _metric(result["total"]["pages_per_sec"], True, "pages/s"),
+        "offline.peak_traced_mb": _metric(result["memory"]["peak_traced_bytes"] / 1024 / 1024, False, "MB"),
+    }
+    for name in ("extract_minwon_list", "extract_detail_info"):
+        if name in functions:
+            metrics[f"offline.{name}.p50_ms"] = _metric(functions[name]["p50_ms"], False, "ms")
+            metrics[f"offline.{name}.p95_ms"] = _metric(functions[name]["p95_ms"], False, "ms")
+    return metrics, result["mismatches"]
+
+
+def e2e_metrics(scale=E2E_SCALE, workers=E2E_WORKERS, latency=E2E_LATENCY, seed=E2E_SEED):
+    """모의 서버를 대상으로 전체 수집을 실행한 지표 (상세 페이지 처리량과 지연 시간)"""
+    from . import crawler
+    from .mock_server import FaultConfig, MockGovServer
+
+    durations = []
+    durations_lock = threading.Lock()
+    original_extract = crawler.extract_detail_info
+    original_base_url = crawler.BASE_URL
+
+    def timed_extract(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original_extract(*args, **kwargs)
+        finally:
+            with durations_lock:
+                durations.append(time.perf_counter() - start)
+
+    crawler_logger = logging.getLogger(crawler.__name__)
+    previous_level = crawler_logger.level
+    crawler_logger.setLevel(logging.ERROR)
+    config = FaultConfig(latency=latency, seed=seed)
+    try:
+        with MockGovServer(config=config, scale=scale) as server, tempfile.TemporaryDirectory() as output_dir:
+            args = argparse.Namespace(
+                output=output_dir, test=False, workers=workers, page=0, nlp=False,
+                base_url=server.base_url, keywords=10, near_dup_threshold=0.0,
+            )
+            # 상세 페이지 하나의 가져오기+추출 시간을 재기 위해 수집 동안만 감쌈
+            crawler.extract_detail_info = timed_extract
+            start = time.perf_counter()
+            crawler.run_crawler_with_args(args)
+            elapsed = time.perf_counter() - start
+            server_stats = server.snapshot_stats()
+    finally:
+        crawler.extract_detail_info = original_extract
+        crawler.BASE_URL = original_base_url
+        crawler_logger.setLevel(previous_level)
+
+    pages = server_stats.get("detail_requests", 0) + server_stats.get("list_requests", 0)
+    return {
+        "e2e.details_per_sec": _metric(len(durations) / elapsed if elapsed else 0.0, True, "pages/s"),
+        "e2e.requests_per_sec": _metric(pages / elapsed if elapsed else 0.0, True, "req/s"),
+        "e2e.detail_p50_ms": _metric(percentile(durations, 50) * 1000, False, "ms"),
+        "e2e.detail_p95_ms": _metric(percentile(durations, 95) * 1000, False, "ms"),
+    }
+
+
+def peak_rss_mb():
+    """이 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if not RESOURCE_AVAILABLE:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return rss / 1024 / 1024 if sys.platform == "darwin" else rss / 1024
+
+
+def collect_metrics(repeat=3, e2e=True):
+    """회귀 검사에 쓰는 모든 지표 수집"""
+    metrics, mismatches = offline_metrics(repeat)
+    if e2e:
+        metrics.update(e2e_metrics())
+    rss = peak_rss_mb()
+    if rss is not None:
+        metrics["peak_rss_mb"] = _metric(rss, False, "MB")
+    return metrics, mismatches
+
+
+def compare(baseline, current, threshold=None):
+    """기준값과 현재 지표 비교 - (행 목록, 회귀 지표 이름 목록)"""
+    default_threshold = threshold if threshold is not None else baseline.get("threshold", DEFAULT_THRESHOLD)
+    rows = []
+    regressions = []
+    for name, base in baseline["metrics"].items():
+        if name not in current:
+            rows.append((name, base["value"], None, None, "측정 안 됨"))
+            continue
+        base_value = base["value"]
+        value = current[name]["value"]
+        limit = base.get("threshold", default_threshold) if threshold is None else threshold
+        if not base_value:
+            rows.append((name, base_value, value, None, "기준값 없음"))
+            continue
+        change = (value - base_value) / base_value
+        # 나빠진 비율 (높을수록 좋은 지표는 감소, 낮을수록 좋은 지표는 증가가 악화)
+        worse = -change if base["higher_is_better"] else change
+        if worse > limit:
+            status = f"회귀 (허용 {limit:.0%})"
+            regressions.append(name)
+        elif worse < -limit:
+            status = "개선"
+        else:
+            status = "정상"
+        rows.append((name, base_value, value, change, status))
+    for name in current:
+        if name not in baseline["metrics"]:
+            rows.append((name, None, current[name]["value"], None, "새 지표"))
+    return rows, regressions
+
+
+def format_table(rows):
+    """비교 결과 표 문자열"""
+    lines = [f"{'지표':34s} {'기준값':>12s} {'현재값':>12s} {'변화':>9s}  상태", "-" * 80]
+    for name, base_value, value, change, status in rows:
+        base_text = f"{base_value:12.2f}" if base_value is not None else f"{'-':>12s}"
+        value_text = f"{value:12.2f}" if value is not None else f"{'-':>12s}"
+        change_text = f"{change:+9.1%}" if change is not None else f"{'-':>9s}"
+        lines.append(f"{name:34s} {base_text} {value_text} {change_text}  {status}")
+    return "\n".join(lines)
+
+
+def load_baseline(path=BASELINE_PATH):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(metrics, path=BASELINE_PATH, threshold=DEFAULT_THRESHOLD):
+    """현재 지표를 기준값 파일로 저장 (기존 파일의 지표별 허용 비율은 유지)"""
+    if os.path.exists(path):
+        previous = load_baseline(path)["metrics"]
+        metrics = {
+            name: dict(metric, threshold=previous[name]["threshold"])
+            if "threshold" in previous.get(name, {}) else metric
+            for name, metric in metrics.items()
+        }
+    baseline = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "threshold": threshold,
+        "metrics": metrics,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baseline, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    return path
+
+
+def main(argv=None):
+    """성능 회귀 검사 실행"""
+    parser = argparse.ArgumentParser(description="기준값 대비 성능 회귀 검사 (오프라인 벤치마크 + 모의 서버 전체 수집)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="기준값 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=None, help="허용 악화 비율 (예: 0.25 = 25%%, 기본값: 기준값 파일 설정)")
+    parser.add_argument("--repeat", type=int, default=3, help="오프라인 벤치마크 반복 횟수")
+    parser.add_argument("--skip-e2e", action="store_true", help="모의 서버 전체 수집 측정 생략")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 측정값으로 기준값 파일 갱신")
+    parser.add_argument("--output", help="현재 측정값 JSON 저장 경로")
+    args = parser.parse_args(argv)
+
+    metrics, mismatches = collect_metrics(args.repeat, e2e=not args.skip_e2e)
+    for message in mismatches:
+        print(f"기대값 불일치: {message}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"revision": git_revision(), "metrics": metrics}, f, ensure_ascii=False, indent=2)
+
+    if args.update_baseline:
+        path = save_baseline(metrics, args.baseline, args.threshold if args.threshold is not None else DEFAULT_THRESHOLD)
+        print(f"기준값 갱신: {path}")
+        return 1 if mismatches else 0
+
+    if not os.path.exists(args.baseline):
+        print(f"기준값 파일이 없습니다: {args.baseline} (--update-baseline으로 생성)")
+        return 1
+
+    baseline = load_baseline(args.baseline)
+    rows, regressions = compare(baseline, metrics, args.threshold)
+    print(f"기준값: {args.baseline} (커밋 {baseline.get('revision') or '알 수 없음'}, {baseline.get('created', '')})")
+    print(format_table(rows))
+    if regressions:
+        print(f"\n성능 회귀 {len(regressions)}건: {', '.join(regressions)}")
+        return 1
+    if mismatches:
+        return 1
+    print("\n성능 회귀 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,349 @@
+"""
+재시도 정책 (지터 백오프, Retry-After, 실행 단위 재시도 예산, 비차단 재예약)
+
+목록 페이지, 상세 페이지, 유효성 검증 실패 재처리가 같은 규칙으로 재시도한다.
+
+- 대기 시간: decorrelated jitter (base ~ 직전 대기 x 3 사이 무작위, 최대 cap).
+  여러 워커가 같은 순간에 실패해도 재시도 시각이 흩어진다.
+- Retry-After: 429/503 응답의 Retry-After(초 또는 HTTP 날짜)보다 일찍 다시 보내지 않는다.
+  너무 길면(MAX_RETRY_AFTER 초과) 기다리지 않고 포기한다.
+- 재시도 예산: 한 실행에서 허용하는 재시도 수를 (최소 재시도 수 + 작업 수 x 비율)로 제한해
+  사이트 장애 때 재시도가 요청을 몇 배로 늘리지 않게 한다.
+- 비차단 재예약: submit()으로 스레드 풀에 넣은 작업은 대기하는 동안 워커를 붙잡지 않는다.
+  재시도가 필요하면 RetryLater로 작업을 빠져나오고, 타이머 스레드가 대기 시간 뒤에 작업을
+  다시 제출한다. 다시 실행된 작업은 이미 기다린 재시도부터 바로 이어서 시도하며,
+  재시도 앞의 단계는 resuming()으로 확인해 반복하지 않는다.
+  submit() 밖(첫 페이지, 작업 큐 워커 등)에서는 그 자리에서 기다린다.
+
+사용 예:
+    attempts = retry.Attempts("list_fetch", url, max_attempts=3)
+    for attempt in attempts:
+        try:
+            return fetch(url)
+        except TransportError as e:
+            attempts.fail(e)
+    return []  # 재시도 소진 또는 예산 소진
+"""
+import concurrent.futures
+import email.utils
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+from . import metrics, tracing
+
+logger = logging.getLogger(__name__)
+
+# 대기 시간 하한/상한 (초)
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 10.0
+# 이보다 긴 Retry-After는 기다리지 않고 포기 (초)
+MAX_RETRY_AFTER = 60.0
+# 재시도 예산: 작업 수 대비 재시도 비율과 최소 재시도 수
+DEFAULT_BUDGET_RATIO = 0.2
+DEFAULT_MIN_RETRIES = 10
+
+
+class RetryLater(BaseException):
+    """submit()으로 실행 중인 작업을 delay초 뒤에 다시 실행하도록 빠져나오는 신호
+
+    추출 함수 곳곳의 `except Exception`에 잡히지 않도록 BaseException을 상속한다.
+    """
+
+    def __init__(self, name, attempt, delay):
+        super().__init__(f"{name[0]} 재시도 {attempt}: {delay:.1f}초 후")
+        self.name = name
+        self.attempt = attempt
+        self.delay = delay
+
+
+def retry_after_seconds(error):
+    """예외의 응답에 있는 Retry-After를 초 단위로 (없으면 None)
+
+    회로가 열려 있을 때의 CircuitOpenError처럼 retry_after 속성이 있으면 그 값을 쓴다.
+    """
+    if getattr(error, "retry_after", None) is not None:
+        return error.retry_after
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class RetryPolicy:
+    """decorrelated jitter 대기 시간 계산"""
+
+    def __init__(self, base=DEFAULT_BASE_DELAY, cap=DEFAULT_MAX_DELAY, max_retry_after=MAX_RETRY_AFTER):
+        self.base = base
+        self.cap = cap
+        self.max_retry_after = max_retry_after
+
+    def delay(self, previous=None, retry_after=None):
+        """직전 대기 시간으로 다음 대기 시간 계산 (Retry-After보다 짧지 않게)"""
+        previous = max(previous or self.base, self.base)
+        delay = min(self.cap, random.uniform(self.base, previous * 3))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+class RetryBudget:
+    """실행 단위 재시도 예산 (허용 재시도 = 최소 재시도 수 + 작업 수 x 비율)"""
+
+    def __init__(self, ratio=DEFAULT_BUDGET_RATIO, min_retries=DEFAULT_MIN_RETRIES):
+        self.ratio = max(0.0, ratio)
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    @property
+    def allowed(self):
+        return self.min_retries + int(self.requests * self.ratio)
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self):
+        """재시도 하나를 예산에서 빼기 (예산이 없으면 False)"""
+        with self._lock:
+            if self.retries >= self.allowed:
+                return False
+            self.retries += 1
+            return True
+
+
+policy = RetryPolicy()
+budget = RetryBudget()
+
+# submit()으로 실행 중인 작업의 재시도 상태 (스레드별)
+_local = threading.local()
+
+
+class _TaskState:
+    """작업 하나의 재시도 상태 (다시 실행되어도 유지)"""
+
+    __slots__ = ("waited", "delays", "deferring")
+
+    def __init__(self):
+        self.waited = {}  # (단계, 키) -> 이미 기다린 재시도 번호
+        self.delays = {}  # (단계, 키) -> 직전 대기 시간
+        self.deferring = False  # 이번 실행이 RetryLater로 빠져나가는 중인지
+
+
+def reset(budget_ratio=DEFAULT_BUDGET_RATIO, min_retries=DEFAULT_MIN_RETRIES):
+    """실행 시작 시 재시도 예산 초기화"""
+    global budget
+    budget = RetryBudget(budget_ratio, min_retries)
+    return budget
+
+
+def deferrable():
+    """현재 스레드가 submit()으로 실행 중인 작업인지 (재시도를 재예약할 수 있는지)"""
+    return getattr(_local, "task", None) is not None
+
+
+def defer(stage, key, attempt, delay):
+    """현재 작업을 delay초 뒤에 다시 실행하도록 빠져나옴 (RetryLater 발생)
+
+    빠져나가는 동안 닫히는 바깥 Attempts 반복은 끝난 것이 아니므로 상태를 지우지 않는다.
+    """
+    state = getattr(_local, "task", None)
+    if state is not None:
+        state.deferring = True
+    raise RetryLater((stage, key), attempt, delay)
+
+
+def resuming(stage, key):
+    """현재 작업이 (단계, 키)의 재시도 대기 뒤 다시 실행된 것인지 (재시도 전 단계를 건너뛸 때 사용)"""
+    state = getattr(_local, "task", None)
+    return state is not None and state.waited.get((stage, key), 0) > 0
+
+
+class Attempts:
+    """시도 번호(0부터)를 차례로 반환하고 시도 사이에 재시도 정책대로 대기하는 반복자
+
+    실패한 시도는 fail(error)로 알린다 (Retry-After 확인). 반복이 끝나면 재시도 소진이나
+    예산 소진으로 포기한 것이다. start > 0이면 호출 전에 이미 실패한 시도가 있다는 뜻으로,
+    start번 시도 전에도 기다린다.
+    """
+
+    def __init__(self, stage, key, max_attempts=3, start=0):
+        self.stage = stage
+        self.key = key
+        self.max_attempts = max_attempts
+        self.start = start
+        self.error = None
+        self.gave_up = None  # 포기 이유 (attempts, budget, retry_after)
+        self._previous = None
+
+    def fail(self, error=None):
+        """이번 시도 실패 알림"""
+        self.error = error
+
+    def __iter__(self):
+        name = (self.stage, self.key)
+        state = getattr(_local, "task", None)
+        waited = state.waited.get(name, 0) if state is not None else 0
+        if state is not None:
+            self._previous = state.delays.get(name)
+        try:
+            attempt = max(self.start, waited)
+            if attempt == 0:
+                budget.record_request()
+            elif attempt > waited and not self._wait(attempt, name, state):
+                return
+            while True:
+                self.error = None
+                yield attempt
+                attempt += 1
+                if not self._wait(attempt, name, state):
+                    return
+        finally:
+            # 성공이나 포기로 끝나면 같은 작업에서 같은 (단계, 키)를 다시 시도할 때 처음부터 시작
+            # (재예약으로 빠져나가는 중이면 다시 실행될 때 이어서 시도하도록 유지)
+            if state is not None and not state.deferring:
+                state.waited.pop(name, None)
+                state.delays.pop(name, None)
+
+    def _give_up(self, reason):
+        self.gave_up = reason
+        metrics.inc("hanolcare_retry_giveups_total", stage=self.stage, reason=reason)
+        if reason != "attempts":
+            logger.warning(f"{self.stage} 재시도 포기 ({reason}): {self.key}")
+        return False
+
+    def _wait(self, attempt, name, state):
+        """attempt번 시도 전 대기 (포기하면 False, 재예약하면 RetryLater)"""
+        if attempt >= self.max_attempts:
+            return self._give_up("attempts")
+        retry_after = retry_after_seconds(self.error)
+        if retry_after is not None and retry_after > policy.max_retry_after:
+            return self._give_up("retry_after")
+        # 요청을 보내지 않은 실패(열린 회로)는 서버 부하를 늘리지 않으므로 예산을 쓰지 않음
+        if getattr(self.error, "request_sent", True) and not budget.try_spend():
+            return self._give_up("budget")
+
+        delay = policy.delay(self._previous, retry_after)
+        self._previous = delay
+        metrics.inc("hanolcare_retries_total", stage=self.stage)
+        logger.info(f"{self.stage} 재시도 {attempt + 1}/{self.max_attempts}, {delay:.1f}초 후: {self.key}")
+        if state is not None:
+            # 워커를 붙잡지 않고 작업을 빠져나와 타이머로 다시 실행
+            state.delays[name] = delay
+            tracing.instant("retry_scheduled", stage=self.stage, attempt=attempt + 1, delay=round(delay, 3))
+            defer(self.stage, self.key, attempt, delay)
+        with tracing.span("backoff", stage=self.stage, attempt=attempt + 1):
+            time.sleep(delay)
+        return True
+
+
+class _Task:
+    """submit()으로 제출된 작업 - RetryLater가 나면 대기 후 다시 제출"""
+
+    def __init__(self, scheduler, executor, fn, args):
+        self.scheduler = scheduler
+        self.executor = executor
+        self.fn = fn
+        self.args = args
+        self.state = _TaskState()
+        self.future = concurrent.futures.Future()
+
+    def start(self):
+        try:
+            inner = self.executor.submit(self._run)
+        except RuntimeError as e:  # 스레드 풀이 이미 종료됨
+            self.future.set_exception(e)
+            return
+        inner.add_done_callback(self._done)
+
+    def _run(self):
+        _local.task = self.state
+        self.state.deferring = False
+        try:
+            return self.fn(*self.args)
+        finally:
+            _local.task = None
+
+    def _done(self, inner):
+        if inner.cancelled():
+            self.future.set_exception(concurrent.futures.CancelledError())
+            return
+        error = inner.exception()
+        if isinstance(error, RetryLater):
+            self.state.waited[error.name] = error.attempt
+            self.scheduler.call_later(error.delay, self.start)
+        elif error is not None:
+            self.future.set_exception(error)
+        else:
+            self.future.set_result(inner.result())
+
+
+class RetryScheduler:
+    """대기 중인 재시도를 타이머 스레드 하나가 모아 두었다가 때가 되면 실행"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._heap = []
+        self._seq = itertools.count()
+        self._thread = None
+
+    def submit(self, executor, fn, *args):
+        """fn(*args)를 스레드 풀에 제출 - 재시도까지 끝난 결과를 담을 Future 반환"""
+        task = _Task(self, executor, fn, args)
+        task.start()
+        return task.future
+
+    def call_later(self, delay, callback):
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), callback))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="retry-scheduler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def pending(self):
+        """대기 중인 재시도 수"""
+        with self._cond:
+            return len(self._heap)
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                due = self._heap[0][0]
+                now = time.monotonic()
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+                _, _, callback = heapq.heappop(self._heap)
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"재시도 재제출 실패: {e}")
+
+
+scheduler = RetryScheduler()
+
+
+def submit(executor, fn, *args):
+    """재시도 대기 동안 워커를 놓아주는 방식으로 fn(*args)를 스레드 풀에 제출"""
+    return scheduler.submit(executor, fn, *args)
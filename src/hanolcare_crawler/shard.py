@@ -0,0 +1,144 @@
+"""
+여러 장비/작업으로 나눠 수집하기 (--shard i/N) 및 결과 병합 (--merge)
+
+각 샤드는 목록 페이지를 모두 읽은 뒤, 서비스ID의 안정적인 해시(CRC32)로 자기 몫의
+민원만 상세 수집한다. 같은 서비스ID는 어느 장비에서 실행해도 항상 같은 샤드에 배정되므로
+목록 페이지 순서가 수집 중에 바뀌어도 누락이나 샤드 간 중복 수집이 생기지 않는다.
+(목록 페이지 자체는 항목이 페이지 사이를 옮겨 다닐 수 있어 샤드별로 나누지 않는다.
+목록 요청은 상세 요청의 수분의 일이므로 전체 수집 시간은 샤드 수에 거의 비례해 줄어든다.)
+
+샤드 결과는 정부24_민원목록_shard<i>of<N>.csv로 저장되며, 병합 단계에서 모든 샤드의
+결과를 읽어 전체 기준 중복 필터링과 TF-IDF 키워드 추출을 다시 수행한다.
+
+사용 (GitHub Actions 매트릭스 등):
+    python -m hanolcare_crawler --auto --shard 0/4 --output out/shard0
+    ...
+    python -m hanolcare_crawler --merge out/shard0 out/shard1 out/shard2 out/shard3 --output out
+"""
+import glob
+import itertools
+import logging
+import os
+import zlib
+
+logger = logging.getLogger(__name__)
+
+RESULT_FILE = "정부24_민원목록.csv"
+ERROR_FILE = "정부24_민원목록_오류.csv"
+
+
+def parse_shard(spec):
+    """"i/N" 형식의 샤드 지정을 (i, N)으로 변환 (i는 0부터 N-1)"""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except (AttributeError, ValueError):
+        raise ValueError(f"샤드 지정은 i/N 형식이어야 합니다: {spec}")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"샤드 번호는 0 이상 {count - 1} 이하여야 합니다: {spec}")
+    return index, count
+
+
+def shard_key(minwon):
+    """샤드 배정에 사용할 키 (서비스ID, 없으면 링크, 민원명 순)"""
+    from .crawler import canonical_url
+
+    service_id = (minwon.get("서비스ID") or "").strip()
+    if service_id:
+        return service_id
+    return canonical_url(minwon.get("링크")) or (minwon.get("민원명") or "")
+
+
+def shard_of(minwon, count):
+    """민원이 배정되는 샤드 번호 (프로세스/장비와 관계없이 같은 값)"""
+    return zlib.crc32(shard_key(minwon).encode("utf-8")) % count
+
+
+def filter_shard(minwon_list, index, count):
+    """이 샤드에 배정된 민원만 반환"""
+    selected = [minwon for minwon in minwon_list if shard_of(minwon, count) == index]
+    logger.info(f"샤드 {index}/{count}: 전체 {len(minwon_list)}개 중 {len(selected)}개 민원 담당")
+    return selected
+
+
+def shard_filename(filename, index, count):
+    """샤드별 결과 파일명 (정부24_민원목록.csv -> 정부24_민원목록_shard0of4.csv)"""
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}_shard{index}of{count}{ext}"
+
+
+def find_shard_results(paths, filename=RESULT_FILE):
+    """디렉토리/파일 목록에서 샤드 결과 CSV 경로 찾기 (압축 파일 포함)"""
+    from .compress import SUFFIXES
+
+    stem, ext = os.path.splitext(filename)
+    suffixes = sorted(set(SUFFIXES.values()))
+    found = []
+    for path in paths:
+        path = os.path.expanduser(path)
+        if os.path.isdir(path):
+            matches = sorted(
+                match for suffix in suffixes
+                for match in glob.glob(os.path.join(path, f"{glob.escape(stem)}_shard*of*{ext}{suffix}"))
+            )
+            if not matches:
+                matches = [
+                    os.path.join(path, filename + suffix) for suffix in suffixes
+                    if os.path.exists(os.path.join(path, filename + suffix))
+                ][:1]
+            found.extend(matches)
+        elif os.path.exists(path):
+            found.append(path)
+        else:
+            logger.warning(f"샤드 결과를 찾을 수 없습니다: {path}")
+    return found
+
+
+def merge_shard_results(paths, output_dir, near_dup_threshold=0.0, keyword_top_k=10, dedup_memory_limit=None):
+    """샤드 결과 CSV를 합쳐 전체 기준 중복 필터링/키워드 추출 후 저장
+
+    레코드 수가 dedup_memory_limit를 넘으면 병합 결과를 메모리에 모으지 않고 CSV로 바로 쓰며,
+    전체 민원을 메모리에 올려야 하는 유사 중복 병합과 키워드 추출은 건너뛴다.
+    """
+    from .crawler import (DEDUP_MEMORY_LIMIT, filter_duplicate_minwons, iter_from_csv, iter_unique_minwons,
+                          save_streamed_results, save_to_csv, spill_deduplicator)
+
+    files = find_shard_results(paths)
+    if not files:
+        logger.error("병합할 샤드 결과가 없습니다.")
+        return None
+
+    # 샤드 파일을 한 행씩 읽어 바로 중복 병합 (전체 행을 메모리에 모으지 않음)
+    logger.info(f"샤드 결과 {len(files)}개 파일을 병합합니다.")
+    if dedup_memory_limit is None:
+        dedup_memory_limit = DEDUP_MEMORY_LIMIT
+    output_dir = os.path.expanduser(output_dir)
+    rows = itertools.chain.from_iterable(iter_from_csv(file_path) for file_path in files)
+    if not dedup_memory_limit:
+        merged = filter_duplicate_minwons(list(rows), 0)
+    else:
+        deduplicator = spill_deduplicator(rows, dedup_memory_limit)
+        if deduplicator.spilled:
+            if near_dup_threshold > 0 or keyword_top_k > 0:
+                logger.warning(f"레코드가 중복 병합 메모리 한도({dedup_memory_limit}개)를 넘어 유사 중복 병합과 키워드 추출을 "
+                               f"건너뜁니다. (필요하면 --dedup-memory-limit를 늘려 실행)")
+            result_path, _, total, errors = save_streamed_results(
+                iter_unique_minwons(deduplicator), RESULT_FILE, ERROR_FILE, output_dir
+            )
+            logger.info(f"병합 완료: {total}개 민원 (오류 {errors}개) -> {result_path}")
+            return result_path
+        merged = list(iter_unique_minwons(deduplicator))
+    if near_dup_threshold > 0:
+        from .dedup import filter_near_duplicate_minwons
+        merged = filter_near_duplicate_minwons(merged, near_dup_threshold)
+
+    # IDF는 전체 코퍼스 기준이어야 하므로 샤드별 키워드를 다시 계산
+    if merged and keyword_top_k > 0:
+        from .keywords import apply_corpus_keywords
+        apply_corpus_keywords(merged, keyword_top_k)
+
+    result_path = save_to_csv(merged, RESULT_FILE, output_dir)
+    error_items = [m for m in merged if "정상" not in m.get("오류여부", "") and "성공" not in m.get("오류여부", "")]
+    if error_items:
+        save_to_csv(error_items, ERROR_FILE, output_dir)
+    logger.info(f"병합 완료: {len(merged)}개 민원 (오류 {len(error_items)}개) -> {result_path}")
+    return result_path
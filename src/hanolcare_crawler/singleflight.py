@@ -0,0 +1,65 @@
+"""
+동시 요청 병합 (single-flight)
+
+같은 키(정규화된 URL)에 대한 작업이 이미 진행 중이면 새로 실행하지 않고 진행 중인
+작업이 끝나기를 기다려 같은 결과를 돌려받는다.
+"""
+import threading
+
+
+class _Call:
+    """진행 중인 작업 하나의 결과 보관"""
+
+    __slots__ = ("event", "result", "error", "waiters")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """키별로 동시에 하나의 작업만 실행하고 결과를 공유하는 도우미"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.executed = 0   # 실제로 실행된 작업 수
+        self.coalesced = 0  # 진행 중인 작업에 합류한 요청 수
+
+    def do(self, key, fn):
+        """fn()을 실행하거나 진행 중인 같은 키의 결과를 기다림 - (결과, 공유 여부) 반환"""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self.executed += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result, False
+
+    def in_flight(self):
+        """현재 진행 중인 작업 수"""
+        with self._lock:
+            return len(self._calls)
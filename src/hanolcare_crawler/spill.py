@@ -0,0 +1,219 @@
+"""
+메모리 한도가 있는 전체 중복 병합 (디스크 분할)
+
+filter_duplicate_minwons는 모든 고유 민원을 딕셔너리에 올려 두고 병합한다. 여러 카테고리나
+샤드 결과를 합치는 큰 실행에서는 이 딕셔너리가 최대 메모리를 결정하므로, 레코드 수가 한도를
+넘으면 키 해시로 나눈 분할 파일에 레코드를 그대로 내려 두었다가 분할 하나씩 병합한다.
+
+1. 추가: 입력 순번과 함께 버퍼에 모으고, 버퍼가 차면 키 해시 분할 파일로 내려 쓴다.
+   같은 키는 항상 같은 분할에 입력 순서대로 들어가므로 병합 결과는 메모리 방식과 같다.
+2. 분할별 병합: 분할 파일 하나를 읽으며 키별로 병합하고, 첫 등장 순번 순으로 정렬된
+   run 파일로 쓴다. 한도보다 큰 분할은 다른 해시로 다시 나눈다.
+3. 스트리밍 병합: run 파일들을 순번 기준 heapq.merge로 합쳐 첫 등장 순서대로 내보낸다.
+
+메모리에는 버퍼 하나 또는 분할 하나의 고유 레코드만 올라가므로 전체 레코드 수와 관계없이
+사용량이 max_in_memory 근처로 유지된다. 한도를 넘지 않으면 디스크를 쓰지 않는다.
+"""
+import hashlib
+import heapq
+import logging
+import os
+import pickle
+import shutil
+import tempfile
+
+logger = logging.getLogger(__name__)
+
+# 메모리에 올려 두는 최대 레코드 수 (넘으면 디스크로 내려 씀)
+DEFAULT_MAX_IN_MEMORY = 50000
+# 분할 파일 수
+DEFAULT_PARTITIONS = 16
+# 분할을 다시 나누는 최대 깊이 (같은 키만 많은 분할은 더 나눠도 줄지 않음)
+MAX_SPLIT_DEPTH = 3
+# 한 번에 여는 최대 run 파일 수 (넘으면 단계적으로 합침)
+MAX_OPEN_RUNS = 64
+
+
+def _partition_of(key, depth, partitions):
+    """깊이별로 다른 해시를 사용한 분할 번호"""
+    digest = hashlib.md5(f"{depth}:{key}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % partitions
+
+
+def _read_pickles(path):
+    """pickle 항목을 하나씩 읽는 생성기"""
+    with open(path, "rb") as f:
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
+
+
+class SpillDeduplicator:
+    """키가 같은 레코드를 merge_func로 병합하며 첫 등장 순서대로 내보내는 중복 병합기
+
+    key_func(record)는 병합 키, merge_func(existing, record)는 기존 레코드에 병합한 결과를
+    반환해야 한다. add/extend로 모두 추가한 뒤 한 번만 순회할 수 있다.
+    """
+
+    def __init__(self, key_func, merge_func, max_in_memory=DEFAULT_MAX_IN_MEMORY,
+                 partitions=DEFAULT_PARTITIONS, tmp_dir=None):
+        self.key_func = key_func
+        self.merge_func = merge_func
+        self.max_in_memory = max(1, max_in_memory)
+        self.partitions = max(2, partitions)
+        self.tmp_dir = tmp_dir
+        self.total = 0
+        self.unique = 0
+        self.spilled = 0
+        self._buffer = []  # (순번, 키, 레코드)
+        self._workdir = None
+        self._files = None
+        self._counts = None
+        self._consumed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @property
+    def duplicates(self):
+        return self.total - self.unique
+
+    def add(self, record):
+        if self._consumed:
+            raise RuntimeError("이미 결과를 읽은 중복 병합기에는 레코드를 추가할 수 없습니다.")
+        self._buffer.append((self.total, self.key_func(record), record))
+        self.total += 1
+        if len(self._buffer) >= self.max_in_memory:
+            self._spill()
+
+    def extend(self, records):
+        for record in records:
+            self.add(record)
+
+    def _spill(self):
+        """버퍼를 키 해시 분할 파일로 내려 씀"""
+        if self._files is None:
+            self._workdir = tempfile.mkdtemp(prefix="hanolcare_dedup_", dir=self.tmp_dir)
+            self._files = [
+                open(os.path.join(self._workdir, f"part_{index:03d}.pkl"), "wb") for index in range(self.partitions)
+            ]
+            self._counts = [0] * self.partitions
+            logger.info(f"중복 병합 레코드가 {self.max_in_memory}개를 넘어 디스크로 내려 씁니다: {self._workdir}")
+        for item in self._buffer:
+            index = _partition_of(item[1], 0, self.partitions)
+            pickle.dump(item, self._files[index], pickle.HIGHEST_PROTOCOL)
+            self._counts[index] += 1
+        self.spilled += len(self._buffer)
+        self._buffer = []
+
+    def _merge_items(self, items):
+        """(순번, 키, 레코드)를 키별로 병합 - 첫 등장 순서의 (순번, 레코드) 목록"""
+        merged = {}
+        for seq, key, record in items:
+            entry = merged.get(key)
+            if entry is None:
+                merged[key] = [seq, record]
+            else:
+                entry[1] = self.merge_func(entry[1], record)
+        return [(seq, record) for seq, record in merged.values()]
+
+    def _write_run(self, entries):
+        """첫 등장 순번 순으로 정렬된 run 파일 쓰기"""
+        fd, path = tempfile.mkstemp(prefix="run_", suffix=".pkl", dir=self._workdir)
+        count = 0
+        with os.fdopen(fd, "wb") as f:
+            for entry in entries:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+                count += 1
+        return path, count
+
+    def _reduce_runs(self, runs):
+        """run 파일이 너무 많으면 MAX_OPEN_RUNS개씩 합쳐 파일 핸들 수를 제한"""
+        while len(runs) > MAX_OPEN_RUNS:
+            merged_runs = []
+            for start in range(0, len(runs), MAX_OPEN_RUNS):
+                group = runs[start:start + MAX_OPEN_RUNS]
+                entries = heapq.merge(*(_read_pickles(path) for path in group), key=lambda entry: entry[0])
+                merged_runs.append(self._write_run(entries)[0])
+                for path in group:
+                    os.remove(path)
+            runs = merged_runs
+        return runs
+
+    def _partition_runs(self, path, count, depth):
+        """분할 파일 하나를 병합해 run 파일 목록으로 (한도보다 크면 다시 나눔)"""
+        if count <= self.max_in_memory or depth >= MAX_SPLIT_DEPTH:
+            run_path, count = self._write_run(self._merge_items(_read_pickles(path)))
+            self.unique += count
+            os.remove(path)
+            return [run_path]
+
+        stem = os.path.splitext(path)[0]
+        sub_paths = [f"{stem}_{index:03d}.pkl" for index in range(self.partitions)]
+        sub_counts = [0] * self.partitions
+        sub_files = [open(sub_path, "wb") for sub_path in sub_paths]
+        try:
+            for item in _read_pickles(path):
+                index = _partition_of(item[1], depth + 1, self.partitions)
+                pickle.dump(item, sub_files[index], pickle.HIGHEST_PROTOCOL)
+                sub_counts[index] += 1
+        finally:
+            for f in sub_files:
+                f.close()
+        os.remove(path)
+
+        runs = []
+        for sub_path, sub_count in zip(sub_paths, sub_counts):
+            if sub_count:
+                runs.extend(self._partition_runs(sub_path, sub_count, depth + 1))
+            else:
+                os.remove(sub_path)
+        return runs
+
+    def __iter__(self):
+        if self._consumed:
+            raise RuntimeError("중복 병합 결과는 한 번만 읽을 수 있습니다.")
+        self._consumed = True
+
+        # 한도를 넘지 않았으면 메모리에서 바로 병합
+        if self._files is None:
+            entries = self._merge_items(self._buffer)
+            self._buffer = []
+            self.unique = len(entries)
+            for _, record in entries:
+                yield record
+            return
+
+        self._spill()
+        for f in self._files:
+            f.close()
+        runs = []
+        for index, count in enumerate(self._counts):
+            path = self._files[index].name
+            if count:
+                runs.extend(self._partition_runs(path, count, 0))
+            else:
+                os.remove(path)
+        logger.info(f"중복 병합: {self.spilled}개 레코드를 {len(runs)}개 run 파일로 병합, 순서대로 합치는 중...")
+        runs = self._reduce_runs(runs)
+
+        try:
+            for _, record in heapq.merge(*(_read_pickles(path) for path in runs), key=lambda entry: entry[0]):
+                yield record
+        finally:
+            self.close()
+
+    def close(self):
+        """임시 파일 정리"""
+        if self._files is not None:
+            for f in self._files:
+                if not f.closed:
+                    f.close()
+        if self._workdir is not None:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+            self._workdir = None
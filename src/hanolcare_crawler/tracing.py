@@ -0,0 +1,131 @@
+"""
+수집 파이프라인 구간 기록 (Chrome trace event 형식)
+
+배치, 민원 하나의 처리, 가져오기/파싱/추출/검증/재시도, 체크포인트 저장 같은 구간을
+스레드별로 기록하여 chrome://tracing 또는 https://ui.perfetto.dev 에서 타임라인으로 볼 수
+있게 한다. 집계 지표(metrics)로는 보이지 않는 대기 구간 - 모든 워커가 체크포인트 저장을
+기다리거나 배치 하나가 Playwright 렌더링 하나를 기다리는 상황 - 을 직접 확인할 수 있다.
+
+기록을 시작하지 않으면 span()은 아무 일도 하지 않는다.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+
+class TraceRecorder:
+    """Chrome trace event 목록 (스레드 이름 메타데이터 포함)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.pid = os.getpid()
+        self.epoch = time.perf_counter()
+        self.events = []
+        self._threads = set()
+        self._lock = threading.Lock()
+
+    def _thread_id(self):
+        thread_id = threading.get_ident()
+        if thread_id not in self._threads:
+            with self._lock:
+                if thread_id not in self._threads:
+                    self._threads.add(thread_id)
+                    self.events.append({
+                        "name": "thread_name", "ph": "M", "pid": self.pid, "tid": thread_id,
+                        "args": {"name": threading.current_thread().name},
+                    })
+        return thread_id
+
+    def complete(self, name, start, duration, cat, args):
+        """perf_counter 기준 시작 시각과 길이(초)로 완료 구간 기록"""
+        event = {
+            "name": name, "cat": cat, "ph": "X", "pid": self.pid, "tid": self._thread_id(),
+            "ts": (start - self.epoch) * 1e6, "dur": duration * 1e6,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def instant(self, name, cat, args):
+        event = {
+            "name": name, "cat": cat, "ph": "i", "s": "t", "pid": self.pid, "tid": self._thread_id(),
+            "ts": (time.perf_counter() - self.epoch) * 1e6,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def save(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+        return self.path
+
+
+# 현재 기록기 (None이면 기록하지 않음)
+_recorder = None
+
+
+def start_tracing(path):
+    """구간 기록 시작"""
+    global _recorder
+    _recorder = TraceRecorder(path)
+    logger.info(f"파이프라인 구간 기록 시작: {path}")
+    return _recorder
+
+
+def stop_tracing():
+    """구간 기록을 끝내고 파일로 저장 (기록 중이 아니면 None)"""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    if recorder is None:
+        return None
+    path = recorder.save()
+    logger.info(f"파이프라인 구간 {len(recorder.events)}개 저장: {path} (chrome://tracing 또는 ui.perfetto.dev에서 열기)")
+    return path
+
+
+def is_tracing():
+    return _recorder is not None
+
+
+def record(name, start, duration, cat="stage", **args):
+    """이미 잰 구간 기록 (start는 time.perf_counter() 값)"""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.complete(name, start, duration, cat, args)
+
+
+def instant(name, cat="event", **args):
+    """시점 이벤트 기록 (재시도 등)"""
+    recorder = _recorder
+    if recorder is not None:
+        recorder.instant(name, cat, args)
+
+
+@contextmanager
+def _span(recorder, name, cat, args):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        recorder.complete(name, start, time.perf_counter() - start, cat, args)
+
+
+@contextmanager
+def _noop():
+    yield
+
+
+def span(name, cat="pipeline", **args):
+    """with 블록을 구간으로 기록 (기록 중이 아니면 아무 일도 하지 않음)"""
+    recorder = _recorder
+    if recorder is None:
+        return _noop()
+    return _span(recorder, name, cat, args)
@@ -0,0 +1,339 @@
+"""
+HTTP 전송 계층 - 공유 연결 풀, 교체 가능한 백엔드, 작업 스레드 풀
+
+스레드마다 requests.Session(기본 연결 풀 10개)을 따로 만들고 배치마다 ThreadPoolExecutor를
+새로 만들면, 30개 배치가 끝날 때마다 스레드와 그 스레드가 맺은 TLS 연결이 함께 버려진다.
+이 모듈은 실행 동안 유지되는 전송 객체 하나(연결 풀 크기 = 동시 요청 수)와 스레드 풀 하나를
+제공하여 목록 단계, 상세 단계, 배치 사이에서 keep-alive 연결을 계속 재사용한다.
+
+백엔드 (--http-backend):
+- requests: 기본값. HTTP/1.1, 요청마다 연결 하나를 차지
+- urllib3: requests 계층 없이 urllib3 연결 풀을 직접 사용 (요청당 부하가 작음)
+- httpx: HTTP/2 지원 (h2 패키지 필요). 연결 하나에서 여러 요청을 동시에 주고받으므로
+  동시 요청 수만큼 TCP/TLS 연결을 맺지 않는다. 서버가 HTTP/2를 지원하지 않으면 HTTP/1.1 사용
+
+연결 재사용 지표 (metrics):
+- hanolcare_http_requests_total{scheme}: 보낸 요청 수
+- hanolcare_http_connections_total{scheme}: 새로 맺은 연결 수 (재사용률 = 1 - 연결 / 요청)
+"""
+import concurrent.futures
+import logging
+import socket
+import threading
+import urllib.parse
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from . import metrics
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 클라이언트 (선택)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - httpx의 HTTP/2 지원에 필요
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+BACKENDS = ("requests", "urllib3", "httpx")
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+# 동시 요청 수를 정하지 않았을 때의 연결 풀 크기 (requests 기본값과 같음)
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 15
+
+# TCP keep-alive - 배치 사이 유휴 연결이 NAT/방화벽에서 조용히 끊기지 않도록 주기적으로 확인
+KEEPALIVE_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+for _name, _value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+    if hasattr(socket, _name):
+        KEEPALIVE_OPTIONS.append((socket.IPPROTO_TCP, getattr(socket, _name), _value))
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + KEEPALIVE_OPTIONS
+
+
+class TransportError(Exception):
+    """요청 실패 (연결 오류, 시간 초과, 오류 상태 코드)"""
+
+
+class HTTPStatusError(TransportError):
+    """4xx/5xx 응답 (response로 상태 코드와 Retry-After 등 헤더 확인)"""
+
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status_code}: {response.url}")
+        self.response = response
+
+
+class Response:
+    """백엔드와 관계없는 응답 (status_code, headers, text, url, http_version)"""
+
+    __slots__ = ("status_code", "headers", "text", "url", "http_version")
+
+    def __init__(self, status_code, headers, text, url, http_version="HTTP/1.1"):
+        self.status_code = status_code
+        self.headers = headers
+        self.text = text
+        self.url = url
+        self.http_version = http_version
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise HTTPStatusError(self)
+
+
+def _count_request(url):
+    metrics.inc("hanolcare_http_requests_total", scheme=urllib.parse.urlsplit(url).scheme)
+
+
+def _count_connection(scheme):
+    metrics.inc("hanolcare_http_connections_total", scheme=scheme)
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _count_connection("http")
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _count_connection("https")
+        return super()._new_conn()
+
+
+COUNTING_POOL_CLASSES = {"http": _CountingHTTPConnectionPool, "https": _CountingHTTPSConnectionPool}
+
+
+class PooledAdapter(HTTPAdapter):
+    """keep-alive 소켓 옵션과 연결 수 계측을 더한 HTTPAdapter"""
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault("socket_options", SOCKET_OPTIONS)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = COUNTING_POOL_CLASSES
+
+    def send(self, request, **kwargs):
+        _count_request(request.url)
+        return super().send(request, **kwargs)
+
+
+class RequestsTransport:
+    """requests.Session 백엔드 (HTTP/1.1)"""
+
+    name = "requests"
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE):
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        # 재시도는 크롤러가 직접 하므로 어댑터 재시도는 끔
+        adapter = PooledAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, timeout=DEFAULT_TIMEOUT):
+        try:
+            response = self.session.get(url, timeout=timeout)
+        except requests.exceptions.RequestException as e:
+            raise TransportError(str(e)) from e
+        return Response(response.status_code, response.headers, response.text, response.url)
+
+    def close(self):
+        self.session.close()
+
+
+def _decode(body, content_type):
+    """Content-Type의 charset으로 본문 디코딩 (없으면 UTF-8)"""
+    charset = "utf-8"
+    for param in (content_type or "").split(";")[1:]:
+        key, _, value = param.strip().partition("=")
+        if key.lower() == "charset" and value:
+            charset = value.strip('"\'')
+    try:
+        return body.decode(charset, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+class Urllib3Transport:
+    """urllib3.PoolManager 백엔드 (HTTP/1.1, requests 계층 없이 연결 풀 직접 사용)"""
+
+    name = "urllib3"
+
+    # 재시도는 크롤러가 직접 하고 리다이렉트만 따라감
+    RETRIES = urllib3.Retry(total=None, connect=0, read=0, status=0, other=0, redirect=5)
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE):
+        self.pool = urllib3.PoolManager(
+            num_pools=4, maxsize=pool_size, headers=DEFAULT_HEADERS, socket_options=SOCKET_OPTIONS
+        )
+        self.pool.pool_classes_by_scheme = COUNTING_POOL_CLASSES
+
+    def get(self, url, timeout=DEFAULT_TIMEOUT):
+        _count_request(url)
+        try:
+            response = self.pool.request(
+                "GET", url, timeout=urllib3.Timeout(connect=timeout, read=timeout), retries=self.RETRIES
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise TransportError(str(e)) from e
+        headers = CaseInsensitiveDict(response.headers)
+        text = _decode(response.data, headers.get("Content-Type"))
+        return Response(response.status, headers, text, response.geturl() or url)
+
+    def close(self):
+        self.pool.clear()
+
+
+class HttpxTransport:
+    """httpx 백엔드 (h2 패키지가 있으면 HTTP/2로 연결 하나에 여러 요청을 다중화)
+
+    prior_knowledge=True면 http:// 주소에도 HTTP/2 평문(h2c)으로 접속한다 (HTTP/2 모의 서버용).
+    """
+
+    name = "httpx"
+
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, http2=True, prior_knowledge=False):
+        if not HTTPX_AVAILABLE:
+            raise RuntimeError("httpx 백엔드에는 httpx 패키지가 필요합니다. (pip install 'httpx[http2]')")
+        if http2 and not H2_AVAILABLE:
+            logger.warning("h2 패키지가 없어 httpx 백엔드를 HTTP/1.1로 사용합니다. (pip install 'httpx[http2]')")
+            http2 = False
+        self.http2 = http2
+        self.client = httpx.Client(
+            http1=not (http2 and prior_knowledge),
+            http2=http2,
+            headers=DEFAULT_HEADERS,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+        )
+
+    @staticmethod
+    def _trace(event_name, info):
+        # httpcore 연결 이벤트로 새 연결 수 계측
+        if event_name == "connection.connect_tcp.complete":
+            _count_connection("tcp")
+
+    def get(self, url, timeout=DEFAULT_TIMEOUT):
+        _count_request(url)
+        try:
+            response = self.client.get(url, timeout=timeout, extensions={"trace": self._trace})
+        except httpx.HTTPError as e:
+            raise TransportError(str(e)) from e
+        return Response(response.status_code, response.headers, response.text, str(response.url), response.http_version)
+
+    def close(self):
+        self.client.close()
+
+
+def create_transport(backend="requests", pool_size=DEFAULT_POOL_SIZE, **options):
+    """이름으로 전송 객체 생성"""
+    if backend == "requests":
+        return RequestsTransport(pool_size)
+    if backend == "urllib3":
+        return Urllib3Transport(pool_size)
+    if backend == "httpx":
+        return HttpxTransport(pool_size, **options)
+    raise ValueError(f"지원하지 않는 HTTP 백엔드: {backend} (가능: {', '.join(BACKENDS)})")
+
+
+# 공유 전송 객체/스레드 풀 (처음 사용할 때 생성)
+_lock = threading.Lock()
+_transport = None
+_backend = "requests"
+_pool_size = DEFAULT_POOL_SIZE
+_executor = None
+_executor_workers = 0
+
+
+def _reset_transport():
+    global _transport
+    with _lock:
+        old, _transport = _transport, None
+    if old is not None:
+        old.close()
+
+
+def set_backend(backend="requests"):
+    """HTTP 백엔드 설정 (httpx가 없으면 requests 사용)"""
+    global _backend
+    if backend not in BACKENDS:
+        raise ValueError(f"지원하지 않는 HTTP 백엔드: {backend} (가능: {', '.join(BACKENDS)})")
+    if backend == "httpx" and not HTTPX_AVAILABLE:
+        logger.warning("httpx가 설치되지 않아 requests 백엔드를 사용합니다. (pip install 'httpx[http2]')")
+        backend = "requests"
+    if backend != _backend:
+        _backend = backend
+        _reset_transport()
+    logger.info(f"HTTP 백엔드: {_backend}")
+    return _backend
+
+
+def configure_pool(size):
+    """연결 풀 크기를 동시 요청 수에 맞춤 (크기가 바뀌면 전송 객체를 새로 만듦)"""
+    global _pool_size
+    size = max(1, int(size))
+    if size == _pool_size and _transport is not None:
+        return
+    _pool_size = size
+    _reset_transport()
+    logger.info(f"HTTP 연결 풀 크기: {size}")
+
+
+def get_transport():
+    """모든 스레드가 함께 쓰는 전송 객체 (연결 풀은 스레드 안전)"""
+    global _transport
+    transport = _transport
+    if transport is None:
+        with _lock:
+            if _transport is None:
+                _transport = create_transport(_backend, _pool_size)
+            transport = _transport
+    return transport
+
+
+def get(url, timeout=DEFAULT_TIMEOUT):
+    """공유 전송 객체로 GET 요청 (실패하면 TransportError)"""
+    return get_transport().get(url, timeout=timeout)
+
+
+def close_transport():
+    """공유 전송 객체와 연결 닫기"""
+    _reset_transport()
+
+
+def get_executor(max_workers):
+    """실행 동안 유지되는 작업 스레드 풀 (워커 수가 바뀔 때만 새로 만듦)"""
+    global _executor, _executor_workers
+    with _lock:
+        if _executor is not None and _executor_workers == max_workers:
+            return _executor
+        old = _executor
+        _executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="crawler-worker")
+        _executor_workers = max_workers
+    if old is not None:
+        old.shutdown(wait=True)
+    return _executor
+
+
+def shutdown_executor():
+    """작업 스레드 풀 종료"""
+    global _executor, _executor_workers
+    with _lock:
+        executor, _executor = _executor, None
+        _executor_workers = 0
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -0,0 +1,141 @@
+"""
+HTTP 백엔드 벤치마크
+
+로컬 모의 서버(HTTP/1.1 keep-alive)와 HTTP/2 모의 서버(h2c, h2 패키지 필요)에 같은 상세
+페이지 요청을 동시에 보내 백엔드별 처리량, 지연 시간 p50/p95, 서버가 받은 연결 수를 비교한다.
+응답 지연(--latency)을 주면 실제 사이트처럼 요청이 겹치므로 HTTP/1.1 백엔드는 동시 요청 수만큼
+연결을 맺고, HTTP/2 백엔드는 연결 하나에서 요청을 다중화하는 차이가 드러난다.
+
+실행:
+    python -m hanolcare_crawler.transport_bench --requests 400 --concurrency 16 --latency 0.05
+"""
+import argparse
+import concurrent.futures
+import json
+import logging
+import sys
+import time
+
+from .bench import percentile
+from .mock_server import DETAIL_PATH, H2_AVAILABLE, FaultConfig, MockGovServer
+from .transport import BACKENDS, HTTPX_AVAILABLE, create_transport
+
+logger = logging.getLogger(__name__)
+
+
+def _cases(backends):
+    """(이름, 백엔드, 전송 옵션, HTTP/2 서버 여부) 목록"""
+    cases = []
+    for backend in backends:
+        if backend == "httpx":
+            if not HTTPX_AVAILABLE:
+                logger.warning("httpx가 설치되지 않아 httpx 백엔드는 건너뜁니다.")
+                continue
+            cases.append(("httpx (HTTP/1.1)", "httpx", {"http2": False}, False))
+            if H2_AVAILABLE:
+                cases.append(("httpx (HTTP/2)", "httpx", {"http2": True, "prior_knowledge": True}, True))
+            else:
+                logger.warning("h2 패키지가 없어 HTTP/2 비교는 건너뜁니다. (pip install 'httpx[http2]')")
+        else:
+            cases.append((backend, backend, {}, False))
+    return cases
+
+
+def run_case(server, backend, options, urls, concurrency):
+    """요청 목록을 동시 요청 수만큼 나눠 보내고 결과 측정"""
+    transport = create_transport(backend, concurrency, **options)
+    latencies = []
+    errors = 0
+    versions = set()
+    connections_before = server.snapshot_stats().get("connections", 0)
+
+    def fetch(url):
+        start = time.perf_counter()
+        response = transport.get(url, timeout=30)
+        response.raise_for_status()
+        return time.perf_counter() - start, response.http_version
+
+    started = time.perf_counter()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in concurrent.futures.as_completed([executor.submit(fetch, url) for url in urls]):
+                try:
+                    latency, version = future.result()
+                except Exception as e:
+                    errors += 1
+                    logger.debug(f"요청 실패: {e}")
+                    continue
+                latencies.append(latency)
+                versions.add(version)
+        elapsed = time.perf_counter() - started
+    finally:
+        transport.close()
+
+    return {
+        "requests": len(urls),
+        "errors": errors,
+        "elapsed": elapsed,
+        "requests_per_sec": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "connections": server.snapshot_stats().get("connections", 0) - connections_before,
+        "http_version": ", ".join(sorted(versions)),
+    }
+
+
+def run_transport_benchmark(requests_count=400, concurrency=16, latency=0.05, scale=5, backends=BACKENDS):
+    """백엔드별 벤치마크 결과 {이름: 결과}"""
+    config = FaultConfig(latency=latency, seed=47)
+    servers = {False: MockGovServer(config=config, scale=scale)}
+    servers[False].start()
+    try:
+        results = {}
+        for name, backend, options, http2 in _cases(backends):
+            if http2 not in servers:
+                from .mock_server import MockGovH2Server
+                servers[http2] = MockGovH2Server(config=config, scale=scale)
+                servers[http2].start()
+            server = servers[http2]
+            service_ids = sorted(server.site.names)
+            urls = [f"{server.base_url}{DETAIL_PATH}{service_ids[i % len(service_ids)]}" for i in range(requests_count)]
+            # 연결 수립과 첫 요청 비용이 결과에 섞이지 않도록 한 번 예열
+            run_case(server, backend, options, urls[:concurrency], concurrency)
+            results[name] = run_case(server, backend, options, urls, concurrency)
+        return results
+    finally:
+        for server in servers.values():
+            server.stop()
+
+
+def print_report(results, concurrency):
+    print(f"{'백엔드':20s} {'요청/초':>9s} {'p50 ms':>9s} {'p95 ms':>9s} {'연결':>6s} {'오류':>5s}  프로토콜 (동시 요청 {concurrency})")
+    for name, result in results.items():
+        print(
+            f"{name:20s} {result['requests_per_sec']:9.1f} {result['p50_ms']:9.1f} {result['p95_ms']:9.1f} "
+            f"{result['connections']:6d} {result['errors']:5d}  {result['http_version']}"
+        )
+
+
+def main(argv=None):
+    """HTTP 백엔드 벤치마크 실행"""
+    parser = argparse.ArgumentParser(description="로컬 모의 서버(HTTP/1.1, HTTP/2)로 HTTP 백엔드 비교")
+    parser.add_argument("--requests", type=int, default=400, help="백엔드별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16, help="동시 요청 수 (연결 풀 크기)")
+    parser.add_argument("--latency", type=float, default=0.05, help="모의 서버 응답 지연 (초)")
+    parser.add_argument("--scale", type=int, default=5, help="모의 서버 민원 배수")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS), help="비교할 백엔드")
+    parser.add_argument("--output", help="결과 JSON 경로")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    results = run_transport_benchmark(args.requests, args.concurrency, args.latency, args.scale, args.backends)
+    print_report(results, args.concurrency)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장: {args.output}")
+    return 1 if any(result["errors"] for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+SQLite 기반 공유 작업 큐 (--queue)
+
+같은 장비의 여러 크롤러 프로세스나 저장소를 공유하는 여러 호스트가 하나의 큐에서
+민원을 가져가 처리한다. 고정 샤드와 달리 빨리 끝난 프로세스가 남은 작업을 계속 가져가므로
+느린 프로세스 때문에 다른 워커가 놀지 않는다.
+
+- lease: 우선순위가 높은 대기 항목을 가져가며 visibility timeout 동안 다른 워커에게 숨긴다.
+- ack: 처리 결과를 저장하고 완료 처리한다.
+- nack: 다시 대기 상태로 돌려놓는다 (우선순위를 낮춰 새 작업 뒤로 보냄).
+- 워커가 죽어 ack하지 못한 항목은 lease 만료 후 다른 워커가 다시 가져간다.
+
+완료된 항목은 큐 파일에 남으므로 같은 큐 파일로 다시 실행하면 남은 항목만 처리한다.
+여러 호스트에서 공유할 때는 파일 잠금이 올바르게 동작하는 저장소를 사용해야 한다.
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# 기본 visibility timeout (초) - Playwright 렌더링과 재시도를 포함한 민원 하나의 최대 처리 시간보다 길게
+DEFAULT_VISIBILITY_TIMEOUT = 300.0
+# 이 횟수만큼 가져간 뒤에도 완료되지 않으면 실패 처리
+DEFAULT_MAX_ATTEMPTS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    result TEXT,
+    enqueued REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_ready ON items (state, priority DESC, enqueued);
+"""
+
+
+def default_owner():
+    """워커 식별자 (호스트:프로세스:스레드)"""
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+class WorkQueue:
+    """lease/ack 방식의 SQLite 작업 큐 (스레드/프로세스 간 공유 가능)"""
+
+    def __init__(self, path, visibility_timeout=DEFAULT_VISIBILITY_TIMEOUT, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.path = os.path.expanduser(path)
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+
+    def _connection(self):
+        """스레드별 연결 (sqlite3 연결은 스레드 간 공유하지 않음)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self):
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        return conn
+
+    def put_many(self, items, priority=0):
+        """(키, 내용) 목록 추가 - 이미 있는 키는 무시 (여러 프로세스가 같은 목록을 넣어도 안전)"""
+        now = time.time()
+        rows = [(key, json.dumps(payload, ensure_ascii=False), priority, now, now) for key, payload in items]
+        conn = self._transaction()
+        try:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO items (key, payload, priority, enqueued, updated) VALUES (?, ?, ?, ?, ?)", rows
+            )
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return added
+
+    def lease(self, owner, limit=1):
+        """대기 중이거나 lease가 만료된 항목을 우선순위 순으로 가져감 - [(키, 내용)]"""
+        now = time.time()
+        conn = self._transaction()
+        try:
+            rows = conn.execute(
+                "SELECT key, payload FROM items"
+                " WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?)"
+                " ORDER BY priority DESC, enqueued LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE items SET state = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1,"
+                " updated = ? WHERE key = ?",
+                [(owner, now + self.visibility_timeout, now, key) for key, _ in rows],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return [(key, json.loads(payload)) for key, payload in rows]
+
+    def extend(self, key, owner):
+        """처리 중인 항목의 lease 연장 (오래 걸리는 작업용)"""
+        conn = self._connection()
+        cursor = conn.execute(
+            "UPDATE items SET lease_expires = ?, updated = ? WHERE key = ? AND state = 'leased' AND lease_owner = ?",
+            (time.time() + self.visibility_timeout, time.time(), key, owner),
+        )
+        return cursor.rowcount == 1
+
+    def ack(self, key, owner, result):
+        """처리 결과 저장 및 완료 처리 (lease가 만료되어 다른 워커가 가져갔어도 먼저 끝낸 결과를 저장)"""
+        conn = self._connection()
+        cursor = conn.execute(
+            "UPDATE items SET state = 'done', result = ?, lease_owner = ?, lease_expires = NULL, updated = ?"
+            " WHERE key = ? AND state != 'done'",
+            (json.dumps(dict(result), ensure_ascii=False), owner, time.time(), key),
+        )
+        if cursor.rowcount == 0:
+            logger.info(f"이미 다른 워커가 완료한 항목: {key}")
+        return cursor.rowcount == 1
+
+    def nack(self, key, owner, result=None):
+        """처리 실패 - 최대 시도 횟수 전이면 우선순위를 낮춰 대기 상태로, 넘으면 실패 처리"""
+        conn = self._transaction()
+        try:
+            row = conn.execute("SELECT attempts FROM items WHERE key = ? AND lease_owner = ?", (key, owner)).fetchone()
+            if row is None:
+                conn.execute("COMMIT")
+                return False
+            state = "failed" if row[0] >= self.max_attempts else "pending"
+            conn.execute(
+                "UPDATE items SET state = ?, priority = priority - 1, lease_owner = NULL, lease_expires = NULL,"
+                " result = ?, updated = ? WHERE key = ?",
+                (state, json.dumps(dict(result), ensure_ascii=False) if result is not None else None, time.time(), key),
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return True
+
+    def counts(self):
+        """상태별 항목 수"""
+        rows = self._connection().execute("SELECT state, COUNT(*) FROM items GROUP BY state").fetchall()
+        return dict(rows)
+
+    def next_lease_expiry(self):
+        """다른 워커가 처리 중인 항목의 가장 이른 lease 만료 시각 (없으면 None)"""
+        row = self._connection().execute("SELECT MIN(lease_expires) FROM items WHERE state = 'leased'").fetchone()
+        return row[0]
+
+    def results(self):
+        """완료/실패 항목의 처리 결과 목록 (추가된 순서)"""
+        rows = self._connection().execute(
+            "SELECT result FROM items WHERE state IN ('done', 'failed') AND result IS NOT NULL ORDER BY enqueued, key"
+        ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def queue_key(minwon):
+    """큐 항목 키 (서비스ID, 없으면 링크)"""
+    return (minwon.get("서비스ID") or "").strip() or (minwon.get("링크") or "")
+
+
+def enqueue_minwons(queue, minwon_list, priority=0):
+    """목록 단계 결과를 큐에 추가"""
+    items = [
+        (queue_key(minwon), {k: v for k, v in minwon.items() if not k.startswith("_")})
+        for minwon in minwon_list if queue_key(minwon)
+    ]
+    added = queue.put_many(items, priority)
+    logger.info(f"작업 큐에 {added}개 민원 추가 (이미 있던 항목 {len(items) - added}개): {queue.path}")
+    return added
+
+
+def run_queue_workers(queue, process, max_workers=4, poll_interval=1.0, progress=None):
+    """큐가 빌 때까지 워커 스레드로 항목을 가져가 처리
+
+    process(record)는 처리된 레코드를 반환해야 한다. 예외가 나면 nack하여 다시 대기시킨다.
+    다른 프로세스가 처리 중인 항목만 남으면 lease 만료(워커 중단)에 대비해 기다렸다가 가져간다.
+    """
+    processed = [0]
+    lock = threading.Lock()
+
+    def worker():
+        try:
+            _work(default_owner())
+        finally:
+            queue.close()  # 이 스레드의 연결 닫기
+
+    def _work(owner):
+        while True:
+            leased = queue.lease(owner)
+            if not leased:
+                counts = queue.counts()
+                if not counts.get("pending") and not counts.get("leased"):
+                    return
+                # 다른 워커가 처리 중 - 끝나거나 lease가 만료될 때까지 대기
+                expiry = queue.next_lease_expiry()
+                wait = poll_interval if expiry is None else min(max(expiry - time.time(), 0.05), poll_interval)
+                time.sleep(wait)
+                continue
+            for key, record in leased:
+                try:
+                    result = process(record)
+                except Exception as e:
+                    logger.error(f"큐 항목 처리 실패: {key}, 오류: {str(e)}")
+                    record["오류여부"] = f"처리실패: {str(e)}"
+                    queue.nack(key, owner, record)
+                    continue
+                queue.ack(key, owner, result)
+                with lock:
+                    processed[0] += 1
+                if progress is not None:
+                    progress()
+
+    threads = [threading.Thread(target=worker, name=f"queue-worker-{i}", daemon=True) for i in range(max_workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return processed[0]
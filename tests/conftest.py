@@ -0,0 +1,14 @@
+"""pytest 공통 설정 - 설치하지 않고 src 레이아웃의 패키지를 불러오기"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+import pytest  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def fixtures():
+    """저장된 정부24 페이지 픽스처 (bench.load_fixtures 결과)"""
+    from hanolcare_crawler.bench import load_fixtures
+    return load_fixtures()
@@ -0,0 +1,138 @@
+"""회로 차단기 상태 전환 (닫힘 → 열림 → 반열림 → 닫힘/열림)"""
+import pytest
+
+from hanolcare_crawler import breaker
+from hanolcare_crawler.transport import HTTPStatusError, Response, TransportError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = Clock()
+    monkeypatch.setattr(breaker.time, "monotonic", fake)
+    return fake
+
+
+def status(code):
+    return HTTPStatusError(Response(code, {}, "", "https://www.gov.kr/x"))
+
+
+def fail(circuit, error=None):
+    with pytest.raises(TransportError):
+        with circuit.call():
+            raise error or TransportError("connection reset")
+
+
+def succeed(circuit):
+    with circuit.call():
+        pass
+
+
+def test_consecutive_failures_open(clock):
+    circuit = breaker.CircuitBreaker("test", open_seconds=30)
+    for _ in range(breaker.CONSECUTIVE_FAILURES - 1):
+        fail(circuit)
+    assert circuit.state == breaker.CLOSED
+    fail(circuit)
+    assert circuit.state == breaker.OPEN and circuit.opened == 1
+
+
+def test_failure_rate_opens(clock):
+    circuit = breaker.CircuitBreaker("test", failure_rate=0.5)
+    # 연속 실패 없이 절반 실패
+    for _ in range(breaker.MIN_CALLS // 2 - 1):
+        fail(circuit)
+        succeed(circuit)
+    fail(circuit)
+    assert circuit.state == breaker.CLOSED  # 아직 MIN_CALLS 미만
+    succeed(circuit)
+    fail(circuit)
+    assert circuit.state == breaker.OPEN
+
+
+def test_client_errors_do_not_count(clock):
+    circuit = breaker.CircuitBreaker("test")
+    for _ in range(breaker.CONSECUTIVE_FAILURES * 2):
+        fail(circuit, status(404))
+    assert circuit.state == breaker.CLOSED
+    for code in (500, 503, 429):
+        assert breaker.is_failure(status(code))
+
+
+def test_open_rejects_without_sending(clock):
+    circuit = breaker.CircuitBreaker("test", open_seconds=30)
+    for _ in range(breaker.CONSECUTIVE_FAILURES):
+        fail(circuit)
+    clock.now += 10
+    with pytest.raises(breaker.CircuitOpenError) as raised:
+        with circuit.call():
+            pytest.fail("열린 회로에서 요청을 보냄")
+    assert raised.value.retry_after == pytest.approx(20)
+    assert raised.value.request_sent is False
+    assert circuit.rejected == 1
+
+
+def test_half_open_single_probe_success_closes(clock):
+    circuit = breaker.CircuitBreaker("test", open_seconds=30)
+    for _ in range(breaker.CONSECUTIVE_FAILURES):
+        fail(circuit)
+    clock.now += 30
+    circuit.check()  # 시험 요청
+    assert circuit.state == breaker.HALF_OPEN
+    with pytest.raises(breaker.CircuitOpenError) as raised:
+        circuit.check()  # 시험 중에는 다른 요청 거부
+    assert raised.value.retry_after == breaker.PROBE_WAIT
+    circuit.record_success()
+    assert circuit.state == breaker.CLOSED
+    succeed(circuit)
+
+
+def test_half_open_probe_failure_doubles_open_time(clock):
+    circuit = breaker.CircuitBreaker("test", open_seconds=100)
+    for _ in range(breaker.CONSECUTIVE_FAILURES):
+        fail(circuit)
+    for expected in (200, 300, 300):
+        clock.now += circuit.open_seconds
+        fail(circuit)  # 반열림 시험 실패
+        assert circuit.state == breaker.OPEN
+        assert circuit.open_seconds == expected
+    # 회복하면 처음 대기 시간으로
+    clock.now += circuit.open_seconds
+    succeed(circuit)
+    assert circuit.state == breaker.CLOSED and circuit.open_seconds == 100
+
+
+def test_non_transport_error_releases_probe(clock):
+    circuit = breaker.CircuitBreaker("test", open_seconds=30)
+    for _ in range(breaker.CONSECUTIVE_FAILURES):
+        fail(circuit)
+    clock.now += 30
+    with pytest.raises(KeyError):
+        with circuit.call():
+            raise KeyError("parse")
+    assert circuit.state == breaker.HALF_OPEN
+    succeed(circuit)  # 시험 자리가 돌아와 다시 시험 가능
+    assert circuit.state == breaker.CLOSED
+
+
+def test_configure_and_for_url():
+    try:
+        breaker.configure(open_seconds=0)
+        assert breaker.for_url("https://www.gov.kr/a") is None
+        with breaker.guard("https://www.gov.kr/a"):
+            pass
+        breaker.configure(open_seconds=30)
+        first = breaker.for_url("https://www.gov.kr/a")
+        assert first is breaker.for_url("https://www.gov.kr/b")
+        assert first.name == "requests:www.gov.kr"
+        assert first is not breaker.for_url("https://www.gov.kr/a", "playwright")
+        assert breaker.for_url("https://other.example/a") is not first
+    finally:
+        breaker.configure()
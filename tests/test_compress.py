@@ -0,0 +1,53 @@
+"""압축 프레임 파일 - 여러 프레임 왕복, 잘린 마지막 프레임"""
+import csv
+
+import pytest
+
+from hanolcare_crawler import compress
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_framed_writer_round_trip(tmp_path, compression):
+    path = compress.compressed_path(str(tmp_path / "out.csv"), compression)
+    rows = [[f"민원 {i}", "설명, \"따옴표\"\n줄바꿈" * (i % 3)] for i in range(500)]
+    with compress.FramedWriter(path, compression, encoding="utf-8-sig", frame_size=1000) as writer:
+        csv.writer(writer).writerows(rows)
+    if compression != "none":
+        assert writer.frames > 1
+    with compress.open_text(path) as f:
+        assert list(csv.reader(f)) == rows
+
+
+def test_truncated_last_frame_is_skipped(tmp_path):
+    path = str(tmp_path / "journal.csv.gz")
+    journal = compress.CsvJournal(path, ["민원명"], compression="gzip")
+    journal.append([{"민원명": "첫 배치"}])
+    journal.append([{"민원명": "둘째 배치"}])
+    journal.close()
+    with open(path, "rb") as f:
+        data = f.read()
+    # 마지막 프레임 일부만 남은 파일 (수집 중단)
+    with open(path, "wb") as f:
+        f.write(data[:-5])
+    with compress.open_text(path) as f:
+        assert list(csv.DictReader(f)) == [{"민원명": "첫 배치"}]
+
+
+def test_html_archive_round_trip(tmp_path):
+    archive = compress.HtmlArchive(str(tmp_path / "pages.jsonl"), compression="gzip", frame_pages=2)
+    for i in range(5):
+        archive.add(f"https://www.gov.kr/{i}", f"<p>페이지 {i}</p>", "requests")
+    archive.close()
+    pages = list(compress.iter_archive(archive.path))
+    assert [(p["url"], p["html"], p["method"]) for p in pages] == [
+        (f"https://www.gov.kr/{i}", f"<p>페이지 {i}</p>", "requests") for i in range(5)
+    ]
+
+
+def test_compressed_path_and_detection():
+    assert compress.compressed_path("a.csv", "none") == "a.csv"
+    assert compress.compressed_path("a.csv", "gzip") == "a.csv.gz"
+    assert compress.compressed_path("a.csv.gz", "zstd") == "a.csv.gz"
+    assert compress.compression_of("a.csv.zst") == "zstd"
+    with pytest.raises(ValueError):
+        compress.resolve_compression("brotli")
@@ -0,0 +1,182 @@
+"""크롤러의 재시도 재예약 - 합류한 요청, 재처리 재개, 분석 작업 중복 방지"""
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from hanolcare_crawler import crawler, retry
+from hanolcare_crawler.bench import detail_url
+from hanolcare_crawler.transport import HTTPStatusError, Response
+
+
+@pytest.fixture(autouse=True)
+def fast_policy(monkeypatch):
+    monkeypatch.setattr(retry, "policy", retry.RetryPolicy(base=0.1, cap=0.1))
+    retry.reset()
+    yield
+    retry.reset()
+
+
+def test_joiner_waits_when_leader_reschedules(fixtures, monkeypatch):
+    entry = fixtures["detail"][0]
+    url = detail_url(entry["service_id"])
+    crawler.invalidate_url_cache(url)
+    calls = []
+
+    def fake_http_get(request_url, timeout=15, lane="detail_fetch"):
+        calls.append(request_url)
+        time.sleep(0.2)
+        if len(calls) == 1:
+            raise HTTPStatusError(Response(503, {}, "", request_url))
+        return Response(200, {}, entry["html"], request_url)
+
+    monkeypatch.setattr(crawler, "http_get", fake_http_get)
+    joined = {}
+
+    def joiner():
+        # submit() 밖에서 실행 - 재예약 신호(RetryLater)가 퍼지면 스레드가 죽음
+        try:
+            joined["doc"] = crawler.get_page_document(url)
+        except BaseException as e:
+            joined["error"] = e
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            leader = retry.submit(executor, crawler.get_page_document, url)
+            time.sleep(0.05)
+            thread = threading.Thread(target=joiner)
+            thread.start()
+            thread.join(timeout=5)
+            doc = leader.result(timeout=5)
+    finally:
+        crawler.invalidate_url_cache(url)
+
+    assert "error" not in joined
+    assert joined["doc"] is not None and joined["doc"] is not doc
+    assert doc.has_any("민원")
+    assert len(calls) == 2
+
+
+def test_joiner_in_batch_task_is_rescheduled_instead_of_sleeping(fixtures, monkeypatch):
+    entry = fixtures["detail"][0]
+    url = detail_url(entry["service_id"])
+    crawler.invalidate_url_cache(url)
+    calls = []
+
+    def fake_http_get(request_url, timeout=15, lane="detail_fetch"):
+        calls.append(request_url)
+        time.sleep(0.2)
+        if len(calls) == 1:
+            raise HTTPStatusError(Response(503, {}, "", request_url))
+        return Response(200, {}, entry["html"], request_url)
+
+    monkeypatch.setattr(crawler, "http_get", fake_http_get)
+    joiner_runs = []
+
+    def joiner():
+        joiner_runs.append(retry.resuming("shared_fetch", crawler.canonical_url(url)))
+        return crawler.get_page_document(url)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as leader_pool, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=1) as joiner_pool:
+            leader = retry.submit(leader_pool, crawler.get_page_document, url)
+            time.sleep(0.05)
+            joined = retry.submit(joiner_pool, joiner)
+            doc = leader.result(timeout=5)
+            joined_doc = joined.result(timeout=5)
+    finally:
+        crawler.invalidate_url_cache(url)
+
+    # 합류한 작업도 워커에서 기다리지 않고 재예약되어 다시 실행됨
+    assert len(joiner_runs) == 2
+    assert joined_doc is not None and joined_doc is not doc
+    assert len(calls) == 2
+
+
+def test_record_retry_refetches_detail_from_first_attempt(fixtures, monkeypatch):
+    entry = fixtures["detail"][0]
+    url = detail_url(entry["service_id"])
+    crawler.invalidate_url_cache(url)
+    calls = []
+    tried = []
+    validations = iter([False, True])
+
+    def fake_http_get(request_url, timeout=15, lane="detail_fetch"):
+        calls.append(request_url)
+        if len(calls) == 1:
+            raise HTTPStatusError(Response(503, {}, "", request_url))
+        return Response(200, {}, entry["html"], request_url)
+
+    class RecordingAttempts(retry.Attempts):
+        def __iter__(self):
+            for attempt in super().__iter__():
+                tried.append((self.stage, attempt))
+                yield attempt
+
+    monkeypatch.setattr(crawler, "http_get", fake_http_get)
+    monkeypatch.setattr(retry, "Attempts", RecordingAttempts)
+    monkeypatch.setattr(crawler, "validate_minwon_data", lambda data: next(validations))
+    budget = retry.budget
+    minwon = crawler.MinwonRecord({"민원명": "테스트 민원", "링크": url})
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            result = retry.submit(executor, crawler.process_single_minwon, minwon).result(timeout=5)
+    finally:
+        crawler.invalidate_url_cache(url)
+
+    assert result["오류여부"] == "재처리 성공"
+    # 상세 요청 재예약 뒤 성공 -> 검증 실패로 재처리 재예약 -> 재처리의 상세 요청은 처음 시도부터
+    assert tried == [("detail_fetch", 0), ("detail_fetch", 1), ("record", 1), ("detail_fetch", 0)]
+    assert budget.requests == 2
+
+
+def test_resumed_record_retry_does_not_repeat_first_pass(monkeypatch):
+    extracted = []
+    validations = iter([False, True])
+
+    def fake_extract(url, doc=None):
+        extracted.append(url)
+        return crawler.MinwonRecord({"민원명": "테스트 민원", "링크": url})
+
+    monkeypatch.setattr(crawler, "extract_detail_info", fake_extract)
+    monkeypatch.setattr(crawler, "validate_minwon_data", lambda data: next(validations))
+    minwon = crawler.MinwonRecord({"민원명": "테스트 민원", "링크": "https://www.gov.kr/portal/service/serviceInfo/T1"})
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        result = retry.submit(executor, crawler.process_single_minwon, minwon).result(timeout=5)
+
+    assert result["오류여부"] == "재처리 성공"
+    # 첫 처리 1번 + 재처리 1번 (재예약 뒤 첫 처리를 다시 하지 않음)
+    assert len(extracted) == 2
+
+
+class FakePool:
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fields, tasks):
+        future = concurrent.futures.Future()
+        self.futures.append(future)
+        return future
+
+
+def test_resubmitted_analysis_replaces_pending(monkeypatch):
+    pool = FakePool()
+    monkeypatch.setattr(crawler, "nlp_pool", pool)
+    record = crawler.MinwonRecord({"민원명": "테스트"})
+    crawler.submit_nlp(record, ["keywords"])
+    crawler.submit_nlp(record, ["enhance"])
+    crawler.submit_nlp(record, ["keywords"])
+    pending = record[crawler.NLP_PENDING_KEY]
+    assert [tasks for tasks, _ in pending] == [("enhance",), ("keywords",)]
+    assert pool.futures[0].cancelled()
+
+    # 재처리로 다시 추출한 결과를 병합해도 목록이 쌓이지 않음
+    detail = crawler.MinwonRecord({"민원명": "테스트"})
+    crawler.submit_nlp(detail, ["keywords"])
+    crawler.merge_detail_info(record, detail)
+    assert [tasks for tasks, _ in record[crawler.NLP_PENDING_KEY]] == [("enhance",), ("keywords",)]
+    assert pool.futures[2].cancelled()
@@ -0,0 +1,105 @@
+"""MinHash + LSH 유사 중복 검출 - 서비스ID 보존과 버킷 전체 비교"""
+import itertools
+
+from hanolcare_crawler import dedup
+from hanolcare_crawler.crawler import MinwonRecord
+
+PROCEDURE = "신청서 작성, 담당자 검토, 결재, 결과 통지 및 교부, 수수료 납부 확인"
+
+
+def record(service_id, title, description="주민등록표 등본과 초본을 발급하는 민원입니다", procedure=PROCEDURE):
+    return MinwonRecord({"서비스ID": service_id, "민원명": title, "설명": description, "처리절차": procedure})
+
+
+def brute_force_groups(records, threshold):
+    """모든 쌍을 서명으로 비교한 기준 결과 (서비스ID 제약 포함, 같은 병합 순서)"""
+    hasher = dedup.MinHasher()
+    signatures = [hasher.signature(dedup.shingles(r)) for r in records]
+    union_find = dedup._UnionFind([(r.get("서비스ID") or "").strip() for r in records])
+    for j, i in sorted((j, i) for i, j in itertools.combinations(range(len(records)), 2)):
+        if union_find.find(i) == union_find.find(j):
+            continue
+        if (dedup.estimated_similarity(signatures[i], signatures[j]) >= threshold
+                and union_find.can_union(i, j)):
+            union_find.union(i, j)
+    groups = {}
+    for index in range(len(records)):
+        groups.setdefault(union_find.find(index), []).append(index)
+    return sorted(members for members in groups.values() if len(members) > 1)
+
+
+def test_different_service_ids_never_merge():
+    records = [record("A1", "주민등록표 등본 교부"), record("A2", "주민등록표 등본 교부")]
+    assert dedup.find_near_duplicates(records, 0.9) == []
+    assert len(dedup.filter_near_duplicate_minwons(records, 0.9)) == 2
+
+
+def test_missing_service_id_merges_but_does_not_bridge_two_ids():
+    records = [
+        record("A1", "주민등록표 등본 교부"),
+        record("", "주민등록표 등본 교부 "),
+        record("A2", "주민등록표 등본  교부"),
+    ]
+    assert dedup.find_near_duplicates(records, 0.9) == [[0, 1]]
+    result = dedup.filter_near_duplicate_minwons(records, 0.9)
+    assert [r["서비스ID"] for r in result] == ["A1", "A2"]
+
+
+def test_same_service_id_merges():
+    records = [record("A1", "주민등록표 등본 교부"), record("A1", "주민등록표 등본 교부!")]
+    assert dedup.find_near_duplicates(records, 0.9) == [[0, 1]]
+
+
+def test_matches_brute_force_on_variants():
+    titles = ["주민등록표 등본 교부", "건축물대장 열람", "자동차등록원부 발급", "기초연금 신청", "청년 월세 지원"]
+    records = []
+    for n, title in enumerate(titles):
+        description = f"{title} 민원은 {n + 1}번 창구 또는 온라인에서 처리합니다"
+        procedure = f"{title} 신청서 작성, 담당 부서 검토, 결과 통지"
+        records.append(record(f"S{n}", title, description, procedure))
+        records.append(record("", title + " (온라인)", description, procedure))
+        records.append(record("", title, description, procedure + ", 추가 서류 보완"))
+        records.append(record(f"S{n}x", title + " 신청", description, procedure))
+    expected = brute_force_groups(records, 0.8)
+    # 각 서비스마다 서비스ID가 없는 두 항목이 첫 항목에 병합되고 다른 서비스ID는 남음
+    assert expected == [[4 * n, 4 * n + 1, 4 * n + 2] for n in range(len(titles))]
+    for threshold in (0.8, 0.9):
+        assert sorted(dedup.find_near_duplicates(records, threshold)) == brute_force_groups(records, threshold)
+
+
+def list_item(service_id, link, serial, category, **fields):
+    item = {"서비스ID": service_id, "링크": link, "일련번호": serial, "카테고리": category, "민원명": "주민등록표 등본 교부"}
+    item.update(fields)
+    return MinwonRecord(item)
+
+
+def test_collapse_list_items_by_service_id_and_link():
+    base = "https://www.gov.kr/portal/service/serviceInfo/"
+    items = [
+        list_item("PTR000050100", base + "PTR000050100", "1", "주민등록"),
+        list_item("PTR000050100", "/portal/service/serviceInfo/PTR000050100/", "37", "증명서", 담당부서="민원과"),
+        list_item("", "HTTPS://WWW.GOV.KR/portal/service/serviceInfo/PTR000050100", "52", "주민등록"),
+        list_item("PTR000050200", base + "PTR000050200", "2", "주민등록"),
+    ]
+    collapsed = dedup.collapse_list_items(items)
+    assert [item["서비스ID"] for item in collapsed] == ["PTR000050100", "PTR000050200"]
+    first = collapsed[0]
+    # 노출 위치마다의 일련번호/카테고리를 모두 남기고 빈 목록 필드는 채움
+    assert first["일련번호"] == "1, 37, 52"
+    assert first["카테고리"] == "주민등록, 증명서"
+    assert first["담당부서"] == "민원과"
+
+
+def test_canonical_url_normalizes_equivalent_links():
+    from hanolcare_crawler.crawler import canonical_url
+    expected = canonical_url("https://www.gov.kr/mw/AA020InfoCappView.do?HighCtgCD=A01&CappBizCD=1")
+    assert canonical_url("/mw/AA020InfoCappView.do/?CappBizCD=1&HighCtgCD=A01&empty=") == expected
+    assert canonical_url("HTTPS://WWW.GOV.KR/mw/AA020InfoCappView.do?CappBizCD=1&HighCtgCD=A01#top") == expected
+    assert canonical_url("") == ""
+
+
+def test_merge_detail_info_keeps_list_only_fields():
+    from hanolcare_crawler.crawler import merge_detail_info
+    minwon = list_item("PTR000050100", "https://www.gov.kr/x", "1, 37", "주민등록, 증명서")
+    merge_detail_info(minwon, {"일련번호": "", "카테고리": "", "설명": "상세 설명"})
+    assert (minwon["일련번호"], minwon["카테고리"], minwon["설명"]) == ("1, 37", "주민등록, 증명서", "상세 설명")
@@ -0,0 +1,88 @@
+"""PageDocument 텍스트 뷰와 extract_detail_info의 트리 보존"""
+from bs4 import BeautifulSoup, CData, NavigableString
+
+from hanolcare_crawler import crawler
+from hanolcare_crawler.bench import detail_url
+from hanolcare_crawler.document import PageTextIndex
+
+
+def test_extract_detail_info_keeps_tree_and_builds_text_once(fixtures, monkeypatch):
+    builds = []
+    original_build = PageTextIndex._build
+
+    def counting_build(self):
+        builds.append(self)
+        return original_build(self)
+
+    monkeypatch.setattr(PageTextIndex, "_build", counting_build)
+    for entry in fixtures["detail"]:
+        doc = crawler.parse_document(entry["html"])
+        before = str(doc.soup)
+        builds.clear()
+
+        crawler.extract_detail_info(detail_url(entry["service_id"]), doc)
+
+        assert str(doc.soup) == before, entry["file"]
+        assert len(builds) <= 1, entry["file"]
+
+
+def test_section_pass_matches_fresh_parse(fixtures):
+    # 섹션 처리 후에도 문서 텍스트는 새로 파싱한 결과와 같아야 함
+    for entry in fixtures["detail"]:
+        doc = crawler.parse_document(entry["html"])
+        crawler.extract_detail_info(detail_url(entry["service_id"]), doc)
+        assert doc.text == BeautifulSoup(entry["html"], "html.parser").get_text(), entry["file"]
+
+
+TERMS = ("민원", "신청", "처리기간", "수수료", "서류", "없는단어", " ", "\n")
+
+
+def first_visible_string(soup, term):
+    """get_text()에 포함되는 문자열 중 term을 포함하는 첫 문자열 (스크립트/주석 제외)"""
+    return soup.find(string=lambda t: type(t) in (NavigableString, CData) and term in t)
+
+
+def test_text_index_matches_get_text(fixtures):
+    for group in fixtures.values():
+        for entry in group:
+            soup = BeautifulSoup(entry["html"], "html.parser")
+            index = PageTextIndex(soup)
+            assert index.text == soup.get_text(), entry["file"]
+            for term in TERMS:
+                expected = [(el, el.text) for el in soup.find_all(["p", "div", "li"]) if term in el.text]
+                actual = index.find_blocks(term)
+                assert [(id(el), text) for el, text in actual] == [(id(el), text) for el, text in expected]
+                assert index.first_string_containing(term) is first_visible_string(soup, term)
+
+
+def test_text_index_nested_blocks_and_boundaries():
+    html = "<div>신<b>청</b><div><p>신청 서류</p><li>서</li><li>류</li></div></div><!-- 신청 --><p>신청</p>"
+    soup = BeautifulSoup(html, "html.parser")
+    index = PageTextIndex(soup)
+    for term in ("신청", "서류", "청", "서", "류신"):
+        expected = [el for el in soup.find_all(["p", "div", "li"]) if term in el.text]
+        assert [el for el, _ in index.find_blocks(term)] == expected
+        assert index.first_string_containing(term) is first_visible_string(soup, term)
+    # 주석 안의 "신청"은 건너뜀
+    assert PageTextIndex(BeautifulSoup("<!-- 신청 --><p>신청</p>", "html.parser")).first_string_containing("신청").parent.name == "p"
+
+
+def test_sibling_group_matches_container_find_all():
+    import copy
+
+    from hanolcare_crawler.document import SiblingGroup
+    html = (
+        "<h2 class='t'>제목</h2><ul class='row'><li>a<ul><li>b</li></ul></li></ul>"
+        "<p class='item'>c<div class='field'>d</div></p><div class='x'><p class='row'>e</p><li>f</li></div>"
+    )
+    soup = BeautifulSoup(html, "html.parser")
+    siblings = [s for s in soup.h2.next_siblings if s.name]
+    container = soup.new_tag("div")
+    for sibling in siblings:
+        container.append(copy.copy(sibling))
+    group = SiblingGroup(siblings)
+    for args, kwargs in ((("li",), {}), ((["p", "div"],), {"class_": ["item", "field", "row"]}), (("ul",), {"class_": "row"})):
+        assert [str(t) for t in group.find_all(*args, **kwargs)] == [str(t) for t in container.find_all(*args, **kwargs)]
+    # 원래 트리의 요소를 그대로 돌려줌 (복사/이동 없음)
+    assert group.find_all("li")[0].parent is siblings[0]
+    assert str(soup) == str(BeautifulSoup(html, "html.parser"))
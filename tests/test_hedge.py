@@ -0,0 +1,114 @@
+"""요청 헤징 - 지연 기준, 헤징 예산, 회로 차단기의 요청별 기록"""
+import threading
+import time
+
+import pytest
+
+from hanolcare_crawler import breaker, crawler, hedge, transport
+from hanolcare_crawler.transport import Response
+
+
+def test_latency_window_needs_min_samples():
+    window = hedge.LatencyWindow()
+    for _ in range(hedge.MIN_SAMPLES - 1):
+        window.observe(1.0)
+    assert window.threshold() is None
+    window.observe(1.0)
+    assert window.threshold() == 1.0
+
+
+def test_latency_window_floor_and_recompute():
+    window = hedge.LatencyWindow()
+    for _ in range(hedge.MIN_SAMPLES):
+        window.observe(0.001)
+    assert window.threshold() == hedge.MIN_HEDGE_DELAY
+    # p95는 RECOMPUTE_EVERY개마다 다시 계산
+    for _ in range(hedge.RECOMPUTE_EVERY - 1):
+        window.observe(10.0)
+    assert window.threshold() == hedge.MIN_HEDGE_DELAY
+    window.observe(10.0)
+    assert window.threshold() == 10.0
+
+
+def test_latency_window_p95():
+    window = hedge.LatencyWindow()
+    for seconds in range(1, 21):
+        window.observe(float(seconds))
+    # nearest-rank p95 of 1..20
+    assert window.threshold() == 19.0
+
+
+def test_hedge_budget():
+    budget = hedge.HedgeBudget(0.1)
+    assert not budget.try_spend()
+    for _ in range(10):
+        budget.record_request()
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    assert budget.hedges == 1
+    never = hedge.HedgeBudget(0.0)
+    never.record_request()
+    assert not never.try_spend()
+
+
+@pytest.fixture
+def hedging():
+    hedge.configure(ratio=1.0, max_workers=2)
+    breaker.configure()
+    yield
+    hedge.shutdown()
+    hedge.configure()
+    breaker.configure()
+
+
+def prime(lane_name, seconds=0.01):
+    window = hedge.lane(lane_name)
+    for _ in range(hedge.MIN_SAMPLES):
+        window.observe(seconds)
+
+
+def test_slow_primary_is_hedged(hedging):
+    prime("test")
+    calls = []
+
+    def fn():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return "primary"
+        return "hedged"
+
+    assert hedge.call("test", fn) == "hedged"
+    assert len(calls) == 2
+    assert hedge.budget.hedges == 1
+
+
+def test_no_hedge_without_budget(hedging):
+    hedge.configure(ratio=0.0, max_workers=2)
+    prime("test")
+    assert hedge.call("test", lambda: time.sleep(0.1) or "primary") == "primary"
+    assert hedge.budget.hedges == 0
+
+
+def test_breaker_records_each_hedged_attempt(hedging, monkeypatch):
+    url = "https://www.gov.kr/portal/service/serviceInfo/HEDGE"
+    prime("detail_fetch")
+    calls = []
+    primary_done = threading.Event()
+
+    def fake_get(request_url, timeout=15):
+        calls.append(request_url)
+        if len(calls) == 1:
+            # 느리게 실패하는 첫 요청 - 헤징한 요청이 먼저 성공
+            time.sleep(0.3)
+            primary_done.set()
+            return Response(503, {}, "", request_url)
+        return Response(200, {}, "ok", request_url)
+
+    monkeypatch.setattr(transport, "get", fake_get)
+    assert crawler.http_get(url).text == "ok"
+    assert primary_done.wait(2)
+    time.sleep(0.05)
+
+    circuit = breaker.for_url(url)
+    assert sorted(circuit._outcomes) == [False, True]
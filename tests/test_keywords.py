@@ -0,0 +1,73 @@
+"""코퍼스 TF-IDF 키워드 - SciPy 구현과 순수 파이썬 구현의 순서 일치"""
+import pytest
+
+from hanolcare_crawler import keywords
+
+pytest.importorskip("scipy")
+
+# 같은 문서 빈도의 단어가 여러 개라 점수가 같은 키워드가 많은 코퍼스
+CORPUS = [
+    {"민원명": "여권 재발급", "설명": "여권 비자 체류 국적 귀화 신청"},
+    {"민원명": "주민등록 등본", "설명": "등본 초본 발급 열람 조회 교부 세대주 세대원"},
+    {"민원명": "자동차 등록", "설명": "자동차 차량 번호판 검사 보험 과태료 범칙금 벌금"},
+    {"민원명": "기초연금", "설명": "연금 수급자 소득 재산 요건 기준 대상자 신청"},
+    {"민원명": "건축물 대장", "설명": "건축물 토지 임야 지적 부동산 열람 발급"},
+    {"민원명": "청년 월세", "설명": "월세 임대 임차 계약 전세 지원금 신청 요건"},
+]
+
+
+@pytest.mark.parametrize("top_k", [1, 2, 3, 5, 10])
+def test_vectorized_matches_pure_python(top_k):
+    vectorized = keywords._tfidf_vectorized(CORPUS, top_k, 1, 0.5, None)
+    pure = keywords._tfidf_pure_python(CORPUS, top_k, 1, 0.5, None)
+    assert vectorized == pure
+
+
+def test_ties_are_ordered_by_term():
+    records = [{"민원명": "토지 건축 대장"}, {"민원명": "여권 비자"}]
+    for extract in (keywords._tfidf_vectorized, keywords._tfidf_pure_python):
+        result = extract(records, 2, 1, 0.5, None)
+        assert result == [sorted(["토지", "건축", "대장"])[:2], ["비자", "여권"]]
+
+
+def test_higher_score_beats_term_order():
+    records = [{"민원명": "토지 토지 토지 건축"}, {"민원명": "여권"}]
+    for extract in (keywords._tfidf_vectorized, keywords._tfidf_pure_python):
+        assert extract(records, 2, 1, 0.5, None)[0] == ["토지", "건축"]
+
+
+def synthetic_corpus(n_docs, vocab=400, seed=7):
+    import random
+    rng = random.Random(seed)
+    words = [f"단어{i:03d}" for i in range(vocab)]
+    return [
+        # 일부는 빈 문서, 일부는 긴 문서 (행 길이가 크게 다른 묶음)
+        {"설명": " ".join(rng.choice(words) for _ in range(0 if i % 17 == 0 else rng.randint(1, 120)))}
+        for i in range(n_docs)
+    ]
+
+
+class WordTokenizer:
+    def nouns(self, text):
+        return text.split()
+
+
+@pytest.mark.parametrize("block_rows", [1, 7, 1024])
+def test_blockwise_top_k_matches_pure_python(monkeypatch, block_rows):
+    monkeypatch.setattr(keywords, "BLOCK_ROWS", block_rows)
+    records = synthetic_corpus(300)
+    for top_k in (1, 5, 200):
+        vectorized = keywords._tfidf_vectorized(records, top_k, 2, 0.5, WordTokenizer())
+        pure = keywords._tfidf_pure_python(records, top_k, 2, 0.5, WordTokenizer())
+        assert vectorized == pure
+
+
+def test_top_k_rows_are_not_sorted_one_by_one(monkeypatch):
+    # 묶음 하나에 argpartition 한 번 - 행마다 정렬하지 않음
+    import numpy as np
+    calls = []
+    real = np.argpartition
+    monkeypatch.setattr(keywords.np, "argpartition", lambda *a, **kw: calls.append(1) or real(*a, **kw))
+    monkeypatch.setattr(keywords.np, "lexsort", lambda *a, **kw: pytest.fail("행별 lexsort 사용"))
+    keywords._tfidf_vectorized(synthetic_corpus(2500), 5, 1, 0.5, WordTokenizer())
+    assert len(calls) == -(-2500 // keywords.BLOCK_ROWS)
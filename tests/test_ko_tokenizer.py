@@ -0,0 +1,101 @@
+"""내장 한국어 분석기 - 명사 끝 글자와 겹치는 어미, 사람이 붙인 명사 정답과의 일치도"""
+import pytest
+
+from hanolcare_crawler import ko_tokenizer
+from hanolcare_crawler.ko_tokenizer import KoreanTokenizer
+
+# 어절 → 기대 명사 (사람이 붙인 정답)
+GOLD = [
+    ("이용제한", ["이용", "제한"]),
+    ("이용제한을", ["이용", "제한"]),
+    ("권한이", ["권한"]),
+    ("기한까지", ["기한"]),
+    ("역할", ["역할"]),
+    ("포함", ["포함"]),
+    ("포함한", ["포함"]),
+    ("피해", ["피해"]),
+    ("피해를", ["피해"]),
+    ("재해보험", ["재해", "보험"]),
+    ("한도", ["한도"]),
+    ("확인할", ["확인"]),
+    ("신청한", ["신청"]),
+    ("발급함", ["발급"]),
+    ("변경해", ["변경"]),
+    ("검토한", ["검토"]),
+    ("소요될", ["소요"]),
+    ("신청합니다", ["신청"]),
+    ("발급받는", ["발급"]),
+    ("등록된", ["등록"]),
+    ("주민등록등본", ["주민등록", "등본"]),
+    ("민원을", ["민원"]),
+    ("서비스는", ["서비스"]),
+    ("신분증과", ["신분증"]),
+    ("주민센터에서", ["주민센터"]),
+    ("수수료는", ["수수료"]),
+    ("지원금을", ["지원금"]),
+    ("처리기간은", ["처리", "기간"]),
+    ("담당부서로", ["담당부서"]),
+]
+
+
+def agreement(tokenizer, gold=GOLD):
+    """정답과 분석 결과가 완전히 같은 어절의 비율"""
+    return sum(tokenizer.nouns(word) == nouns for word, nouns in gold) / len(gold)
+
+
+@pytest.mark.parametrize("word,nouns", GOLD)
+def test_gold_nouns(word, nouns):
+    assert KoreanTokenizer().nouns(word) == nouns
+
+
+def test_whole_word_noun_keeps_final_syllable():
+    tokenizer = KoreanTokenizer()
+    assert tokenizer.pos("이용제한") == [("이용", "Noun"), ("제한", "Noun")]
+    assert tokenizer.pos("포함한") == [("포함", "Noun"), ("한", "Verb")]
+
+
+def test_ambiguous_ending_kept_on_unknown_stem():
+    # 사전에 없는 어간 뒤의 "한"은 명사의 일부일 수 있으므로 통째로 명사로 둠
+    assert KoreanTokenizer().nouns("보안강한") == ["보안강한"]
+    # 사용자 명사를 추가하면 분해
+    tokenizer = KoreanTokenizer(user_nouns=["보안", "강"])
+    assert tokenizer.nouns("보안강한") == ["보안", "강"]
+
+
+def test_gold_agreement():
+    assert agreement(KoreanTokenizer()) == 1.0
+
+
+class FakeOkt:
+    def __init__(self, nouns):
+        self._nouns = nouns
+
+    def nouns(self, text):
+        return self._nouns.get(text, [])
+
+
+def test_compare_with_okt_counts_noun_overlap():
+    tokenizer = KoreanTokenizer()
+    okt = FakeOkt({"주민등록등본을 발급": ["주민등록", "등본", "발급"], "민원을 신청": ["민원", "접수"]})
+    result = ko_tokenizer.compare_with_okt(list(okt._nouns), okt, tokenizer)
+    assert result["precision"] == pytest.approx(4 / 5)
+    assert result["recall"] == pytest.approx(4 / 5)
+    assert result["f1"] == pytest.approx(4 / 5)
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_load_corpus_reads_compressed_csv(tmp_path, compression):
+    from hanolcare_crawler import crawler
+    records = [{"민원명": "주민등록표 등본 교부", "설명": "짧음", "처리절차": "신청 후 즉시 교부"}]
+    path = crawler.save_to_csv(records, "corpus.csv", str(tmp_path), compression=compression)
+    assert ko_tokenizer.load_corpus([path]) == ["주민등록표 등본 교부", "신청 후 즉시 교부"]
+
+
+def test_okt_agreement_on_fixture_corpus(fixtures):
+    from hanolcare_crawler import crawler
+    if not crawler.init_okt():
+        pytest.skip("Okt(KoNLPy/JVM)를 사용할 수 없어 일치도를 측정하지 않음")
+    texts = [entry["html"] for entry in fixtures["detail"]]
+    texts = [crawler.parse_document(html).spaced_text for html in texts]
+    result = ko_tokenizer.compare_with_okt(texts, crawler.okt, KoreanTokenizer())
+    assert result["f1"] >= ko_tokenizer.OKT_MIN_F1
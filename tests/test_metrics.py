@@ -0,0 +1,120 @@
+"""단계별 지표 - 히스토그램, Prometheus 노출 형식(HELP/TYPE), 내보내기, 요약"""
+import pytest
+
+from hanolcare_crawler import metrics
+
+
+def help_lines(registry):
+    return {
+        line.split(" ", 3)[2]: line.split(" ", 3)[3]
+        for line in registry.render_prometheus().splitlines() if line.startswith("# HELP ")
+    }
+
+
+def test_http_counters_have_descriptions():
+    registry = metrics.MetricsRegistry()
+    registry.inc("hanolcare_http_requests_total", scheme="https")
+    registry.inc("hanolcare_http_connections_total", scheme="https")
+    described = help_lines(registry)
+    for name in ("hanolcare_http_requests_total", "hanolcare_http_connections_total"):
+        assert described[name] == metrics.METRICS[name][1]
+        assert described[name] != name
+
+
+def test_retry_giveups_have_description():
+    registry = metrics.MetricsRegistry()
+    registry.inc("hanolcare_retry_giveups_total", stage="detail_fetch", reason="budget")
+    assert help_lines(registry)["hanolcare_retry_giveups_total"] == metrics.METRICS["hanolcare_retry_giveups_total"][1]
+
+
+def test_circuit_counters_have_descriptions():
+    registry = metrics.MetricsRegistry()
+    registry.inc("hanolcare_circuit_transitions_total", circuit="requests:www.gov.kr", state="open")
+    registry.inc("hanolcare_circuit_rejected_total", circuit="requests:www.gov.kr")
+    described = help_lines(registry)
+    for name in ("hanolcare_circuit_transitions_total", "hanolcare_circuit_rejected_total"):
+        assert described[name] == metrics.METRICS[name][1]
+
+
+def test_every_counter_in_source_is_registered():
+    import pathlib
+    import re
+
+    package = pathlib.Path(metrics.__file__).parent
+    used = set()
+    for path in package.glob("*.py"):
+        used.update(re.findall(r'metrics\.inc\(\s*"(hanolcare_\w+)"', path.read_text(encoding="utf-8")))
+    assert used
+    assert used - set(metrics.METRICS) == set()
+
+
+def test_histogram_quantiles_interpolate_within_buckets():
+    histogram = metrics.Histogram(buckets=(0.1, 0.2, 0.4))
+    for value in (0.05, 0.15, 0.15, 0.3):
+        histogram.observe(value)
+    assert histogram.counts == [1, 2, 1, 0]
+    assert histogram.quantile(0.5) == pytest.approx(0.15)
+    assert histogram.quantile(1.0) == pytest.approx(0.3)  # 관측 최댓값으로 제한
+    assert histogram.quantile(0.0) == pytest.approx(0.05)
+    histogram.observe(5.0)  # +Inf 구간
+    assert histogram.quantile(0.99) == 5.0
+    assert metrics.Histogram().quantile(0.5) == 0.0
+
+
+def test_render_prometheus_cumulative_buckets_and_escaped_labels():
+    registry = metrics.MetricsRegistry(buckets=(0.1, 1.0))
+    registry.observe(metrics.STAGE_SECONDS, 0.05, stage="parse")
+    registry.observe(metrics.STAGE_SECONDS, 0.5, stage="parse")
+    registry.inc("hanolcare_fetch_total", method="requests", outcome='bad "quote"\n')
+    text = registry.render_prometheus()
+    assert 'hanolcare_stage_seconds_bucket{stage="parse",le="0.1"} 1' in text
+    assert 'hanolcare_stage_seconds_bucket{stage="parse",le="1.0"} 2' in text
+    assert 'hanolcare_stage_seconds_bucket{stage="parse",le="+Inf"} 2' in text
+    assert 'hanolcare_stage_seconds_count{stage="parse"} 2' in text
+    assert 'outcome="bad \\"quote\\"\\n"' in text
+    assert text.count("# TYPE hanolcare_stage_seconds histogram") == 1
+
+
+def test_timer_and_summary(monkeypatch):
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "registry", registry)
+    with metrics.timer("detail_fetch", method="requests"):
+        pass
+    with pytest.raises(ValueError):
+        with metrics.timer("parse"):
+            raise ValueError
+    metrics.inc("hanolcare_cache_requests_total", cache="page", result="hit")
+    metrics.inc("hanolcare_cache_requests_total", 3, cache="page", result="miss")
+    metrics.inc("hanolcare_http_requests_total", 10, scheme="https")
+    metrics.inc("hanolcare_http_connections_total", 2, scheme="https")
+    assert {labels["stage"] for labels, _ in registry.histograms(metrics.STAGE_SECONDS)} == {"detail_fetch", "parse"}
+    summary = "\n".join(metrics.summary_lines())
+    assert "detail_fetch(requests)" in summary
+    assert "캐시 page: 적중률 25.0%" in summary
+    assert "연결 재사용률 80.0%" in summary
+
+
+def free_port():
+    import socket
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_exporter_textfile_and_http_endpoint(tmp_path, monkeypatch):
+    import urllib.request
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "registry", registry)
+    registry.inc("hanolcare_records_total", result="정상")
+    path = str(tmp_path / "textfile" / "crawler.prom")
+    port = free_port()
+    exporter = metrics.MetricsExporter(textfile=path, port=port, interval=60, host="127.0.0.1").start()
+    try:
+        body = urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics").read().decode()
+        assert 'hanolcare_records_total{result="정상"} 1' in body
+    finally:
+        registry.inc("hanolcare_records_total", result="정상")
+        exporter.stop()
+    # 종료 시 마지막 값으로 한 번 더 저장
+    with open(path, encoding="utf-8") as f:
+        assert 'hanolcare_records_total{result="정상"} 2' in f.read()
@@ -0,0 +1,43 @@
+"""텍스트 분석 워커 프로세스 풀 - 별도 프로세스의 분석 결과가 크롤러 프로세스 결과와 같은지"""
+import os
+
+import pytest
+
+from hanolcare_crawler import crawler
+from hanolcare_crawler.nlp_pool import NLPWorkerPool
+
+FIELDS = {
+    "민원명": "",
+    "설명": "주민등록표 등본을 인터넷으로 발급받는 민원 서비스입니다",
+    "처리절차": "신청 접수 후 담당자 확인",
+    "신청방법": "인터넷 신청",
+    "필요서류": "신분증",
+    "본문": "주민등록표 등본 발급 신청 방법과 처리 절차, 필요 서류 안내",
+}
+TASKS = [("keywords",), ("title",), ("describe",), ("enhance",)]
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = NLPWorkerPool(workers=2, backend="builtin")
+    yield pool
+    pool.shutdown()
+
+
+def test_worker_processes_use_builtin_backend(pool):
+    assert pool.korean_backend == "builtin"
+    assert pool.korean_available and pool.available
+
+
+def test_results_match_in_process(pool, monkeypatch):
+    monkeypatch.setattr(crawler, "NLP_ENABLED", True)
+    monkeypatch.setattr(crawler, "NLP_BACKEND", "builtin")
+    futures = [pool.submit(FIELDS, tasks) for tasks in TASKS]
+    for tasks, future in zip(TASKS, futures):
+        assert future.result(timeout=60) == crawler.nlp_enrich(dict(FIELDS), tasks)
+    assert "키워드" in futures[0].result()
+
+
+def test_tasks_run_outside_crawler_process(pool):
+    pids = {pool._executor.submit(os.getpid).result(timeout=60) for _ in range(4)}
+    assert os.getpid() not in pids
@@ -0,0 +1,71 @@
+"""get_page_document의 요청 병합과 페이지 캐시 - 호출한 쪽마다 독립된 트리"""
+import threading
+import time
+
+import pytest
+
+from hanolcare_crawler import crawler
+from hanolcare_crawler.bench import detail_url
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+@pytest.fixture
+def page(fixtures, monkeypatch):
+    """모든 요청에 첫 상세 픽스처를 느리게 돌려주는 http_get (호출 수 기록)"""
+    entry = fixtures["detail"][0]
+    url = detail_url(entry["service_id"])
+    calls = []
+
+    def fake_http_get(request_url, timeout=15, lane="detail_fetch"):
+        calls.append(request_url)
+        time.sleep(0.2)
+        return FakeResponse(entry["html"])
+
+    monkeypatch.setattr(crawler, "http_get", fake_http_get)
+    crawler.invalidate_url_cache(url)
+    yield url, entry["html"], calls
+    crawler.invalidate_url_cache(url)
+
+
+def test_concurrent_callers_get_independent_unmodified_trees(page):
+    url, html, calls = page
+    expected = str(crawler.parse_document(html).soup)
+    callers = 4
+    barrier = threading.Barrier(callers)
+    docs = [None] * callers
+
+    def worker(i):
+        barrier.wait()
+        docs[i] = crawler.get_page_document(url)
+        # 다른 호출자가 아직 트리를 읽는 동안 자기 트리를 수정
+        if i == 0:
+            docs[i].soup.body.clear()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert len({id(doc) for doc in docs}) == callers
+    assert len({id(doc.soup) for doc in docs}) == callers
+    for doc in docs[1:]:
+        assert str(doc.soup) == expected
+    # 캐시 적중도 수정되지 않은 새 트리
+    cached = crawler.get_page_document(url)
+    assert cached is not docs[0]
+    assert str(cached.soup) == expected
+    assert len(calls) == 1
+
+
+def test_extraction_on_cached_page_does_not_leak(page):
+    url, html, calls = page
+    first = crawler.extract_detail_info(url)
+    second = crawler.extract_detail_info(url)
+    assert len(calls) == 1
+    assert dict(first) == dict(second)
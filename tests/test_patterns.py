@@ -0,0 +1,111 @@
+"""MultiPatternScanner - 패턴을 순서대로 re.search 하던 기존 루프와 같은 결과"""
+import pytest
+from bs4 import BeautifulSoup
+
+from hanolcare_crawler import patterns
+
+CASES = [
+    (patterns.DURATION_PATTERNS, patterns.duration_scanner),
+    (patterns.ONCLICK_PATTERNS, patterns.onclick_scanner),
+    (patterns.SERVICE_ID_PATTERNS, patterns.service_id_scanner),
+]
+
+# 우선순위가 낮은 패턴이 먼저 나오거나 일치 구간이 겹치는 경우
+EDGE_TEXTS = [
+    "",
+    "처리기간 없음",
+    "최대 14일 이내 처리 (3~5일 소요)",
+    "처리기간: 7 근무일, 즉시 발급은 1시간",
+    "3~5일",
+    "근무시간 내 3시간 이내, 최대 30일",
+    "5 영업일 또는 처리기간은 10",
+    "30일 이내",
+    "fn_goServiceDetail('A', 'B', 'C') goUrlNewChk('X', 'Y', 'Z')",
+    "goServiceDetail('1','2','3')",
+    "goUrlNewChk('only', 'two')",
+    "https://www.gov.kr/mw/AA040?id=ID_9&x=1 /portal/service/serviceInfo/SVC_1",
+    "/portal/service/serviceInfo/SVC_2?id=OTHER",
+    "https://www.gov.kr/?id=",
+]
+
+
+def page_inputs(fixtures):
+    texts, attributes = [], []
+    for group in fixtures.values():
+        for entry in group:
+            soup = BeautifulSoup(entry["html"], "html.parser")
+            texts.append(soup.get_text())
+            for element in soup.find_all(["a", "button"]):
+                for attr in ("onclick", "href"):
+                    if element.get(attr):
+                        attributes.append(element[attr])
+    return texts + attributes + EDGE_TEXTS
+
+
+def same(expected, actual):
+    if expected is None or actual is None:
+        return expected is actual
+    return (expected.re.pattern, expected.span(), expected.groups()) == (actual.re.pattern, actual.span(), actual.groups())
+
+
+@pytest.mark.parametrize("pattern_list,scanner", CASES)
+def test_scanner_matches_sequential_search(fixtures, pattern_list, scanner):
+    inputs = page_inputs(fixtures)
+    assert inputs
+    for text in inputs:
+        assert same(patterns._legacy_first(pattern_list, text), scanner.search(text)), text[:80]
+
+
+@pytest.mark.parametrize("pattern_list,scanner", CASES)
+def test_scanner_reports_matching_pattern_name(pattern_list, scanner):
+    for text in EDGE_TEXTS:
+        name, match = scanner.first(text)
+        if match is None:
+            assert name is None
+        else:
+            assert dict(pattern_list)[name] == match.re.pattern
+
+
+class CountingPattern:
+    """search/match 호출 수를 세는 컴파일된 정규식 대역"""
+
+    def __init__(self, compiled, calls):
+        self._compiled = compiled
+        self._calls = calls
+
+    def search(self, *args):
+        self._calls.append(("search", self._compiled.pattern))
+        return self._compiled.search(*args)
+
+    def match(self, *args):
+        self._calls.append(("match", self._compiled.pattern))
+        return self._compiled.match(*args)
+
+
+def counting_scanner(pattern_list, lead):
+    calls = []
+    scanner = patterns.MultiPatternScanner(pattern_list, lead)
+    scanner.combined = CountingPattern(scanner.combined, calls)
+    scanner.compiled = [CountingPattern(c, calls) for c in scanner.compiled]
+    return scanner, calls
+
+
+def test_single_pass_on_miss_and_on_top_priority_match():
+    scanner, calls = counting_scanner(patterns.DURATION_PATTERNS, patterns.DURATION_LEAD)
+    assert scanner.first("처리기간 안내가 없는 긴 본문 " * 100) == (None, None)
+    assert [kind for kind, _ in calls] == ["search"]
+
+    calls.clear()
+    name, match = scanner.first("민원 처리에 3일 소요, 최대 10일")
+    assert (name, match.group(0)) == ("unit", "3일")
+    # 합친 스캔 한 번 + 그 위치에서 일치 객체 만들기
+    assert [kind for kind, _ in calls] == ["search", "match"]
+
+
+def test_lower_priority_leftmost_checks_higher_patterns_from_there():
+    scanner, calls = counting_scanner(patterns.DURATION_PATTERNS, patterns.DURATION_LEAD)
+    text = "처리기간: 5 (근무시간 기준) 그 밖에 7일"
+    name, match = scanner.first(text)
+    assert (name, match.group(0)) == ("unit", "7일")
+    assert match.group(0) == patterns._legacy_first(patterns.DURATION_PATTERNS, text).group(0)
+    assert calls == [("search", scanner.combined._compiled.pattern), ("search", scanner.compiled[0]._compiled.pattern)]
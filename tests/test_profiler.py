@@ -0,0 +1,117 @@
+"""샘플링 프로파일러 - 단계 분류, 함수별 합계, speedscope/접힌 스택 저장, 요약"""
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from hanolcare_crawler import profiler
+
+
+def extract_detail_info(started, release):
+    """크롤러 추출 단계와 같은 이름의 함수 (단계 분류 확인용)"""
+    started.set()
+    release.wait(5)
+
+
+@pytest.fixture
+def busy_thread(monkeypatch):
+    # 이 파일의 함수를 패키지 코드로 취급
+    monkeypatch.setattr(profiler, "PACKAGE_DIR", os.path.dirname(os.path.abspath(__file__)))
+    started, release = threading.Event(), threading.Event()
+    thread = threading.Thread(target=extract_detail_info, args=(started, release), daemon=True)
+    thread.start()
+    started.wait(5)
+    yield thread
+    release.set()
+    thread.join(5)
+
+
+def stage_stacks(sampler, stage):
+    return [stack for (sample_stage, stack) in sampler.samples if sample_stage == stage]
+
+
+def test_sample_classifies_stage_by_package_function(busy_thread):
+    sampler = profiler.SamplingProfiler(interval=0.01)
+    for _ in range(3):
+        sampler.sample()
+    assert sampler.stage_totals()["extract"] == 3
+    (stack,) = stage_stacks(sampler, "extract")
+    names = [sampler.frames[index][0] for index in stack]
+    # 바깥 -> 안쪽 순서, 대기 중인 안쪽 함수가 마지막
+    assert names.index("extract_detail_info") < len(names) - 1
+    assert names[-1] == "wait"
+
+    self_counts, total_counts = sampler.function_totals("extract")
+    extract_index = stack[names.index("extract_detail_info")]
+    assert total_counts[extract_index] == 3
+    assert self_counts[extract_index] == 0
+    assert self_counts[stack[-1]] == 3
+
+
+def test_sample_without_package_frames_is_idle_or_other(monkeypatch):
+    monkeypatch.setattr(profiler, "PACKAGE_DIR", "/nonexistent-package-dir")
+    release = threading.Event()
+    thread = threading.Thread(target=release.wait, args=(5,), daemon=True)
+    thread.start()
+    try:
+        sampler = profiler.SamplingProfiler()
+        sampler.sample(exclude=threading.get_ident())
+    finally:
+        release.set()
+        thread.join(5)
+    totals = sampler.stage_totals()
+    assert totals["idle"] >= 1
+    assert "extract" not in totals
+
+
+def test_speedscope_and_folded_output(busy_thread, tmp_path):
+    sampler = profiler.SamplingProfiler(interval=0.01)
+    sampler.sample()
+    sampler.sample()
+    document = sampler.to_speedscope("test")
+    assert document["name"] == "test"
+    assert document["profiles"][0]["name"].startswith("all (")
+    profile_names = [profile["name"].split(" ")[0] for profile in document["profiles"]]
+    assert "extract" in profile_names
+    frame_count = len(document["shared"]["frames"])
+    for profile in document["profiles"]:
+        assert len(profile["samples"]) == len(profile["weights"])
+        assert profile["endValue"] == pytest.approx(sum(profile["weights"]))
+        assert all(0 <= index < frame_count for stack in profile["samples"] for index in stack)
+    all_profile = document["profiles"][0]
+    assert all_profile["endValue"] == pytest.approx(sum(sampler.stage_totals().values()) * 0.01)
+
+    folded = sampler.to_folded().splitlines()
+    extract_lines = [line for line in folded if line.startswith("extract;")]
+    assert len(extract_lines) == 1
+    assert "extract_detail_info" in extract_lines[0]
+    assert extract_lines[0].endswith(" 2")
+
+    speedscope_path, folded_path = sampler.save(str(tmp_path / "profiles"), prefix="run")
+    assert os.path.basename(speedscope_path) == "run.speedscope.json"
+    with open(speedscope_path, encoding="utf-8") as f:
+        assert json.load(f)["profiles"][0]["name"] == document["profiles"][0]["name"]
+    with open(folded_path, encoding="utf-8") as f:
+        assert f.read() == sampler.to_folded()
+
+
+def test_background_sampling_and_summary(busy_thread):
+    sampler = profiler.SamplingProfiler(interval=0.005).start()
+    for _ in range(500):
+        if sampler.ticks >= 3:
+            break
+        time.sleep(0.01)
+    sampler.stop()
+    assert sampler.ticks >= 3
+    assert sampler.elapsed > 0
+    # 샘플링 스레드 자신은 기록하지 않음
+    own_frames = {index for index, (name, filename, _) in enumerate(sampler.frames)
+                  if name == "_run" and filename == profiler.__file__}
+    assert not any(own_frames & set(stack) for (_, stack) in sampler.samples)
+    lines = sampler.summary_lines(top=3)
+    assert lines[0].startswith(f"샘플 {sampler.ticks}회")
+    assert any(line.strip().startswith("extract") for line in lines)
+    assert "자기 시간 상위 함수" in "\n".join(lines)
+    assert profiler.SamplingProfiler().summary_lines() == []
@@ -0,0 +1,63 @@
+"""MinwonRecord - CSV/JSON/pickle 왕복"""
+import json
+import pickle
+
+import pytest
+
+from hanolcare_crawler import crawler
+from hanolcare_crawler.record import RECORD_FIELDS, MinwonRecord
+
+
+def sample_records():
+    full = MinwonRecord({field: f"{field} 값, \"따옴표\"\n줄바꿈" for field in RECORD_FIELDS})
+    sparse = MinwonRecord({"민원명": "주민등록표 등본 교부", "오류여부": "정상", "처리기간": "즉시", "설명": ""})
+    sentinel = MinwonRecord({"민원명": "건축물대장 열람", "처리절차": "정보 없음", "신청방법": "정보 없음 (자동 생성)"})
+    return [full, sparse, sentinel]
+
+
+def as_row(record):
+    return {field: record.get(field, "") for field in RECORD_FIELDS}
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip"])
+def test_csv_round_trip(tmp_path, compression):
+    records = sample_records()
+    path = crawler.save_to_csv(records, "records.csv", str(tmp_path), compression=compression)
+    loaded = crawler.load_from_csv(path)
+    assert [as_row(r) for r in loaded] == [as_row(r) for r in records]
+    assert all(isinstance(r, MinwonRecord) for r in loaded)
+
+
+def test_csv_drops_keys_outside_schema(tmp_path):
+    record = MinwonRecord({"민원명": "테스트", crawler.NLP_PENDING_KEY: []})
+    path = crawler.save_to_csv([record], "records.csv", str(tmp_path), compression="none")
+    assert crawler.NLP_PENDING_KEY not in crawler.load_from_csv(path)[0]
+
+
+def test_json_round_trip():
+    for record in sample_records():
+        restored = MinwonRecord(json.loads(json.dumps(record.to_dict(), ensure_ascii=False)))
+        assert restored == record
+        assert list(restored) == list(record)
+
+
+def test_pickle_round_trip():
+    for record in sample_records():
+        record["_extra"] = [1, 2]
+        restored = pickle.loads(pickle.dumps(record))
+        assert restored == record
+        assert restored["_extra"] == [1, 2]
+
+
+def test_dict_compatibility():
+    record = MinwonRecord({"민원명": "a"})
+    plain = {"민원명": "a"}
+    record.update(설명="b")
+    plain.update(설명="b")
+    assert record == plain
+    assert record.setdefault("처리기간", "즉시") == plain.setdefault("처리기간", "즉시")
+    assert record.pop("설명") == plain.pop("설명")
+    assert dict(record) == plain
+    assert "설명" not in record and record.get("설명") is None
+    with pytest.raises(KeyError):
+        record["설명"]
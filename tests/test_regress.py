@@ -0,0 +1,81 @@
+"""성능 회귀 검사 - 기준값 비교, 기준값 저장, 전체 수집 측정"""
+import json
+
+from hanolcare_crawler import crawler, regress
+
+
+def metric(value, higher_is_better=True, **extra):
+    return dict(regress._metric(value, higher_is_better, "x"), **extra)
+
+
+def baseline(**metrics):
+    return {"threshold": 0.25, "metrics": metrics}
+
+
+def test_compare_flags_only_regressions_beyond_threshold():
+    base = baseline(
+        throughput=metric(100.0),
+        latency=metric(10.0, False),
+        tail=metric(10.0, False, threshold=0.5),
+        gone=metric(1.0),
+    )
+    current = {
+        "throughput": metric(70.0),   # 30% 감소 → 회귀
+        "latency": metric(7.0, False),  # 30% 감소 → 개선
+        "tail": metric(14.0, False),  # 40% 증가, 지표별 허용 50% → 정상
+        "new": metric(1.0),
+    }
+    rows, regressions = regress.compare(base, current)
+    status = {row[0]: row[4] for row in rows}
+    assert regressions == ["throughput"]
+    assert status["latency"] == "개선"
+    assert status["tail"] == "정상"
+    assert status["gone"] == "측정 안 됨"
+    assert status["new"] == "새 지표"
+    # 명령행 허용 비율은 모든 지표에 적용
+    assert regress.compare(base, current, threshold=0.5)[1] == []
+    assert "throughput" in regress.format_table(rows)
+
+
+def test_save_baseline_keeps_per_metric_thresholds(tmp_path):
+    path = str(tmp_path / "baseline.json")
+    regress.save_baseline({"a": metric(1.0), "b": metric(2.0)}, path)
+    data = regress.load_baseline(path)
+    data["metrics"]["b"]["threshold"] = 0.5
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+    regress.save_baseline({"a": metric(3.0), "b": metric(4.0)}, path)
+    saved = regress.load_baseline(path)["metrics"]
+    assert saved["a"] == metric(3.0)
+    assert saved["b"] == metric(4.0, threshold=0.5)
+
+
+def test_committed_baseline_is_comparable(fixtures):
+    base = regress.load_baseline()
+    assert {"offline.pages_per_sec", "e2e.details_per_sec"} <= set(base["metrics"])
+    rows, _ = regress.compare(base, base["metrics"])
+    assert all(row[4] == "정상" for row in rows)
+
+
+def test_e2e_metrics_times_detail_extraction():
+    metrics = regress.e2e_metrics(scale=1, workers=2, latency=0.0)
+    assert metrics["e2e.details_per_sec"]["value"] > 0
+    assert metrics["e2e.detail_p95_ms"]["value"] >= metrics["e2e.detail_p50_ms"]["value"]
+
+
+def test_e2e_timing_wrapper_forwards_document(fixtures, monkeypatch):
+    entry = fixtures["detail"][0]
+    seen = []
+
+    def fake_run(args):
+        # 이미 파싱한 문서를 넘기는 호출자 (bench와 같은 방식)
+        doc = crawler.parse_document(entry["html"])
+        seen.append(crawler.extract_detail_info("https://www.gov.kr/portal/service/serviceInfo/X", doc=doc))
+
+    original = crawler.extract_detail_info
+    monkeypatch.setattr(crawler, "run_crawler_with_args", fake_run)
+    metrics = regress.e2e_metrics(scale=1, workers=1, latency=0.0)
+    assert seen and seen[0]["민원명"]
+    assert metrics["e2e.details_per_sec"]["value"] > 0
+    assert crawler.extract_detail_info is original
@@ -0,0 +1,210 @@
+"""재시도 정책: Attempts, 재시도 예산, Retry-After, 비차단 재예약"""
+import concurrent.futures
+import email.utils
+import threading
+import time
+
+import pytest
+
+from hanolcare_crawler import retry
+from hanolcare_crawler.transport import HTTPStatusError, Response
+
+
+def status_error(status, headers=None):
+    return HTTPStatusError(Response(status, headers or {}, "", "https://example.test/x"))
+
+
+@pytest.fixture(autouse=True)
+def fast_policy(monkeypatch):
+    """테스트가 오래 걸리지 않도록 대기 시간을 짧게"""
+    monkeypatch.setattr(retry, "policy", retry.RetryPolicy(base=0.01, cap=0.02))
+    retry.reset()
+    yield
+    retry.reset()
+
+
+def run(attempts, outcomes):
+    """outcomes의 예외를 차례로 실패로 알리고 None을 만나면 성공 - (성공한 시도, 시도 목록)"""
+    tried = []
+    for attempt in attempts:
+        tried.append(attempt)
+        error = outcomes[attempt]
+        if error is None:
+            return attempt, tried
+        attempts.fail(error)
+    return None, tried
+
+
+def test_attempts_blocking_until_success():
+    attempts = retry.Attempts("test", "k", max_attempts=3)
+    assert run(attempts, [status_error(503), status_error(503), None]) == (2, [0, 1, 2])
+    assert attempts.gave_up is None
+
+
+def test_attempts_exhausted():
+    attempts = retry.Attempts("test", "k", max_attempts=2)
+    assert run(attempts, [status_error(503)] * 3) == (None, [0, 1])
+    assert attempts.gave_up == "attempts"
+
+
+def test_budget_exhaustion_gives_up():
+    budget = retry.reset(budget_ratio=0.0, min_retries=1)
+    first = retry.Attempts("test", "a", max_attempts=5)
+    assert run(first, [status_error(503), None]) == (1, [0, 1])
+    second = retry.Attempts("test", "b", max_attempts=5)
+    assert run(second, [status_error(503), None]) == (None, [0])
+    assert second.gave_up == "budget"
+    assert budget.retries == 1
+
+
+def test_budget_grows_with_requests():
+    budget = retry.RetryBudget(ratio=0.5, min_retries=0)
+    assert not budget.try_spend()
+    for _ in range(4):
+        budget.record_request()
+    assert budget.allowed == 2
+    assert budget.try_spend() and budget.try_spend()
+    assert not budget.try_spend()
+
+
+def test_unsent_request_does_not_spend_budget():
+    budget = retry.reset(budget_ratio=0.0, min_retries=0)
+    error = status_error(503)
+    error.request_sent = False
+    attempts = retry.Attempts("test", "k", max_attempts=3)
+    assert run(attempts, [error, None]) == (1, [0, 1])
+    assert budget.retries == 0
+
+
+def test_retry_after_seconds():
+    assert retry.retry_after_seconds(status_error(503, {"Retry-After": "7"})) == 7.0
+    assert retry.retry_after_seconds(status_error(503, {"Retry-After": " 0 "})) == 0.0
+    assert retry.retry_after_seconds(status_error(503, {"Retry-After": "soon"})) is None
+    assert retry.retry_after_seconds(status_error(503)) is None
+    assert retry.retry_after_seconds(ValueError("no response")) is None
+
+
+def test_retry_after_http_date():
+    when = email.utils.formatdate(time.time() + 30, usegmt=True)
+    seconds = retry.retry_after_seconds(status_error(429, {"Retry-After": when}))
+    assert 25 <= seconds <= 31
+    past = email.utils.formatdate(time.time() - 30, usegmt=True)
+    assert retry.retry_after_seconds(status_error(429, {"Retry-After": past})) == 0.0
+
+
+def test_retry_after_attribute_wins():
+    error = status_error(503, {"Retry-After": "7"})
+    error.retry_after = 1.5
+    assert retry.retry_after_seconds(error) == 1.5
+
+
+def test_delay_respects_retry_after_and_bounds():
+    policy = retry.RetryPolicy(base=1.0, cap=10.0)
+    previous = None
+    for _ in range(50):
+        previous = policy.delay(previous)
+        assert 1.0 <= previous <= 10.0
+    assert policy.delay(None, retry_after=20.0) == 20.0
+
+
+def test_long_retry_after_gives_up_without_waiting(monkeypatch):
+    slept = []
+    monkeypatch.setattr(retry.time, "sleep", slept.append)
+    attempts = retry.Attempts("test", "k", max_attempts=3)
+    error = status_error(503, {"Retry-After": str(int(retry.policy.max_retry_after) + 1)})
+    assert run(attempts, [error, None]) == (None, [0])
+    assert attempts.gave_up == "retry_after"
+    assert slept == []
+
+
+def test_blocking_wait_honours_retry_after(monkeypatch):
+    slept = []
+    monkeypatch.setattr(retry.time, "sleep", slept.append)
+    attempts = retry.Attempts("test", "k", max_attempts=3)
+    assert run(attempts, [status_error(503, {"Retry-After": "3"}), None]) == (1, [0, 1])
+    assert slept == [3.0]
+
+
+def test_submit_releases_worker_while_waiting(monkeypatch):
+    monkeypatch.setattr(retry, "policy", retry.RetryPolicy(base=0.3, cap=0.3))
+    order = []
+    runs = []
+    resumed = []
+
+    def flaky():
+        runs.append(threading.get_ident())
+        resumed.append(retry.resuming("test", "flaky"))
+        attempts = retry.Attempts("test", "flaky", max_attempts=3)
+        result, _ = run(attempts, [status_error(503), None])
+        order.append("flaky")
+        return result
+
+    def quick():
+        order.append("quick")
+        return "ok"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        flaky_future = retry.submit(executor, flaky)
+        time.sleep(0.05)
+        quick_future = retry.submit(executor, quick)
+        # 워커가 하나뿐이어도 대기 중인 flaky가 워커를 붙잡지 않으므로 quick이 먼저 끝남
+        assert quick_future.result(timeout=0.2) == "ok"
+        assert flaky_future.result(timeout=5) == 1
+
+    assert order == ["quick", "flaky"]
+    # 두 번째 실행은 이미 기다린 재시도부터 이어서 시도 (다시 기다리지 않음)
+    assert len(runs) == 2
+    assert resumed == [False, True]
+    assert not retry.deferrable()
+
+
+def test_submit_propagates_errors_and_results():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert retry.submit(executor, lambda: retry.deferrable()).result(timeout=5) is True
+        with pytest.raises(ZeroDivisionError):
+            retry.submit(executor, lambda: 1 / 0).result(timeout=5)
+
+
+def test_finished_attempts_start_fresh_in_the_same_task():
+    budget = retry.budget
+    seen = []
+
+    def task():
+        first = retry.Attempts("test", "k", max_attempts=3)
+        seen.append(run(first, [status_error(503), None]))
+        # 성공으로 끝난 반복의 재시도 번호와 대기 시간을 이어받지 않음
+        seen.append(retry.resuming("test", "k"))
+        second = retry.Attempts("test", "k", max_attempts=3)
+        seen.append(run(second, [None]))
+        given_up = retry.Attempts("test", "g", max_attempts=1)
+        seen.append(run(given_up, [status_error(503)]))
+        seen.append(retry.resuming("test", "g"))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        retry.submit(executor, task).result(timeout=5)
+
+    assert seen == [(1, [1]), False, (0, [0]), (None, [0]), False]
+    # 새 반복마다 요청 하나로 집계 (첫 반복 재개 시에는 집계하지 않음)
+    assert budget.requests == 3
+
+
+def test_outer_attempts_survive_inner_reschedule():
+    resumed = []
+    tried = []
+
+    def task():
+        resumed.append(retry.resuming("outer", "k"))
+        outer = retry.Attempts("outer", "k", max_attempts=3, start=1)
+        for attempt in outer:
+            inner = retry.Attempts("inner", "k", max_attempts=3)
+            result, inner_tried = run(inner, [status_error(503), None])
+            tried.append((attempt, inner_tried))
+            return result
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        assert retry.submit(executor, task).result(timeout=5) == 1
+
+    # 바깥 대기 뒤 재개, 안쪽 재예약 뒤에도 바깥 반복은 이어서 재개
+    assert resumed == [False, True, True]
+    assert tried == [(1, [1])]
+
@@ -0,0 +1,96 @@
+"""샤드 나누기와 병합 - 샤드 지정 해석, 안정적인 배정, 결과 파일 찾기, 전체 기준 중복 병합"""
+import zlib
+
+import pytest
+
+from hanolcare_crawler import crawler, shard
+
+
+def minwon(index, **fields):
+    base = {
+        "민원명": f"민원 {index}", "담당부서": "행정안전부", "서비스ID": f"SVC{index:04d}",
+        "링크": f"/mw/AA020InfoCappView.do?CappBizCD={index}", "일련번호": str(index), "오류여부": "정상",
+    }
+    base.update(fields)
+    return crawler.MinwonRecord(base)
+
+
+@pytest.mark.parametrize("spec, expected", [("0/1", (0, 1)), ("3/4", (3, 4)), (" 1 / 2 ", (1, 2))])
+def test_parse_shard(spec, expected):
+    assert shard.parse_shard(spec) == expected
+
+
+@pytest.mark.parametrize("spec", ["4/4", "-1/4", "0/0", "a/b", "1", None])
+def test_parse_shard_rejects_invalid(spec):
+    with pytest.raises(ValueError):
+        shard.parse_shard(spec)
+
+
+def test_shard_key_falls_back_to_link_then_name():
+    assert shard.shard_key({"서비스ID": " SVC1 ", "링크": "/a"}) == "SVC1"
+    link_key = shard.shard_key({"링크": "/mw/view.do?b=2&a=1"})
+    assert link_key == crawler.canonical_url("/mw/view.do?a=1&b=2")
+    assert shard.shard_key({"민원명": "주민등록표 등본"}) == "주민등록표 등본"
+
+
+def test_shard_assignment_is_stable_and_partitions_all():
+    records = [minwon(index) for index in range(200)]
+    # 프로세스 해시 시드와 무관한 CRC32 기준
+    assert shard.shard_of(records[0], 4) == zlib.crc32(b"SVC0000") % 4
+    selected = [shard.filter_shard(records, index, 4) for index in range(4)]
+    assert sorted(m["서비스ID"] for part in selected for m in part) == sorted(m["서비스ID"] for m in records)
+    assert all(part for part in selected)
+    assert shard.filter_shard(records, 0, 1) == records
+
+
+def test_find_shard_results(tmp_path):
+    assert shard.shard_filename(shard.RESULT_FILE, 2, 4) == "정부24_민원목록_shard2of4.csv"
+    shard_dir = tmp_path / "out0"
+    shard_dir.mkdir()
+    for index in (1, 0):
+        (shard_dir / shard.shard_filename(shard.RESULT_FILE, index, 2)).write_text("", encoding="utf-8")
+    (shard_dir / shard.shard_filename(shard.ERROR_FILE, 0, 2)).write_text("", encoding="utf-8")
+    plain_dir = tmp_path / "plain"
+    plain_dir.mkdir()
+    (plain_dir / shard.RESULT_FILE).write_text("", encoding="utf-8")
+
+    found = shard.find_shard_results([str(shard_dir), str(plain_dir), str(tmp_path / "missing")])
+    names = [path.rsplit("/", 2)[-2:] for path in found]
+    assert names == [
+        ["out0", "정부24_민원목록_shard0of2.csv"],
+        ["out0", "정부24_민원목록_shard1of2.csv"],
+        ["plain", "정부24_민원목록.csv"],
+    ]
+
+
+@pytest.mark.parametrize("memory_limit", [0, 3])
+def test_merge_deduplicates_across_shards(tmp_path, memory_limit):
+    records = [minwon(index) for index in range(10)]
+    # 같은 민원명/담당부서가 다른 샤드에 한 번 더 수집된 경우
+    duplicate = minwon(3, 일련번호="103", 링크="/mw/other.do", 설명="더 자세한 설명")
+    failed = minwon(7, 오류여부="필수정보 누락")
+    records[7] = failed
+    for index in range(2):
+        part = [m for m in records if shard.shard_of(m, 2) == index]
+        if index != shard.shard_of(records[3], 2):
+            part.append(duplicate)
+        crawler.save_to_csv(part, shard.shard_filename(shard.RESULT_FILE, index, 2), str(tmp_path / f"shard{index}"))
+
+    result_path = shard.merge_shard_results(
+        [str(tmp_path / "shard0"), str(tmp_path / "shard1")], str(tmp_path / "merged"),
+        keyword_top_k=0, dedup_memory_limit=memory_limit,
+    )
+    merged = crawler.load_from_csv(result_path)
+    assert sorted(m["민원명"] for m in merged) == sorted(m["민원명"] for m in records)
+    (combined,) = [m for m in merged if m["민원명"] == "민원 3"]
+    assert set(combined["일련번호"].split(", ")) == {"3", "103"}
+    assert combined["설명"] == "더 자세한 설명"
+    # 먼저 읽힌 샤드의 항목이 남고 다른 쪽 링크는 연관민원으로
+    assert {combined["링크"], combined["연관민원"].lstrip(" |")} == {records[3]["링크"], "/mw/other.do"}
+
+    errors = crawler.load_from_csv(str(tmp_path / "merged" / shard.ERROR_FILE))
+    assert [m["민원명"] for m in errors] == ["민원 7"]
+
+
+def test_merge_without_results_returns_none(tmp_path):
+    assert shard.merge_shard_results([str(tmp_path / "missing")], str(tmp_path / "out")) is None
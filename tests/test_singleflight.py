@@ -0,0 +1,72 @@
+"""동시 요청 병합 - 같은 키의 동시 작업은 한 번만 실행하고 결과/예외 공유"""
+import threading
+import time
+
+import pytest
+
+from hanolcare_crawler.singleflight import SingleFlight
+
+
+def run_concurrently(count, target):
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        try:
+            results[i] = target(i)
+        except Exception as e:
+            results[i] = e
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.1)
+        return "page"
+
+    results = run_concurrently(8, lambda i: flight.do("https://www.gov.kr/a", fetch))
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * 7
+    assert {result for result, _ in results} == {"page"}
+    assert (flight.executed, flight.coalesced, flight.in_flight()) == (1, 7, 0)
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    results = run_concurrently(4, lambda i: flight.do(i % 2, lambda: time.sleep(0.05) or i % 2))
+    assert sorted(result for result, _ in results) == [0, 0, 1, 1]
+    assert flight.executed == 2
+
+
+def test_error_is_shared_and_key_released():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    results = run_concurrently(3, lambda i: flight.do("k", fail))
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.in_flight() == 0
+    # 끝난 작업은 캐시되지 않음 - 다음 호출은 다시 실행
+    assert flight.do("k", lambda: "again") == ("again", False)
+
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    assert flight.do("k", lambda: 1) == (1, False)
+    assert flight.do("k", lambda: 2) == (2, False)
+    assert flight.coalesced == 0
+
+    with pytest.raises(KeyError):
+        flight.do("k", lambda: {}["missing"])
@@ -0,0 +1,188 @@
+"""SpillDeduplicator - 디스크로 나눠 병합해도 메모리 병합과 같은 결과와 순서, 한도를 넘는 저장의 최대 메모리"""
+import argparse
+import os
+import tracemalloc
+
+import pytest
+
+from hanolcare_crawler import crawler, shard, spill
+from hanolcare_crawler.compress import CsvJournal
+from hanolcare_crawler.crawler import MinwonRecord
+
+
+def make_records(count=200, keys=37):
+    records = []
+    for i in range(count):
+        records.append(MinwonRecord({
+            "민원명": f"민원 {(i * 7) % keys}",
+            "담당부서": "민원과" if i % 3 else "",
+            "일련번호": str(i),
+            "링크": f"https://www.gov.kr/portal/service/serviceInfo/S{i}",
+            "설명": "설명" * (i % 5),
+            "처리절차": "" if i % 4 else f"절차 {i}",
+        }))
+    return records
+
+
+def in_memory(records):
+    return crawler.filter_duplicate_minwons([r.copy() for r in records], max_in_memory=0)
+
+
+def comparable(records):
+    # merge_minwon은 일련번호를 set으로 합치므로 순서와 무관하게 비교
+    return [
+        {**r.to_dict(), "일련번호": sorted(r.get("일련번호", "").split(", "))}
+        for r in records
+    ]
+
+
+@pytest.mark.parametrize("max_in_memory,partitions", [(1, 2), (5, 3), (16, 16), (1000, 16)])
+def test_spill_matches_in_memory(tmp_path, max_in_memory, partitions):
+    records = make_records()
+    expected = in_memory(records)
+    with spill.SpillDeduplicator(crawler.minwon_dedup_key, crawler.merge_minwon, max_in_memory,
+                                 partitions=partitions, tmp_dir=str(tmp_path)) as deduplicator:
+        deduplicator.extend(r.copy() for r in records)
+        actual = list(deduplicator)
+    assert comparable(actual) == comparable(expected)
+    assert deduplicator.unique == len(expected)
+    assert deduplicator.total == len(records)
+    # 임시 파일 정리
+    assert os.listdir(tmp_path) == []
+
+
+def test_filter_duplicate_minwons_spill_path_matches():
+    records = make_records(120, 11)
+    expected = in_memory(records)
+    actual = crawler.filter_duplicate_minwons([r.copy() for r in records], max_in_memory=7)
+    assert comparable(actual) == comparable(expected)
+
+
+def test_deep_split_with_single_key(tmp_path):
+    # 같은 키만 있어 다시 나눠도 줄지 않는 분할
+    records = [{"k": "same", "v": i} for i in range(50)]
+    merge = lambda existing, record: {"k": existing["k"], "v": existing["v"] + record["v"]}
+    with spill.SpillDeduplicator(lambda r: r["k"], merge, max_in_memory=3, tmp_dir=str(tmp_path)) as deduplicator:
+        deduplicator.extend(records)
+        assert list(deduplicator) == [{"k": "same", "v": sum(range(50))}]
+
+
+def test_single_pass_only():
+    deduplicator = spill.SpillDeduplicator(lambda r: r, lambda a, b: a)
+    deduplicator.add(1)
+    assert list(deduplicator) == [1]
+    with pytest.raises(RuntimeError):
+        list(deduplicator)
+    with pytest.raises(RuntimeError):
+        deduplicator.add(2)
+
+
+def large_records(count, start=0):
+    """설명이 긴 민원 (절반은 앞쪽 민원과 중복, 10개 중 하나는 오류 항목)"""
+    for i in range(start, start + count):
+        yield MinwonRecord({
+            "민원명": f"민원 {i % (count // 2)}",
+            "담당부서": "민원과",
+            "일련번호": str(i),
+            "링크": f"https://www.gov.kr/portal/service/serviceInfo/S{i}",
+            "설명": f"{i} 번째 민원 안내 " * 150,
+            "오류여부": "필수정보 누락" if i % 10 == 0 else "정상",
+        })
+
+
+def write_journal(path, records, batch=500):
+    journal = CsvJournal(path, crawler.CSV_FIELDNAMES)
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == batch:
+            journal.append(chunk)
+            chunk = []
+    journal.append(chunk)
+    journal.close()
+    return journal.path
+
+
+def traced_peak(fn, *args, **kwargs):
+    tracemalloc.start()
+    try:
+        result = fn(*args, **kwargs)
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_streamed_results_above_limit_keep_peak_memory_bounded(tmp_path):
+    journal_path = write_journal(str(tmp_path / "journal.csv"), large_records(2000))
+
+    def in_memory_save():
+        unique = crawler.filter_duplicate_minwons(list(crawler.iter_from_csv(journal_path)), max_in_memory=0)
+        crawler.save_to_csv(unique, "all.csv", str(tmp_path / "memory"))
+        return unique
+
+    def streamed_save():
+        rows = crawler.iter_from_csv(journal_path)
+        deduplicator = crawler.spill_deduplicator(rows, 100)
+        assert deduplicator.spilled
+        return crawler.save_streamed_results(
+            crawler.iter_unique_minwons(deduplicator), "all.csv", "errors.csv", str(tmp_path / "streamed")
+        )
+
+    expected, memory_peak = traced_peak(in_memory_save)
+    (result_path, error_path, total, errors), streamed_peak = traced_peak(streamed_save)
+
+    assert total == len(expected) == 1000
+    assert comparable(crawler.load_from_csv(result_path)) == comparable(crawler.load_from_csv(str(tmp_path / "memory" / "all.csv")))
+    assert errors == sum(1 for m in expected if m["오류여부"] != "정상") > 0
+    assert len(crawler.load_from_csv(error_path)) == errors
+    # 전체 레코드가 아니라 한도(100개) 근처만 메모리에 올라감
+    assert streamed_peak < memory_peak / 5
+
+
+def test_merge_above_limit_streams_and_skips_corpus_passes(tmp_path):
+    for index in range(2):
+        crawler.save_to_csv(large_records(1000, start=index * 1000), shard.shard_filename(shard.RESULT_FILE, index, 2),
+                            str(tmp_path / f"shard{index}"))
+    shard_dirs = [str(tmp_path / "shard0"), str(tmp_path / "shard1")]
+
+    memory_path, memory_peak = traced_peak(
+        shard.merge_shard_results, shard_dirs, str(tmp_path / "memory"), keyword_top_k=0, dedup_memory_limit=0
+    )
+    streamed_path, streamed_peak = traced_peak(
+        shard.merge_shard_results, shard_dirs, str(tmp_path / "streamed"), near_dup_threshold=0.9,
+        keyword_top_k=10, dedup_memory_limit=100,
+    )
+
+    streamed = crawler.load_from_csv(streamed_path)
+    assert comparable(streamed) == comparable(crawler.load_from_csv(memory_path))
+    # 한도를 넘으면 키워드 추출은 건너뜀
+    assert not any(m["키워드"] for m in streamed)
+    assert os.path.exists(str(tmp_path / "streamed" / shard.ERROR_FILE))
+    assert streamed_peak < memory_peak / 3
+
+
+def test_crawl_above_limit_writes_results_from_journal(tmp_path, monkeypatch):
+    from hanolcare_crawler.mock_server import MockGovServer
+
+    monkeypatch.setattr(crawler, "BASE_URL", crawler.BASE_URL)
+
+    def crawl(server, limit):
+        output_dir = str(tmp_path / f"limit{limit}")
+        args = argparse.Namespace(
+            output=output_dir, test=False, workers=2, page=0, nlp=False, base_url=server.base_url,
+            keywords=0, near_dup_threshold=0.0, dedup_memory_limit=limit,
+        )
+        crawler.run_crawler_with_args(args)
+        records = crawler.load_from_csv(os.path.join(output_dir, shard.RESULT_FILE))
+        # 병렬 처리 완료 순서와 병합 순서는 실행마다 다르므로 정렬해 비교
+        return sorted(
+            ({**r.to_dict(), **{f: sorted(r[f].split(", ")) for f in ("일련번호", "카테고리")}} for r in records),
+            key=lambda r: (r["서비스ID"], r["민원명"]),
+        )
+
+    with MockGovServer(scale=1) as server:
+        in_memory_records = crawl(server, 0)
+        streamed_records = crawl(server, 5)
+    assert streamed_records == in_memory_records
+    assert os.path.exists(str(tmp_path / "limit5" / "정부24_민원_진행상황.csv"))
+
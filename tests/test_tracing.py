@@ -0,0 +1,66 @@
+"""파이프라인 구간 기록 - 기록하지 않을 때 무동작, Chrome trace 파일 형식, 스레드 메타데이터"""
+import json
+import threading
+import time
+
+import pytest
+
+from hanolcare_crawler import tracing
+
+
+@pytest.fixture(autouse=True)
+def no_recorder():
+    tracing.stop_tracing()
+    yield
+    tracing._recorder = None
+
+
+def test_span_without_recorder_is_noop(tmp_path):
+    assert not tracing.is_tracing()
+    with tracing.span("batch", index=1):
+        pass
+    tracing.record("parse", time.perf_counter(), 0.1)
+    tracing.instant("retry")
+    assert tracing.stop_tracing() is None
+
+
+def test_trace_file_contains_spans_instants_and_thread_names(tmp_path):
+    path = str(tmp_path / "traces" / "run.json")
+    tracing.start_tracing(path)
+    assert tracing.is_tracing()
+
+    with tracing.span("minwon", service_id="A1"):
+        time.sleep(0.002)
+    start = time.perf_counter()
+    tracing.record("parse", start, 0.25, method="bs4")
+    tracing.instant("retry", stage="detail_fetch")
+    with pytest.raises(ValueError):
+        with tracing.span("failing"):
+            raise ValueError
+
+    worker = threading.Thread(target=lambda: tracing.record("extract", time.perf_counter(), 0.01), name="worker-1")
+    worker.start()
+    worker.join()
+
+    assert tracing.stop_tracing() == path
+    assert not tracing.is_tracing()
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    assert document["displayTimeUnit"] == "ms"
+    events = document["traceEvents"]
+    by_name = {event["name"]: event for event in events if event["ph"] != "M"}
+
+    minwon = by_name["minwon"]
+    assert minwon["ph"] == "X" and minwon["cat"] == "pipeline"
+    assert minwon["args"] == {"service_id": "A1"}
+    assert minwon["dur"] >= 2000  # 마이크로초
+    assert by_name["parse"]["dur"] == pytest.approx(250000)
+    assert by_name["parse"]["cat"] == "stage"
+    assert by_name["retry"]["ph"] == "i" and by_name["retry"]["args"] == {"stage": "detail_fetch"}
+    assert "args" not in by_name["failing"]  # 예외가 나도 구간은 기록
+
+    thread_names = {event["tid"]: event["args"]["name"] for event in events if event["ph"] == "M"}
+    assert thread_names[by_name["extract"]["tid"]] == "worker-1"
+    assert thread_names[minwon["tid"]] == threading.current_thread().name
+    # 스레드마다 메타데이터는 한 번만
+    assert len(thread_names) == sum(1 for event in events if event["ph"] == "M")
@@ -0,0 +1,155 @@
+"""HTTP 전송 계층 - 백엔드별 응답/오류 처리, 연결 재사용 계측, 공유 전송 객체와 스레드 풀"""
+import http.server
+import socket
+import threading
+
+import pytest
+
+from hanolcare_crawler import metrics, transport
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        if self.path == "/moved":
+            self.send_response(302)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path == "/busy":
+            body = "잠시 후 다시 시도".encode("utf-8")
+            self.send_response(503)
+            self.send_header("Retry-After", "7")
+        elif self.path == "/euc-kr":
+            body = "민원 안내".encode("euc-kr")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=EUC-KR")
+        else:
+            body = f"민원 목록 {self.path}".encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = metrics.MetricsRegistry()
+    monkeypatch.setattr(metrics, "registry", registry)
+    return registry
+
+
+def backend_params():
+    return [
+        "requests",
+        "urllib3",
+        pytest.param("httpx", marks=pytest.mark.skipif(not transport.HTTPX_AVAILABLE, reason="httpx 없음")),
+    ]
+
+
+@pytest.fixture(params=backend_params())
+def client(request):
+    client = transport.create_transport(request.param, pool_size=2)
+    yield client
+    client.close()
+
+
+def counter(registry, name):
+    return sum(value for _, value in registry.counters(name))
+
+
+def test_get_decodes_body_and_follows_redirects(server, client):
+    response = client.get(f"{server}/page")
+    assert response.status_code == 200
+    assert response.text == "민원 목록 /page"
+    assert response.headers["content-type"].startswith("text/html")
+    response.raise_for_status()
+
+    assert client.get(f"{server}/euc-kr").text == "민원 안내"
+
+    redirected = client.get(f"{server}/moved")
+    assert redirected.status_code == 200
+    assert redirected.url.endswith("/page")
+
+
+def test_error_status_and_connection_failure(server, client):
+    response = client.get(f"{server}/busy")
+    assert response.status_code == 503
+    with pytest.raises(transport.HTTPStatusError) as excinfo:
+        response.raise_for_status()
+    assert excinfo.value.response.headers["Retry-After"] == "7"
+    assert isinstance(excinfo.value, transport.TransportError)
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        closed_port = sock.getsockname()[1]
+    with pytest.raises(transport.TransportError):
+        client.get(f"http://127.0.0.1:{closed_port}/", timeout=2)
+
+
+def test_keep_alive_connections_are_reused(server, client, registry):
+    for index in range(5):
+        assert client.get(f"{server}/page{index}").status_code == 200
+    assert counter(registry, "hanolcare_http_requests_total") == 5
+    assert counter(registry, "hanolcare_http_connections_total") == 1
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        transport.create_transport("curl")
+    with pytest.raises(ValueError):
+        transport.set_backend("curl")
+
+
+def test_shared_transport_is_rebuilt_only_on_change(server, monkeypatch):
+    monkeypatch.setattr(transport, "_transport", None)
+    monkeypatch.setattr(transport, "_backend", "requests")
+    monkeypatch.setattr(transport, "_pool_size", transport.DEFAULT_POOL_SIZE)
+    try:
+        shared = transport.get_transport()
+        assert transport.get_transport() is shared
+        assert transport.get(f"{server}/shared").text == "민원 목록 /shared"
+        transport.configure_pool(transport.DEFAULT_POOL_SIZE)
+        assert transport.get_transport() is shared
+
+        transport.configure_pool(4)
+        rebuilt = transport.get_transport()
+        assert rebuilt is not shared
+
+        assert transport.set_backend("urllib3") == "urllib3"
+        assert isinstance(transport.get_transport(), transport.Urllib3Transport)
+    finally:
+        transport.close_transport()
+    assert transport._transport is None
+
+
+def test_executor_is_kept_until_worker_count_changes(monkeypatch):
+    monkeypatch.setattr(transport, "_executor", None)
+    monkeypatch.setattr(transport, "_executor_workers", 0)
+    try:
+        executor = transport.get_executor(2)
+        assert transport.get_executor(2) is executor
+        assert executor.submit(threading.current_thread).result().name.startswith("crawler-worker")
+        resized = transport.get_executor(3)
+        assert resized is not executor
+        with pytest.raises(RuntimeError):
+            executor.submit(int)  # 이전 풀은 종료됨
+    finally:
+        transport.shutdown_executor()
+    assert transport._executor is None
@@ -0,0 +1,139 @@
+"""유효성 검증 - 워커 풀의 분석 결과를 기다리지 않고 판단, 결과 반영 때 다시 검증"""
+import concurrent.futures
+import threading
+
+import pytest
+
+from hanolcare_crawler import crawler
+from hanolcare_crawler.crawler import MinwonRecord
+
+
+class GatedPool:
+    """release()를 부르기 전에는 결과를 돌려주지 않는 텍스트 분석 워커 풀 대역"""
+
+    korean_available = True
+    available = True
+
+    def __init__(self, updates):
+        self.updates = updates
+        self.calls = []
+        self.gate = threading.Event()
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    def submit(self, fields, tasks):
+        self.calls.append(tuple(tasks))
+
+        def work():
+            self.gate.wait(5)
+            result = self.updates.get(tuple(tasks), {})
+            if isinstance(result, Exception):
+                raise result
+            return dict(result)
+        return self._executor.submit(work)
+
+    def release(self):
+        self.gate.set()
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(crawler, "NLP_ENABLED", True)
+
+    def install(updates):
+        fake = GatedPool(updates)
+        monkeypatch.setattr(crawler, "nlp_pool", fake)
+        return fake
+    yield install
+    gate = getattr(crawler.nlp_pool, "gate", None)
+    if gate is not None:
+        gate.set()
+
+
+def record(**fields):
+    base = {"민원명": "", "설명": "주민등록표 등본 발급 안내", "처리절차": "신청 후 교부", "신청방법": "방문, 인터넷", "오류여부": "정상"}
+    base.update(fields)
+    return MinwonRecord(base)
+
+
+def test_title_generation_does_not_block_validation(pool):
+    fake = pool({("title",): {"민원명": "주민등록 등본 관련 민원"}})
+    data = record()
+    # 결과가 나오기 전에 판단 (워커 풀을 기다리지 않음)
+    assert crawler.validate_minwon_data(data) is True
+    assert fake.calls == [("title",)]
+    assert data["민원명"] == ""
+
+    fake.release()
+    crawler.resolve_nlp_pending([data])
+    assert data["민원명"] == "주민등록 등본 관련 민원"
+    assert data["오류여부"] == "정상"
+    assert crawler.NLP_PENDING_KEY not in data
+
+
+def test_empty_title_result_marks_record_on_resolve(pool):
+    fake = pool({})
+    data = record()
+    assert crawler.validate_minwon_data(data) is True
+    fake.release()
+    crawler.resolve_nlp_pending([data])
+    assert data["민원명"] == ""
+    assert data["오류여부"] == "필수정보 누락"
+
+
+def test_other_missing_fields_still_fail_without_waiting(pool):
+    fake = pool({("title",): {"민원명": "주민등록 등본 관련 민원"}})
+    data = record(처리절차="")
+    assert crawler.validate_minwon_data(data) is False
+    assert fake.calls == [("title",)]
+
+
+def test_describe_result_is_revalidated(pool):
+    fake = pool({("describe",): {"설명": "기초연금 신청에 관한 민원 서비스입니다."}})
+    data = record(민원명="기초연금 신청", 설명="기초연금 신청")
+    assert crawler.validate_minwon_data(data) is True
+    fake.release()
+    crawler.resolve_nlp_pending([data])
+    assert data["설명"] == "기초연금 신청에 관한 민원 서비스입니다."
+    assert data["오류여부"] == "정상"
+
+    fake = pool({})
+    data = record(민원명="기초연금 신청", 설명="기초연금 신청")
+    assert crawler.validate_minwon_data(data) is True
+    fake.release()
+    crawler.resolve_nlp_pending([data])
+    assert data["오류여부"] == "필수정보 누락"
+
+
+def test_pool_error_counts_as_no_result(pool):
+    fake = pool({("title",): RuntimeError("worker died")})
+    data = record()
+    assert crawler.validate_minwon_data(data) is True
+    fake.release()
+    crawler.resolve_nlp_pending([data])
+    assert data["오류여부"] == "필수정보 누락"
+
+
+def test_enhance_only_records_are_not_revalidated(pool):
+    fake = pool({("enhance",): {}})
+    data = record(민원명="", 설명="")
+    crawler.submit_nlp(data, ["enhance"])
+    fake.release()
+    crawler.resolve_nlp_pending([data])
+    assert data["오류여부"] == "정상"
+
+
+def test_without_pool_validation_runs_analysis_inline(monkeypatch):
+    monkeypatch.setattr(crawler, "NLP_ENABLED", True)
+    monkeypatch.setattr(crawler, "nlp_pool", None)
+    monkeypatch.setattr(crawler, "nlp_backend_available", lambda korean=False: True)
+    monkeypatch.setattr(crawler, "nlp_enrich", lambda fields, tasks: {"민원명": "생성된 민원명"} if "title" in tasks else {})
+    data = record()
+    assert crawler.validate_minwon_data(data) is True
+    assert data["민원명"] == "생성된 민원명"
+    assert crawler.NLP_PENDING_KEY not in data
+
+
+def test_page_keywords_are_merged(monkeypatch):
+    monkeypatch.setattr(crawler, "NLP_ENABLED", True)
+    monkeypatch.setattr(crawler, "analyze_text", lambda text: (["주민등록", "등본"], 50))
+    assert crawler.nlp_enrich({"본문": "주민등록 등본 발급"}, ["keywords"]) == {"키워드": "주민등록, 등본"}
@@ -0,0 +1,75 @@
+"""SQLite 작업 큐 - lease 만료, ack/nack, 최대 시도"""
+import time
+
+import pytest
+
+from hanolcare_crawler import workqueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    q = workqueue.WorkQueue(str(tmp_path / "queue.db"), visibility_timeout=0.2, max_attempts=2)
+    yield q
+    q.close()
+
+
+def test_put_many_ignores_existing_keys(queue):
+    assert queue.put_many([("a", {"n": 1}), ("b", {"n": 2})]) == 2
+    assert queue.put_many([("a", {"n": 99}), ("c", {"n": 3})]) == 1
+    assert queue.counts() == {"pending": 3}
+
+
+def test_lease_hides_items_until_expiry(queue):
+    queue.put_many([("a", {"n": 1}), ("b", {"n": 2})])
+    assert queue.lease("w1", limit=1) == [("a", {"n": 1})]
+    assert queue.lease("w2", limit=5) == [("b", {"n": 2})]
+    assert queue.lease("w3") == []
+    assert queue.next_lease_expiry() is not None
+
+    time.sleep(0.25)
+    # 만료된 lease는 다른 워커가 다시 가져감
+    assert sorted(key for key, _ in queue.lease("w3", limit=5)) == ["a", "b"]
+
+
+def test_extend_keeps_lease(queue):
+    queue.put_many([("a", {})])
+    queue.lease("w1")
+    time.sleep(0.15)
+    assert queue.extend("a", "w1")
+    assert not queue.extend("a", "other")
+    time.sleep(0.1)
+    assert queue.lease("w2") == []
+
+
+def test_ack_stores_result_once(queue):
+    queue.put_many([("a", {"n": 1})])
+    queue.lease("w1")
+    time.sleep(0.25)
+    queue.lease("w2")
+    # lease가 만료된 뒤라도 먼저 끝낸 워커의 결과를 저장
+    assert queue.ack("a", "w1", {"결과": "w1"})
+    assert not queue.ack("a", "w2", {"결과": "w2"})
+    assert queue.counts() == {"done": 1}
+    assert queue.results() == [{"결과": "w1"}]
+    assert queue.lease("w3") == []
+
+
+def test_nack_requeues_until_max_attempts(queue):
+    queue.put_many([("a", {"n": 1}), ("b", {"n": 2})])
+    assert queue.lease("w1") == [("a", {"n": 1})]
+    assert queue.nack("a", "w1")
+    # 우선순위가 낮아져 새 작업 뒤로
+    assert [key for key, _ in queue.lease("w1", limit=2)] == ["b", "a"]
+    assert queue.nack("a", "w1", {"오류여부": "실패"})
+    assert queue.counts() == {"failed": 1, "leased": 1}
+    assert queue.results() == [{"오류여부": "실패"}]
+    assert not queue.nack("a", "not-owner")
+
+
+def test_results_in_enqueue_order(queue):
+    queue.put_many([("b", {})])
+    time.sleep(0.01)
+    queue.put_many([("a", {})])
+    for key, _ in reversed(queue.lease("w", limit=2)):
+        queue.ack(key, "w", {"key": key})
+    assert queue.results() == [{"key": "b"}, {"key": "a"}]